@@ -0,0 +1,92 @@
+"""
+Benchmark Addict construction: time and memory of Addict vs LazyAddict of a large JSON payload,
+and reading a few paths of it. Layered tenant configs: `Addict | overlay` vs `FrozenAddict.merge`.
+
+    python benchmark/bench_addict.py [records] [tenants]
+"""
+import gc
+import json
+import sys
+import time
+import tracemalloc
+
+from dacutil.addict import Addict, LazyAddict
+
+
+def payload(records: int) -> dict:
+    return {
+        "service": {"name": "api", "db": {"host": "db.local", "port": 5432}},
+        "records": {
+            f"r{i}": {"id": i, "name": f"name {i}", "tags": ["a", "b"], "attrs": {"x": i, "y": [{"z": i}]}}
+            for i in range(records)
+        },
+    }
+
+
+def measure(func, repeat: int = 3) -> tuple[float, int]:
+    # as timeit: no collection of the garbage of the other cases while timing
+    gc.collect()
+    gc.disable()
+    best = float("inf")
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+    finally:
+        gc.enable()
+    tracemalloc.start()
+    result = func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del result
+    return best, peak
+
+
+def overlays(tenants: int):
+    base = Addict({f"section{s}": {f"key{k}": {"value": k, "enabled": True} for k in range(50)} for s in range(200)})
+    env = {"section0": {"key0": {"value": -1}}}
+    layers = [{f"section{t % 200}": {f"key{t % 50}": {"value": t}}, "tenant": {"name": f"t{t}"}} for t in range(tenants)]
+
+    def merge():
+        return [base | env | layer for layer in layers]
+
+    snapshot = base.snapshot()
+
+    def merge_shared():
+        return [snapshot.merge(env, layer) for layer in layers]
+
+    print(f"tenants: {tenants:,} over a base of {len(base) * 50:,} keys")
+    for name, func in [("Addict | overlay", merge), ("FrozenAddict.merge", merge_shared)]:
+        seconds, peak = measure(func)
+        print(f"{name:<34} {seconds * 1000:>8.1f}ms {peak / 2**20:>8.1f}MB")
+
+
+def main(records: int = 20_000, tenants: int = 20):
+    text = json.dumps(payload(records))
+    data = json.loads(text)
+    print(f"records: {records:,} ({text.count('{') + text.count('['):,} containers)")
+    print(f"{'case':<34} {'time':>10} {'memory':>10}")
+    for name, cls in [("Addict", Addict), ("LazyAddict", LazyAddict)]:
+        seconds, peak = measure(lambda: cls(data))
+        print(f"{name + ' construction':<34} {seconds * 1000:>8.1f}ms {peak / 2**20:>8.1f}MB")
+
+        def read():
+            config = cls(data)
+            return config.service.db.host, config.records.r1.attrs.y[0].z, config.get("records.r2.name")
+
+        seconds, peak = measure(read)
+        print(f"{name + ' construction + 3 reads':<34} {seconds * 1000:>8.1f}ms {peak / 2**20:>8.1f}MB")
+
+    def setitem():
+        config = Addict()
+        for i in range(200_000):
+            config[i] = i
+
+    seconds, _ = measure(setitem)
+    print(f"{'Addict 200k __setitem__':<34} {seconds * 1000:>8.1f}ms")
+    overlays(tenants)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,66 @@
+"""
+Benchmark import time and memory of dacutil: each case runs in a fresh interpreter.
+
+    python benchmark/bench_import.py [repeat]
+"""
+import json
+import os
+import subprocess
+import sys
+
+CASES = {
+    "import dacutil": "import dacutil",
+    "get_config": "from dacutil import get_config",
+    "get_config + ini": "from dacutil import get_config; get_config('test/tmp/config.ini')",
+    "pyencrypt": "from dacutil import pyencrypt",
+    "worker": "from dacutil import worker",
+    "df_strip": "from dacutil import df_strip",
+    "from dacutil import *": "from dacutil import *",
+}
+HEAVY = ["pandas", "pyarrow", "numpy", "requests", "configobj", "yaml", "cryptography", "pyrage", "Crypto"]
+
+PROBE = """
+import resource, sys, time
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+modules = len(sys.modules)
+start = time.perf_counter()
+{statement}
+seconds = time.perf_counter() - start
+print({{
+    "seconds": seconds,
+    "rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss,
+    "modules": len(sys.modules) - modules,
+    "heavy": [m for m in {heavy!r} if m in sys.modules],
+}})
+"""
+
+
+def run(statement: str) -> dict:
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = {**os.environ, "PYTHONPATH": root + os.pathsep + os.environ.get("PYTHONPATH", "")}
+    out = subprocess.run(
+        [sys.executable, "-c", PROBE.format(statement=statement, heavy=HEAVY)],
+        cwd=root,
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1].replace("'", '"'))
+
+
+def main(repeat: int = 5):
+    # warm the bytecode cache, the first run compiles the sources
+    run("from dacutil import *")
+    print(f"{'case':<24} {'time':>9} {'rss':>9} {'modules':>8}  heavy dependencies")
+    for name, statement in CASES.items():
+        results = [run(statement) for _ in range(repeat)]
+        best = min(results, key=lambda r: r["seconds"])
+        print(
+            f"{name:<24} {best['seconds'] * 1000:>7.1f}ms {best['rss_kb'] / 1024:>7.1f}MB {best['modules']:>8}  "
+            f"{', '.join(best['heavy']) or '-'}"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
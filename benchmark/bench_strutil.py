@@ -0,0 +1,49 @@
+"""
+Benchmark strutil functions: pandas `.str` accessor vs Arrow kernels.
+
+    python benchmark/bench_strutil.py [rows]
+"""
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from dacutil import df_fixchar, df_replace, df_strip
+
+VALUES = ["  hello world ", "ab\tc", "x\r\ny\x00", "normal text value", None, "  กรุงเทพมหานคร "]
+
+
+def timeit(func, *args, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(rows: int = 1_000_000):
+    rng = np.random.default_rng(0)
+    values = [VALUES[i] for i in rng.integers(0, len(VALUES), rows)]
+    df_python = pd.DataFrame({"a": pd.Series(values, dtype=pd.StringDtype("python"))})
+    df_arrow = pd.DataFrame({"a": pd.Series(values, dtype=pd.ArrowDtype(pa.string()))})
+    table = pa.table({"a": pa.array(values, type=pa.string())})
+
+    cases = {
+        "df_strip": lambda df: df_strip(df.copy() if isinstance(df, pd.DataFrame) else df),
+        "df_replace": lambda df: df_replace(df.copy() if isinstance(df, pd.DataFrame) else df, r"[\r\n]", " "),
+        "df_fixchar": lambda df: df_fixchar(df.copy() if isinstance(df, pd.DataFrame) else df),
+    }
+    print(f"rows: {rows:,}")
+    print(f"{'function':<12} {'pandas str':>12} {'ArrowDtype':>12} {'pa.Table':>12} {'speedup':>8}")
+    for name, func in cases.items():
+        t_python = timeit(func, df_python)
+        t_arrow = timeit(func, df_arrow)
+        t_table = timeit(func, table)
+        print(f"{name:<12} {t_python:>11.3f}s {t_arrow:>11.3f}s {t_table:>11.3f}s {t_python / t_table:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -1,24 +1,119 @@
-from dacutil.dateutil import datediff
-from dacutil.thai_mod11 import check_mod11, verify_thaicid
-from dacutil.config import get_config, Addict
-from dacutil.strutil import df_strip, df_remove_char_error, df_replace, df_fixchar
-from dacutil.worker import worker
-from dacutil.addict import Addict
-from dacutil import crypt
-from dacutil.pyencryption import pyencrypt, pydecrypt
+import importlib
+from typing import TYPE_CHECKING
 
 __version__ = "0.4.4"
 
+# submodules (and their pandas / pyarrow / requests / crypto dependencies) are imported
+# on the first access of a name, `import dacutil` itself imports nothing heavy
+_LAZY_NAMES = {
+    "Addict": "dacutil.addict",
+    "LazyAddict": "dacutil.addict",
+    "FrozenAddict": "dacutil.addict",
+    "PathAccessor": "dacutil.addict",
+    "SharedConfig": "dacutil.addict",
+    "datediff": "dacutil.dateutil",
+    "datediff_units": "dacutil.dateutil",
+    "age_band": "dacutil.dateutil",
+    "parse_thai_date": "dacutil.dateutil",
+    "check_mod11": "dacutil.thai_mod11",
+    "verify_thaicid": "dacutil.thai_mod11",
+    "check_mod11_array": "dacutil.thai_mod11",
+    "verify_thaicid_array": "dacutil.thai_mod11",
+    "cid_to_uint64": "dacutil.thai_mod11",
+    "uint64_to_cid": "dacutil.thai_mod11",
+    "CidIndex": "dacutil.thai_mod11",
+    "get_config": "dacutil.config",
+    "get_configs": "dacutil.config",
+    "ConfigWatcher": "dacutil.config",
+    "ConfigDiskCache": "dacutil.config",
+    "df_strip": "dacutil.strutil",
+    "df_remove_char_error": "dacutil.strutil",
+    "df_replace": "dacutil.strutil",
+    "df_fixchar": "dacutil.strutil",
+    "clean_batches": "dacutil.strutil",
+    "clean_file": "dacutil.strutil",
+    "worker_imap": "dacutil.worker",
+    "worker_imap_unordered": "dacutil.worker",
+    "worker_async": "dacutil.worker",
+    "WorkerStats": "dacutil.worker",
+    "parallel_apply": "dacutil.parallel",
+    "pyencrypt": "dacutil.pyencryption",
+    "pydecrypt": "dacutil.pyencryption",
+}
+_LAZY_MODULES = {"crypt": "dacutil.crypt"}
+
+# the function `worker` shadows its submodule `dacutil.worker` (stdlib only, cheap to import),
+# a lazy name would be replaced by the submodule once another module imports `dacutil.worker`
+from dacutil.worker import worker
+
+if TYPE_CHECKING:
+    from dacutil.dateutil import datediff, datediff_units, age_band, parse_thai_date
+    from dacutil.thai_mod11 import (
+        check_mod11,
+        verify_thaicid,
+        check_mod11_array,
+        verify_thaicid_array,
+        cid_to_uint64,
+        uint64_to_cid,
+        CidIndex,
+    )
+    from dacutil.config import get_config, get_configs, ConfigWatcher, ConfigDiskCache
+    from dacutil.strutil import df_strip, df_remove_char_error, df_replace, df_fixchar, clean_batches, clean_file
+    from dacutil.worker import worker_imap, worker_imap_unordered, worker_async, WorkerStats
+    from dacutil.addict import Addict, LazyAddict, FrozenAddict, PathAccessor, SharedConfig
+    from dacutil.parallel import parallel_apply
+    from dacutil import crypt
+    from dacutil.pyencryption import pyencrypt, pydecrypt
+
+
+def __getattr__(name: str):
+    if name in _LAZY_NAMES:
+        value = getattr(importlib.import_module(_LAZY_NAMES[name]), name)
+    elif name in _LAZY_MODULES:
+        value = importlib.import_module(_LAZY_MODULES[name])
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # cached, the next access does not call __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
 __all__ = [
     "Addict",
+    "LazyAddict",
+    "FrozenAddict",
+    "PathAccessor",
+    "SharedConfig",
     "datediff",
+    "datediff_units",
+    "age_band",
+    "parse_thai_date",
     "check_mod11",
     "verify_thaicid",
+    "check_mod11_array",
+    "verify_thaicid_array",
+    "cid_to_uint64",
+    "uint64_to_cid",
+    "CidIndex",
     "get_config",
+    "get_configs",
+    "ConfigWatcher",
+    "ConfigDiskCache",
     "df_strip",
     "df_replace",
     "df_fixchar",
+    "clean_batches",
+    "clean_file",
     "worker",
+    "worker_imap",
+    "worker_imap_unordered",
+    "worker_async",
+    "WorkerStats",
+    "parallel_apply",
     "crypt",
     "df_remove_char_error",
     "pyencrypt",
@@ -1,4 +1,9 @@
 import copy
+import pickle
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Any, Mapping
 
 
 class Addict(dict):
@@ -28,6 +33,11 @@ class Addict(dict):
             self[name] = value
 
     def __setitem__(self, name, value):
+        state = self.__dict__
+        if not state.get("__frozen") and state.get("__parent") is None:
+            # fast path: not frozen and not a new child of `__missing__` (attached to its parent on the first set)
+            dict.__setitem__(self, name, value)
+            return
         isFrozen = hasattr(self, "__frozen") and object.__getattribute__(self, "__frozen")
         if isFrozen and name not in super(Addict, self).keys():
             raise KeyError(name)
@@ -57,7 +67,8 @@ class Addict(dict):
         if isinstance(item, dict):
             return cls(item)
         elif isinstance(item, (list, tuple)):
-            return type(item)(cls._hook(elem) for elem in item)
+            # the read-only list of a FrozenAddict is copied to a plain list
+            return (list if type(item) is _FrozenList else type(item))(cls._hook(elem) for elem in item)
         return item
 
     def __getattr__(self, item):
@@ -93,6 +104,13 @@ class Addict(dict):
     def copy(self):
         return copy.copy(self)
 
+    def __copy__(self):
+        # shallow, the values are shared
+        new = self.__class__.__new__(self.__class__)
+        new.__dict__.update({"__parent": None, "__key": None, "__frozen": False})
+        dict.update(new, self)
+        return new
+
     def deepcopy(self):
         return copy.deepcopy(self)
 
@@ -116,13 +134,30 @@ class Addict(dict):
             else:
                 self[k].update(v)
 
-    def __getnewargs__(self):
-        return tuple(self.items())
+    def __reduce__(self):
+        # one reduce of the whole tree as plain dicts / lists (pickled by the C pickler),
+        # instead of a reduce and an `update` of each node
+        return (_from_dict, (self.__class__, self.to_dict(), bool(self.__dict__.get("__frozen"))))
 
-    def __getstate__(self):
-        return self
+    @classmethod
+    def _from_plain(cls, data: dict) -> "Addict":
+        # as cls(data) without the __setitem__ of each item, data is a tree of plain dicts / lists
+        node = cls.__new__(cls)
+        node.__dict__.update({"__parent": None, "__key": None, "__frozen": False})
+        hook = cls._plain_hook
+        dict.update(node, {key: hook(val) if isinstance(val, (dict, list, tuple)) else val for key, val in data.items()})
+        return node
+
+    @classmethod
+    def _plain_hook(cls, item):
+        if isinstance(item, dict):
+            return cls._from_plain(item)
+        elif isinstance(item, (list, tuple)):
+            return type(item)(cls._plain_hook(elem) for elem in item)
+        return item
 
     def __setstate__(self, state):
+        # pickles of the previous versions (`__getnewargs__` and the dict as the state)
         self.update(state)
 
     def __or__(self, other):
@@ -158,3 +193,435 @@ class Addict(dict):
 
     def unfreeze(self):
         self.freeze(False)
+
+    def snapshot(self) -> "FrozenAddict":
+        """
+        Returns an immutable, hashable copy of the tree (`FrozenAddict`).
+        """
+        return FrozenAddict(self)
+
+
+class LazyAddict(Addict):
+    """
+    Addict that keeps the nested dicts / lists / tuples of its arguments as they are and wraps one
+    on its first access (cached), instead of converting the whole tree when it is built.
+    For large payloads of which only a few paths are read.
+
+    `items()`, `values()` and the methods built on them (`to_dict`, `freeze`, `copy`, pickle) wrap
+    the values of one level first, `dict(lazy)` returns the values not wrapped yet as plain dicts.
+
+    Example:
+        >>> config = LazyAddict(json.loads(payload))  # no conversion of the nested dicts
+        >>> config.service.db.host  # wraps `service` and `db` only
+    """
+
+    def __init__(__self, *args, **kwargs):
+        object.__setattr__(__self, "__parent", kwargs.pop("__parent", None))
+        object.__setattr__(__self, "__key", kwargs.pop("__key", None))
+        object.__setattr__(__self, "__frozen", False)
+        for arg in args:
+            if not arg:
+                continue
+            elif isinstance(arg, tuple) and (not isinstance(arg[0], tuple)):
+                dict.__setitem__(__self, arg[0], arg[1])
+            else:
+                dict.update(__self, arg)
+        dict.update(__self, kwargs)
+        # keys of the containers not wrapped yet
+        object.__setattr__(
+            __self, "__pending", {key for key, val in dict.items(__self) if isinstance(val, (dict, list, tuple))}
+        )
+
+    def __getitem__(self, name):
+        value = dict.__getitem__(self, name)
+        pending = self.__dict__.get("__pending")
+        if pending and name in pending:
+            pending.discard(name)
+            value = self._hook(value)
+            dict.__setitem__(self, name, value)
+        return value
+
+    def __setitem__(self, name, value):
+        pending = self.__dict__.get("__pending")
+        if pending:
+            pending.discard(name)
+        super().__setitem__(name, value)
+
+    def __delitem__(self, name):
+        pending = self.__dict__.get("__pending")
+        if pending:
+            pending.discard(name)
+        dict.__delitem__(self, name)
+
+    def _wrap_all(self):
+        pending = self.__dict__.get("__pending")
+        while pending:
+            self[next(iter(pending))]
+
+    def items(self):
+        self._wrap_all()
+        return dict.items(self)
+
+    def values(self):
+        self._wrap_all()
+        return dict.values(self)
+
+    def pop(self, key, *default):
+        if key in self:
+            self[key]
+        return dict.pop(self, key, *default)
+
+    def __copy__(self):
+        new = super().__copy__()
+        new.__dict__["__pending"] = set(self.__dict__.get("__pending") or ())
+        return new
+
+    @classmethod
+    def _from_plain(cls, data: dict) -> "LazyAddict":
+        return cls(data)
+
+
+class FrozenAddict(Addict):
+    """
+    Immutable, hashable snapshot of an Addict (`Addict.snapshot()`), safe to share between threads.
+
+    Nested dicts are FrozenAddict and lists are read-only lists (equal to the lists of the source).
+    A flat index of the dotted paths of the tree is built once on the first dotted `get`,
+    `get("a.b.c")` is one dict lookup instead of a split and a walk, `path_index()` returns the index
+    itself for hot loops. Items are read-only, a set / delete / update raises TypeError.
+
+    `merge(*layers)` (and `|`) layers configs with the rules of `Addict.update` without copying the base:
+    only the nodes on the paths of the overridden keys are new, the other subtrees are shared.
+
+    Example:
+        >>> config = get_config("config.yaml").snapshot()
+        >>> config.get("db.host")
+        >>> paths = config.path_index()
+        >>> paths["db.host"], paths["db.port"]
+        >>> host = PathAccessor("db.host")  # reusable, e.g. with the snapshots of a ConfigWatcher
+        >>> host(config)
+    """
+
+    def __init__(self, *args, **kwargs):
+        dict.__init__(self, ((key, _frozen(val)) for key, val in dict(*args, **kwargs).items()))
+        object.__setattr__(self, "_FrozenAddict__index", None)
+        object.__setattr__(self, "_FrozenAddict__hash", None)
+
+    @classmethod
+    def _from_frozen(cls, *items: Mapping) -> "FrozenAddict":
+        # values already frozen, shared as they are
+        new = cls.__new__(cls)
+        for item in items:
+            dict.update(new, item)
+        object.__setattr__(new, "_FrozenAddict__index", None)
+        object.__setattr__(new, "_FrozenAddict__hash", None)
+        return new
+
+    def _build_index(self) -> dict:
+        # the paths `Addict.get` can walk: str keys without a dot
+        index = {}
+        stack = [("", self)]
+        while stack:
+            prefix, node = stack.pop()
+            for key, value in dict.items(node):
+                if type(key) is not str or "." in key:
+                    continue
+                path = prefix + key
+                index[path] = value
+                if type(value) is FrozenAddict:
+                    stack.append((path + ".", value))
+        object.__setattr__(self, "_FrozenAddict__index", index)
+        return index
+
+    def get(self, item):
+        if type(item) is not str:
+            return self[item]
+        index = self.__index
+        if index is None:
+            index = self._build_index()
+        try:
+            return index[item]
+        except KeyError:
+            raise KeyError(item) from None
+
+    def path_index(self) -> Mapping[str, Any]:
+        """
+        Returns:
+            Mapping[str, Any]: Read-only flat index {dotted path: value} of the tree.
+        """
+        index = self.__index
+        return MappingProxyType(index if index is not None else self._build_index())
+
+    def __missing__(self, name):
+        raise KeyError(name)
+
+    def __hash__(self):
+        if self.__hash is None:
+            object.__setattr__(self, "_FrozenAddict__hash", hash(frozenset(dict.items(self))))
+        return self.__hash
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("FrozenAddict is read-only, copy it with `to_dict()` / `Addict(...)` to modify")
+
+    __setitem__ = __delitem__ = __setattr__ = __delattr__ = _readonly
+    update = pop = popitem = clear = setdefault = __ior__ = _readonly
+
+    def freeze(self, shouldFreeze=True):
+        if not shouldFreeze:
+            self._readonly()
+
+    def snapshot(self) -> "FrozenAddict":
+        return self
+
+    def copy(self):
+        return self
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        # flat: the tree as plain dicts / lists, frozen again when loaded
+        return (self.__class__, (self.to_dict(),))
+
+    def share(self) -> "SharedConfig":
+        """
+        Publishes this snapshot into shared memory, see `SharedConfig`.
+        """
+        return SharedConfig.publish(self)
+
+    def merge(self, *layers: Mapping) -> "FrozenAddict":
+        """
+        Merges `layers` over this snapshot in order, same `to_dict()` as `Addict(self) | layer | ...`.
+
+        Structural sharing: a node is copied (shallow) only if a key under it is overridden,
+        the unchanged subtrees are the same objects as in this snapshot.
+
+        Example:
+            >>> base = get_config("base.yaml").snapshot()
+            >>> tenants = {name: base.merge(env, overlay) for name, overlay in overlays.items()}
+        """
+        merged = self
+        for layer in layers:
+            merged = _merge_shared(merged, layer)
+        return merged
+
+    def __or__(self, other):
+        if not isinstance(other, dict):
+            return NotImplemented
+        return self.merge(other)
+
+    def to_dict(self):
+        return {key: _thawed(value) for key, value in dict.items(self)}
+
+
+class _FrozenList(list):
+    """
+    Read-only, hashable list of a FrozenAddict.
+    """
+
+    __slots__ = ()
+
+    def __hash__(self):
+        return hash(tuple(self))
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("list of a FrozenAddict is read-only")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+    append = extend = insert = remove = pop = clear = sort = reverse = _readonly
+
+    def __reduce__(self):
+        return (self.__class__, (list(self),))
+
+
+def _from_dict(cls, data: dict, frozen: bool = False) -> Addict:
+    node = cls._from_plain(data)
+    if frozen:
+        node.freeze()
+    return node
+
+
+def _frozen(item):
+    if type(item) is FrozenAddict or type(item) is _FrozenList:
+        return item
+    if isinstance(item, dict):
+        return FrozenAddict(item)
+    if isinstance(item, list):
+        return _FrozenList(_frozen(elem) for elem in item)
+    if isinstance(item, tuple):
+        return tuple(_frozen(elem) for elem in item)
+    return item
+
+
+def _merge_shared(node: FrozenAddict, layer: Mapping) -> FrozenAddict:
+    # the rules of `Addict.update`: a dict over a dict is merged, anything else replaces
+    changed = {}
+    for key, value in layer.items():
+        current = dict.get(node, key)
+        if type(current) is FrozenAddict and isinstance(value, dict):
+            value = _merge_shared(current, value)
+            if value is current:
+                continue
+        else:
+            value = _frozen(value)
+        changed[key] = value
+    if not changed:
+        return node
+    return FrozenAddict._from_frozen(node, changed)
+
+
+def _thawed(item):
+    if type(item) is FrozenAddict:
+        return item.to_dict()
+    if type(item) is _FrozenList:
+        return [_thawed(elem) for elem in item]
+    if type(item) is tuple:
+        return tuple(_thawed(elem) for elem in item)
+    return item
+
+
+class PathAccessor:
+    """
+    Compiled dotted path, reusable with any snapshot: a lookup in the index of a FrozenAddict
+    (the index of the last snapshot is kept), a walk of the keys of another mapping.
+
+    Example:
+        >>> db_host = PathAccessor("db.host")
+        >>> db_host(watcher.config)
+    """
+
+    __slots__ = ("path", "keys", "_last")
+
+    def __init__(self, path: str):
+        self.path = path
+        self.keys = tuple(path.split("."))
+        # (snapshot, its index) replaced in one assignment, safe between threads
+        self._last: tuple = (None, None)
+
+    def __call__(self, config):
+        last = self._last
+        if last[0] is config:
+            return last[1][self.path]
+        if type(config) is FrozenAddict:
+            index = config.path_index()
+            self._last = (config, index)
+            return index[self.path]
+        for key in self.keys:
+            config = config[key]
+        return config
+
+    def __repr__(self):
+        return f"PathAccessor({self.path!r})"
+
+
+# snapshots of the shared configs loaded in this process, by the name of the shared memory
+# (LRU, the least recently used are evicted, a handle keeps its own snapshot)
+_SHARED_SNAPSHOTS_MAXSIZE = 8
+_shared_snapshots: "OrderedDict[str, FrozenAddict]" = OrderedDict()
+_shared_snapshots_lock = threading.Lock()
+
+
+def _cache_shared_snapshot(name: str, snapshot: "FrozenAddict") -> None:
+    with _shared_snapshots_lock:
+        _shared_snapshots[name] = snapshot
+        _shared_snapshots.move_to_end(name)
+        while len(_shared_snapshots) > _SHARED_SNAPSHOTS_MAXSIZE:
+            _shared_snapshots.popitem(last=False)
+
+
+class SharedConfig:
+    """
+    Handle of a FrozenAddict published once into shared memory (`FrozenAddict.share()`).
+
+    Pass the handle to the tasks of a process pool instead of the config: it pickles as the name
+    of the shared memory block (a few bytes). `config` maps the block read-only and loads the snapshot
+    once per process (cached, the last 8 configs), a forked worker reuses the snapshot of the parent.
+    The publisher owns the block: `unlink()` (or `with`) when the workers are done.
+
+    Before Python 3.13 an attaching process registers the block with its resource tracker:
+    load `config` only in the workers of a pool of the publisher (they share its tracker),
+    another process would unlink the block when it exits.
+
+    Example:
+        >>> with get_config("config.yaml").snapshot().share() as shared:
+        ...     worker(8, task, ({"shared": shared, "row": row} for row in rows), executor="process")
+        >>> def task(shared: SharedConfig, row):
+        ...     config = shared.config  # FrozenAddict, loaded once per process
+    """
+
+    __slots__ = ("name", "size", "_shm", "_snapshot")
+
+    def __init__(self, name: str, size: int):
+        self.name = name
+        self.size = size
+        self._shm = None
+        self._snapshot = None
+
+    @classmethod
+    def publish(cls, config: Mapping) -> "SharedConfig":
+        from multiprocessing.shared_memory import SharedMemory
+
+        snapshot = config if type(config) is FrozenAddict else FrozenAddict(config)
+        data = pickle.dumps(snapshot, protocol=pickle.HIGHEST_PROTOCOL)
+        shm = SharedMemory(create=True, size=max(len(data), 1))
+        shm.buf[: len(data)] = data
+        shared = cls(shm.name, len(data))
+        shared._shm = shm
+        shared._snapshot = snapshot
+        _cache_shared_snapshot(shm.name, snapshot)
+        return shared
+
+    @property
+    def config(self) -> FrozenAddict:
+        if self._snapshot is not None:
+            return self._snapshot
+        with _shared_snapshots_lock:
+            snapshot = _shared_snapshots.get(self.name)
+        if snapshot is None:
+            shm = _attach_shared_memory(self.name)
+            try:
+                snapshot = pickle.loads(shm.buf[: self.size])
+            finally:
+                shm.close()
+        _cache_shared_snapshot(self.name, snapshot)
+        self._snapshot = snapshot
+        return snapshot
+
+    def unlink(self) -> None:
+        """
+        Releases the shared memory (by the publisher).
+        """
+        with _shared_snapshots_lock:
+            _shared_snapshots.pop(self.name, None)
+        self._snapshot = None
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+    def __enter__(self) -> "SharedConfig":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.unlink()
+
+    def __reduce__(self):
+        return (self.__class__, (self.name, self.size))
+
+    def __repr__(self):
+        return f"SharedConfig({self.name!r}, size={self.size})"
+
+
+def _attach_shared_memory(name: str):
+    from multiprocessing.shared_memory import SharedMemory
+
+    try:
+        # Python 3.13+: an attached block is not tracked (unlinked) by the worker
+        return SharedMemory(name=name, track=False)
+    except TypeError:
+        # registered with the resource tracker of this process: the workers of a pool share the tracker
+        # of the publisher (registered once), the tracker of another process unlinks the block at its exit
+        return SharedMemory(name=name)
@@ -1,25 +1,25 @@
+from __future__ import annotations
+
+import base64
+import hashlib
+import hmac
 import os
+import pickle
+import tempfile
+import threading
+import time
+from collections import OrderedDict
 
 
-from .addict import Addict
-from dacutil import crypt
+from .addict import Addict, FrozenAddict, LazyAddict
 from urllib.parse import urlparse, ParseResult
-from typing import Tuple, Optional, Dict, Literal
-from configobj import ConfigObj
-from requests.auth import HTTPBasicAuth
-from requests import Response, get as req_get
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Mapping, Tuple, Optional, Dict, Literal, NamedTuple, Protocol, Union
 import json
 from io import StringIO
-import yaml
 
-try:
-    import tomllib
-except ModuleNotFoundError:
-    import tomli as tomllib
-try:
-    from yaml import CLoader as Loader
-except ImportError:
-    from yaml import Loader
+# requests, configobj, yaml, tomllib and the crypt backends are imported on first use
+if TYPE_CHECKING:
+    from requests import Response, Session
 
 # error is config scheme not support
 ErrConfigSchemeNotSupport = Exception("Config scheme not support")
@@ -27,6 +27,232 @@ ErrConfigNotFound = Exception("Config not found")
 
 ConfigTypeSupport = ["ini", "json", "yaml", "toml"]
 
+# environment variable of the key of `ConfigDiskCache`
+CONFIG_CACHE_KEY_ENV = "DACUTIL_CONFIG_CACHE_KEY"
+
+
+class ConfigTransport(Protocol):
+    """
+    HTTP transport of `get_config`: `requests`, a `requests.Session` or any object with the same `get`.
+    """
+
+    def get(self, url: str, **kwargs) -> Response: ...
+
+
+def config_session(pool_maxsize: int = 32, retries: int = 3, backoff_factor: float = 0.2) -> Session:
+    """
+    Creates a `requests.Session` with a keep-alive connection pool and retries of GET
+    (connection errors and 429 / 502 / 503 / 504), use as the `transport` of `get_config`.
+
+    Parameters:
+        pool_maxsize (int): Max connections kept alive of each host. Defaults to 32.
+        retries (int): Max retries of a request. Defaults to 3.
+        backoff_factor (float): Backoff between retries (`backoff_factor * 2 ** retry` seconds). Defaults to 0.2.
+
+    Returns:
+        Session: The session.
+    """
+    from requests import Session
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=[429, 502, 503, 504],
+        allowed_methods=["GET"],
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_maxsize, pool_maxsize=pool_maxsize, max_retries=retry)
+    session = Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+_shared_session: Optional[Session] = None
+_shared_session_lock = threading.Lock()
+
+
+def shared_session() -> Session:
+    """
+    The process-wide pooled session of `config_session()` (created on the first call).
+    """
+    global _shared_session
+    with _shared_session_lock:
+        if _shared_session is None:
+            _shared_session = config_session()
+        return _shared_session
+
+
+class ConfigCache:
+    """
+    In-process LRU cache of `get_config` keyed on URI plus options.
+
+    An entry is fresh for `ttl` seconds. A `file://` entry is also checked with the mtime and size
+    of the file on every call. An expired `http(s)://` entry is revalidated with a conditional GET
+    (`If-None-Match` / `If-Modified-Since`), a `304 Not Modified` reuses the parsed Addict.
+
+    The cached configuration is a `FrozenAddict` snapshot shared by the callers, read-only
+    (`Addict(config.to_dict())` is a modifiable copy).
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: float = 300.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self._entries: OrderedDict[tuple, _CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> Optional["_CacheEntry"]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: tuple, entry: "_CacheEntry") -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.revalidated = 0
+
+    def count(self, hits: int = 0, misses: int = 0, revalidated: int = 0) -> None:
+        with self._lock:
+            self.hits += hits
+            self.misses += misses
+            self.revalidated += revalidated
+
+    def info(self) -> Dict[str, int]:
+        """
+        Returns:
+            Dict[str, int]: hits (includes revalidated), misses, revalidated (304 / same mtime after the ttl), size and maxsize
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidated": self.revalidated,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+        }
+
+
+class _CacheEntry(NamedTuple):
+    config: FrozenAddict
+    loaded_at: float
+    # file: (mtime_ns, size), url: (etag, last_modified)
+    validator: tuple
+
+
+config_cache = ConfigCache()
+
+
+def _derive_key(master: bytes, label: bytes) -> bytes:
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+
+    return HKDF(algorithm=hashes.SHA256(), length=32, salt=None, info=label).derive(master)
+
+
+class ConfigDiskCache:
+    """
+    Opt-in on-disk cache of parsed configurations shared by processes (e.g. a pool of workers),
+    a warm load reads the file, hashes it and unpickles the parsed dict, no decryption and no parsing.
+
+    An entry is named by an HMAC-SHA256 (keyed by a subkey of `key`) of the downloaded data (the ciphertext of an encrypted
+    config), the file type and the decryption secrets (`age_key`, `passphrase`): a changed file is a new entry,
+    a call with another secret or without one never reads the entry of the right one. The pickled dict is encrypted and authenticated
+    with Fernet, decrypted secrets are never written in the clear. The Fernet key and the HMAC key of the names
+    are two independent subkeys derived from the process-held `key` (HKDF-SHA256 with distinct labels).
+    An entry of another key, a corrupted or a tampered entry is a miss.
+
+    Parameters:
+        directory (str): The cache directory (created, mode 0700).
+        key (Optional[str]): A Fernet key (`crypt.gen_key()`) held by the process, e.g. given to the workers
+            by the parent. Defaults to the environment variable `DACUTIL_CONFIG_CACHE_KEY`.
+
+    Raises:
+        ValueError: If no key is given and `DACUTIL_CONFIG_CACHE_KEY` is not set.
+
+    Example:
+        >>> os.environ["DACUTIL_CONFIG_CACHE_KEY"] = crypt.gen_key()  # in the parent, before the pool starts
+        >>> config = get_config("config.yaml.age", age_key=key, disk_cache=ConfigDiskCache("/var/cache/app"))
+    """
+
+    # bumped when the format of an entry changes
+    VERSION = b"3"
+
+    def __init__(self, directory: str, key: Optional[str] = None):
+        from cryptography.fernet import Fernet
+
+        key = key if key is not None else os.environ.get(CONFIG_CACHE_KEY_ENV)
+        if not key:
+            raise ValueError(f"ConfigDiskCache requires a key or the environment variable {CONFIG_CACHE_KEY_ENV}")
+        self.directory = directory
+        Fernet(key)  # a valid Fernet key or ValueError
+        master = base64.urlsafe_b64decode(key)
+        self._fernet = Fernet(base64.urlsafe_b64encode(_derive_key(master, b"dacutil config cache: encryption")))
+        self._hmac_key = _derive_key(master, b"dacutil config cache: entry name")
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+
+    def _path(self, data: str | bytes, ftype: str, age_key: Optional[str], passphrase: Optional[str]) -> str:
+        # keyed: the name does not allow to guess a passphrase without the key of the cache
+        digest = hmac.new(self._hmac_key, digestmod=hashlib.sha256)
+        for part in (self.VERSION, ftype, _secret_digest(age_key) or "", _secret_digest(passphrase) or ""):
+            digest.update(part.encode() if isinstance(part, str) else part)
+            digest.update(b"\0")
+        digest.update(data.encode("utf-8") if isinstance(data, str) else data)
+        return os.path.join(self.directory, digest.hexdigest() + ".bin")
+
+    def load(
+        self, data: str | bytes, ftype: str, age_key: Optional[str] = None, passphrase: Optional[str] = None
+    ) -> Optional[dict]:
+        """
+        Returns:
+            Optional[dict]: The parsed configuration of `data`, None on a miss.
+        """
+        from cryptography.fernet import InvalidToken
+
+        try:
+            with open(self._path(data, ftype, age_key, passphrase), "rb") as f:
+                token = f.read()
+            return pickle.loads(self._fernet.decrypt(token))
+        except (OSError, InvalidToken):
+            return None
+
+    def store(
+        self,
+        data: str | bytes,
+        ftype: str,
+        config: dict,
+        age_key: Optional[str] = None,
+        passphrase: Optional[str] = None,
+    ) -> None:
+        path = self._path(data, ftype, age_key, passphrase)
+        token = self._fernet.encrypt(pickle.dumps(config, protocol=pickle.HIGHEST_PROTOCOL))
+        # written to a temporary file and renamed, a reader never sees a partial entry
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(token)
+            os.replace(tmp, path)
+        except BaseException:
+            os.remove(tmp)
+            raise
+
+    def clear(self) -> None:
+        for name in os.listdir(self.directory):
+            if name.endswith(".bin"):
+                os.remove(os.path.join(self.directory, name))
+
 
 def get_config(
     uri_of_file: str,
@@ -35,6 +261,11 @@ def get_config(
     headers: Optional[Dict[str, str]] = None,
     age_key: Optional[str] = None,
     passphrase: Optional[str] = None,
+    cache: bool = False,
+    cache_ttl: Optional[float] = None,
+    transport: Optional[ConfigTransport] = None,
+    disk_cache: Optional[ConfigDiskCache] = None,
+    lazy: bool = False,
 ) -> Addict:
     """
     Retrieves the configuration from a specified file or URL.
@@ -43,6 +274,14 @@ def get_config(
         uri_of_file (str): The URI of the file or URL from which to retrieve the configuration.
         basic_auth (Optional[Tuple[str, str]]): Optional basic authentication credentials as a tuple of username and password.
         headers (Optional[Dict[str, str]]): Optional headers to include in the request.
+        cache (bool): Use the in-process cache `config_cache` (no download, decryption and parsing on a hit),
+            the returned `FrozenAddict` is read-only and shared by the callers (`lazy` does not apply). Defaults to False.
+        cache_ttl (Optional[float]): Seconds an entry is fresh without revalidation. Defaults to `config_cache.ttl`.
+        transport (Optional[ConfigTransport]): HTTP transport, e.g. `shared_session()` keep-alive pooled session with retries.
+            Defaults to None (`requests.get`, a new connection of each call).
+        disk_cache (Optional[ConfigDiskCache]): Cache of the parsed configuration on disk (encrypted) shared by processes,
+            a warm load skips the decryption and the parsing. Defaults to None.
+        lazy (bool): Returns a `LazyAddict`, nested dicts / lists are wrapped on the first access. Defaults to False.
 
     Returns:
         Addict: The retrieved configuration as an `Addict` object.
@@ -51,6 +290,29 @@ def get_config(
         ErrConfigSchemeNotSupport: If the URI scheme is not supported.
 
     """
+    uri, scheme, ftype = _resolve_uri(uri_of_file, file_type)
+    if scheme not in ["http", "https", "file"]:
+        raise ErrConfigSchemeNotSupport
+    if cache:
+        return _get_config_cached(
+            uri, scheme, ftype, basic_auth, headers, age_key, passphrase, cache_ttl, transport, disk_cache
+        )
+
+    data: Optional[str | bytes] = None
+    if scheme in ["http", "https"]:
+        _, data, _, _ = _fetch_config_url(uri, basic_auth, headers, transport=transport)
+    else:
+        data = get_config_file(uri.replace("file://", ""))
+    if data is None:
+        raise ErrConfigNotFound
+    return _parse_config(data, ftype, age_key, passphrase, disk_cache, lazy)
+
+
+def _resolve_uri(uri_of_file: str, file_type: str) -> Tuple[str, str, Literal["ini", "json", "yaml", "toml", "raw"]]:
+    """
+    Returns:
+        Tuple[str, str, str]: (uri, scheme, file type)
+    """
     uri: str = uri_of_file
 
     if "://" not in uri:
@@ -72,17 +334,15 @@ def get_config(
         elif filepath.lower().endswith(".toml"):
             ftype = "toml"
     else:
-        ftype = file_type
+        ftype = file_type  # type: ignore
+    return uri, u.scheme, ftype
+
+
+def _decrypt_config(data: str | bytes, age_key: Optional[str] = None, passphrase: Optional[str] = None) -> str | bytes:
+    if age_key is None and passphrase is None:
+        return data
+    from dacutil import crypt
 
-    data: Optional[str | bytes] = None
-    if u.scheme in ["http", "https"]:
-        data = get_config_url(uri, basic_auth, headers)
-    elif u.scheme == "file":
-        data = get_config_file(uri.replace("file://", ""))
-    else:
-        raise ErrConfigSchemeNotSupport
-    if data is None:
-        raise ErrConfigNotFound
     if age_key is not None:
         age_key = age_key.upper()
         if age_key.upper().startswith("AGE-SECRET-KEY-") is False:
@@ -90,11 +350,327 @@ def get_config(
         data = crypt.age_decrypt(data, age_key)
     if passphrase is not None:
         data = crypt.decrypt_b64(data, passphrase)
+    return data
+
 
+def _parse_config(
+    data: str | bytes,
+    ftype: Literal["ini", "json", "yaml", "toml", "raw"],
+    age_key: Optional[str] = None,
+    passphrase: Optional[str] = None,
+    disk_cache: Optional[ConfigDiskCache] = None,
+    lazy: bool = False,
+) -> Addict:
+    wrap = LazyAddict if lazy else Addict
+    if disk_cache is not None:
+        config = disk_cache.load(data, ftype, age_key, passphrase)
+        if config is not None:
+            return wrap(config)
+    raw = data
+    data = _decrypt_config(data, age_key, passphrase)
     if isinstance(data, bytes):
         data = data.decode("utf-8")
 
-    return Addict(read_config(data, file_type=ftype))
+    config = read_config(data, file_type=ftype)
+    if disk_cache is not None:
+        disk_cache.store(raw, ftype, config, age_key, passphrase)
+    return wrap(config)
+
+
+def _secret_digest(value: Optional[str]) -> Optional[str]:
+    # the cache key does not keep the secrets
+    return None if value is None else hashlib.sha256(value.encode()).hexdigest()
+
+
+def _headers_digest(headers: Optional[Dict[str, str]]) -> Optional[str]:
+    # headers may carry tokens (Authorization, ...)
+    if not headers:
+        return None
+    return _secret_digest("\n".join(f"{name}: {value}" for name, value in sorted(headers.items())))
+
+
+def _get_config_cached(
+    uri: str,
+    scheme: str,
+    ftype: Literal["ini", "json", "yaml", "toml", "raw"],
+    basic_auth: Optional[Tuple[str, str]],
+    headers: Optional[Dict[str, str]],
+    age_key: Optional[str],
+    passphrase: Optional[str],
+    cache_ttl: Optional[float],
+    transport: Optional[ConfigTransport] = None,
+    disk_cache: Optional[ConfigDiskCache] = None,
+) -> FrozenAddict:
+    key = (
+        uri,
+        ftype,
+        basic_auth[0] if basic_auth else None,
+        _secret_digest(basic_auth[1] if basic_auth else None),
+        _headers_digest(headers),
+        _secret_digest(age_key),
+        _secret_digest(passphrase),
+    )
+    ttl = config_cache.ttl if cache_ttl is None else cache_ttl
+    entry = config_cache.get(key)
+    now = time.monotonic()
+
+    if scheme == "file":
+        filepath = uri.replace("file://", "")
+        try:
+            st = os.stat(filepath)
+        except OSError:
+            raise ErrConfigNotFound
+        validator: tuple = (st.st_mtime_ns, st.st_size)
+        if entry is not None and entry.validator == validator:
+            expired = now - entry.loaded_at >= ttl
+            config_cache.count(hits=1, revalidated=int(expired))
+            if expired:
+                config_cache.put(key, entry._replace(loaded_at=now))
+            return entry.config
+        data = get_config_file(filepath)
+        if data is None:
+            raise ErrConfigNotFound
+    else:
+        if entry is not None and now - entry.loaded_at < ttl:
+            config_cache.count(hits=1)
+            return entry.config
+        etag, last_modified = entry.validator if entry is not None else (None, None)
+        status, data, etag, last_modified = _fetch_config_url(
+            uri, basic_auth, headers, etag, last_modified, transport=transport
+        )
+        if status == 304 and entry is not None:
+            config_cache.count(hits=1, revalidated=1)
+            config_cache.put(key, _CacheEntry(entry.config, now, (etag, last_modified)))
+            return entry.config
+        if data is None:
+            raise ErrConfigNotFound
+        validator = (etag, last_modified)
+
+    config_cache.count(misses=1)
+    config = _parse_config(data, ftype, age_key, passphrase, disk_cache).snapshot()
+    config_cache.put(key, _CacheEntry(config, now, validator))
+    return config
+
+
+def get_configs(
+    uris: Union[Iterable[str], Mapping[str, Mapping[str, Any]]],
+    max_workers: int = 16,
+    on_error: Literal["raise", "return"] = "raise",
+    transport: Optional[ConfigTransport] = None,
+    **options,
+) -> Dict[str, Addict]:
+    """
+    Retrieves many configurations concurrently (download, decryption and parsing in a thread pool).
+
+    Parameters:
+        uris (Union[Iterable[str], Mapping[str, Mapping[str, Any]]]): URIs, or a mapping of URI to its `get_config` options
+            (e.g. an `age_key` of each tenant) which override `**options`.
+        max_workers (int): Number of threads. Defaults to 16.
+        on_error (Literal["raise", "return"]): "raise": raises the first error (default),
+            "return": the exception is the value of the URI.
+        transport (Optional[ConfigTransport]): HTTP transport. Defaults to None (`shared_session()`).
+        **options: Options of `get_config` of every URI
+            (file_type, basic_auth, headers, age_key, passphrase, cache, cache_ttl, disk_cache, lazy).
+
+    Returns:
+        Dict[str, Addict]: Configuration of each URI (in the order of `uris`).
+
+    Example:
+        >>> configs = get_configs([f"https://config.local/{t}.yaml.age" for t in tenants], age_key=key)
+    """
+    from dacutil.worker import TaskFailure, worker_imap
+
+    if isinstance(uris, Mapping):
+        items = [(uri, {**options, **uri_options}) for uri, uri_options in uris.items()]
+    else:
+        items = [(uri, options) for uri in uris]
+    transport = transport if transport is not None else shared_session()
+    values = ({"uri_of_file": uri, "transport": transport, **uri_options} for uri, uri_options in items)
+    results = worker_imap(max(1, min(max_workers, len(items))), get_config, values, on_error=on_error, chunksize=1)
+    configs: Dict[str, Any] = {}
+    for (uri, _), result in zip(items, results):
+        configs[uri] = result.error if isinstance(result, TaskFailure) else result
+    return configs
+
+
+ConfigCallback = Callable[[FrozenAddict, FrozenAddict], Any]
+
+
+class ConfigWatcher:
+    """
+    Watches a configuration file or URL and hot-reloads it into an immutable `FrozenAddict` snapshot
+    (keys, nested dicts and lists are read-only, an assignment raises TypeError).
+
+    A file is checked with the mtime and size of `os.stat`, a URL with a conditional GET
+    (`If-None-Match` / `If-Modified-Since`), the configuration is downloaded and parsed only when it changed.
+    The new snapshot is built before it replaces `config` in one assignment, readers never block
+    and see the old or the new snapshot, never a half-updated one. On an error the last good snapshot is kept.
+
+    Parameters:
+        uri_of_file (str): The URI of the file or URL (see `get_config`).
+        interval (float): Seconds between checks of the background thread. Defaults to 5.0.
+        on_change (Optional[Callable[[FrozenAddict, FrozenAddict], Any]]): Called with (new config, previous config) after a swap.
+        on_error (Optional[Callable[[Exception], Any]]): Called with the error of a failed check.
+        transport (Optional[ConfigTransport]): HTTP transport. Defaults to None (`shared_session()`).
+        **options: Options of `get_config` (file_type, basic_auth, headers, age_key, passphrase, disk_cache).
+
+    Example:
+        >>> watcher = ConfigWatcher("https://config.local/app.yaml", interval=10, age_key=key).start()
+        >>> watcher.on_change(lambda new, old: pool.resize(new.db.pool_size))
+        >>> dsn = watcher.config.db.dsn
+    """
+
+    def __init__(
+        self,
+        uri_of_file: str,
+        interval: float = 5.0,
+        on_change: Optional[ConfigCallback] = None,
+        on_error: Optional[Callable[[Exception], Any]] = None,
+        transport: Optional[ConfigTransport] = None,
+        **options,
+    ):
+        self.uri, self.scheme, self.file_type = _resolve_uri(uri_of_file, options.pop("file_type", "infer"))
+        if self.scheme not in ["http", "https", "file"]:
+            raise ErrConfigSchemeNotSupport
+        self.interval = interval
+        self.on_error = on_error
+        self.transport = transport if transport is not None else shared_session()
+        self.basic_auth: Optional[Tuple[str, str]] = options.pop("basic_auth", None)
+        self.headers: Optional[Dict[str, str]] = options.pop("headers", None)
+        self.age_key: Optional[str] = options.pop("age_key", None)
+        self.passphrase: Optional[str] = options.pop("passphrase", None)
+        self.disk_cache: Optional[ConfigDiskCache] = options.pop("disk_cache", None)
+        if options:
+            raise TypeError(f"unexpected options: {', '.join(options)}")
+        self.version = 0
+        self.error: Optional[Exception] = None
+        self._callbacks: list[ConfigCallback] = [on_change] if on_change is not None else []
+        self._validator: tuple = ()
+        self._check_lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._config: FrozenAddict = FrozenAddict()
+        if not self.check(raise_error=True):
+            raise ErrConfigNotFound
+
+    @property
+    def config(self) -> FrozenAddict:
+        """
+        The current snapshot (a plain attribute read, never blocks), use `PathAccessor` for hot paths.
+        """
+        return self._config
+
+    def on_change(self, callback: ConfigCallback) -> ConfigCallback:
+        """
+        Adds a callback of changes, called with (new config, previous config). Usable as a decorator.
+        """
+        self._callbacks.append(callback)
+        return callback
+
+    def _load(self) -> Tuple[Optional[str | bytes], tuple]:
+        """
+        Returns:
+            Tuple[Optional[str | bytes], tuple]: (the data if it changed since the last check else None, validator)
+        """
+        if self.scheme == "file":
+            filepath = self.uri.replace("file://", "")
+            try:
+                st = os.stat(filepath)
+            except OSError:
+                raise ErrConfigNotFound
+            validator: tuple = (st.st_mtime_ns, st.st_size)
+            if validator == self._validator:
+                return None, validator
+            data = get_config_file(filepath)
+        else:
+            etag, last_modified = self._validator or (None, None)
+            status, data, etag, last_modified = _fetch_config_url(
+                self.uri, self.basic_auth, self.headers, etag, last_modified, transport=self.transport
+            )
+            if status == 304:
+                return None, self._validator
+            validator = (etag, last_modified)
+        if data is None:
+            raise ErrConfigNotFound
+        return data, validator
+
+    def check(self, raise_error: bool = False) -> bool:
+        """
+        Checks the configuration once, swaps in a new snapshot and calls the callbacks if it changed.
+
+        Parameters:
+            raise_error (bool): Raise the error of the check instead of keeping the last snapshot. Defaults to False.
+
+        Returns:
+            bool: True if a new snapshot was swapped in.
+        """
+        with self._check_lock:
+            try:
+                data, validator = self._load()
+                if data is None:
+                    return False
+                config = _parse_config(data, self.file_type, self.age_key, self.passphrase, self.disk_cache)
+            except Exception as e:
+                self.error = e
+                if raise_error:
+                    raise
+                if self.on_error is not None:
+                    self.on_error(e)
+                return False
+            self.error = None
+            # kept after a successful parse only, a file read in the middle of a write is parsed again
+            self._validator = validator
+            previous = self._config
+            if self.version and config == previous:
+                # touched or re-uploaded with the same content
+                return False
+            config = config.snapshot()
+            self._config = config
+            self.version += 1
+            if self.version == 1:
+                # the initial load is not a change
+                return True
+        for callback in list(self._callbacks):
+            try:
+                callback(config, previous)
+            except Exception as e:
+                if self.on_error is None:
+                    raise
+                self.on_error(e)
+        return True
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            try:
+                self.check()
+            except Exception:
+                # a callback failed without on_error, the watcher keeps running
+                pass
+
+    def start(self) -> "ConfigWatcher":
+        """
+        Starts the background thread of checks every `interval` seconds.
+        """
+        if self._thread is None or not self._thread.is_alive():
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._run, name=f"ConfigWatcher({self.uri})", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stops the background thread.
+        """
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def __enter__(self) -> "ConfigWatcher":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
 
 
 def get_config_file(filepath: str) -> Optional[str | bytes]:
@@ -109,12 +685,42 @@ def get_config_url(
     basic_auth: Optional[Tuple[str, str]] = None,
     headers: Optional[Dict[str, str]] = None,
 ) -> Optional[str | bytes]:
+    _, data, _, _ = _fetch_config_url(url, basic_auth, headers)
+    return data
+
+
+def _fetch_config_url(
+    url: str,
+    basic_auth: Optional[Tuple[str, str]] = None,
+    headers: Optional[Dict[str, str]] = None,
+    etag: Optional[str] = None,
+    last_modified: Optional[str] = None,
+    transport: Optional[ConfigTransport] = None,
+) -> Tuple[int, Optional[str], Optional[str], Optional[str]]:
+    """
+    GET the url, conditional (`If-None-Match` / `If-Modified-Since`) if `etag` / `last_modified` is given.
+
+    Returns:
+        Tuple[int, Optional[str], Optional[str], Optional[str]]: (status code, text if 2xx, ETag, Last-Modified)
+            the validators of the request are kept on 304
+    """
+    from requests import get as req_get
+    from requests.auth import HTTPBasicAuth
+
     bAuth: HTTPBasicAuth | None = HTTPBasicAuth(*basic_auth) if basic_auth else None
-    r: Response = req_get(url, timeout=30, auth=bAuth, headers=headers)
+    request_headers = dict(headers or {})
+    if etag:
+        request_headers["If-None-Match"] = etag
+    if last_modified:
+        request_headers["If-Modified-Since"] = last_modified
+    get = req_get if transport is None else transport.get
+    r: Response = get(url, timeout=30, auth=bAuth, headers=request_headers or None)
 
+    if r.status_code == 304:
+        return r.status_code, None, r.headers.get("ETag", etag), r.headers.get("Last-Modified", last_modified)
     if r.status_code >= 200 and r.status_code < 300:
-        return r.text
-    return None
+        return r.status_code, r.text, r.headers.get("ETag"), r.headers.get("Last-Modified")
+    return r.status_code, None, None, None
 
 
 def read_config(
@@ -130,14 +736,23 @@ def read_config(
         else:
             raise Exception("Invalid data type")
         if file_type == "ini":
+            from configobj import ConfigObj
+
             cfg = ConfigObj(StringIO(data_str))
             c = cfg.dict()
         elif file_type == "json":
             cfg = json.loads(data_str)
             c = dict(cfg)
         elif file_type == "yaml":
-            c = yaml.load(StringIO(data_str), Loader=Loader)
+            import yaml
+
+            c = yaml.load(StringIO(data_str), Loader=getattr(yaml, "CLoader", yaml.Loader))
         elif file_type == "toml":
+            try:
+                import tomllib
+            except ModuleNotFoundError:
+                import tomli as tomllib
+
             c = tomllib.loads(data_str)
         else:
             return {"raw": data_str}
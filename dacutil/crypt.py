@@ -1,4 +1,3 @@
-from cryptography.fernet import Fernet
 from base64 import b64encode, b64decode
 import pyrage as age
 from typing import Tuple
@@ -9,6 +8,8 @@ def gen_key() -> str:
     """
     Function that generates a key and returns it as a decoded string.
     """
+    from cryptography.fernet import Fernet
+
     return Fernet.generate_key().decode()
 
 
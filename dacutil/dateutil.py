@@ -1,70 +1,516 @@
 from datetime import datetime, date
-from typing import Union, Literal
+from typing import Optional, Sequence, Union, Literal
+import numpy as np
 import pyarrow as pa
 import pandas as pd
 from pyarrow import compute
 
+DateLike = Union[pa.Array, pa.ChunkedArray, pa.Scalar, pd.Series, np.ndarray, date, datetime]
+ArrowDate = Union[pa.Array, pa.ChunkedArray, pa.Scalar]
+DateUnit = Literal["Y", "M", "W", "D", "h", "m", "s", "ms"]
+OutputType = Literal["pandas", "arrow", "numpy"]
+
+
+def _years_between(start: ArrowDate, ended: ArrowDate) -> Union[pa.Array, pa.ChunkedArray]:
+    """
+    Same result as `years_between` (number of year boundaries), about 2x faster from the year field.
+    """
+    return compute.subtract(compute.year(ended), compute.year(start))
+
+
+def _months_between(
+    start: ArrowDate, ended: ArrowDate, years: Optional[Union[pa.Array, pa.ChunkedArray]] = None
+) -> Union[pa.Array, pa.ChunkedArray]:
+    """
+    Number of month boundaries between two dates/timestamps, same as `years_between` for months
+    (pyarrow has no `months_between`, its `month_interval_between` returns an unwrapped type).
+    """
+    if years is None:
+        years = _years_between(start, ended)
+    months = compute.subtract(compute.month(ended), compute.month(start))
+    return compute.add(compute.multiply(years, 12), months)
+
+
+_BETWEEN = {
+    "Y": _years_between,
+    "M": _months_between,
+    "W": compute.weeks_between,
+    "D": compute.days_between,
+    "h": compute.hours_between,
+    "m": compute.minutes_between,
+    "s": compute.seconds_between,
+    "ms": compute.milliseconds_between,
+}
+_TIME_UNITS = ("s", "ms", "us", "ns")
+_BAND_TABLE_SIZE = 1 << 16
+
+
+def _to_arrow_date(value: DateLike) -> Optional[ArrowDate]:
+    """
+    Converts the input to pyarrow without a copy where possible and keeps the native time unit.
+
+    - `ArrowDtype` Series: the underlying `pa.ChunkedArray`
+    - `datetime64` Series / numpy array: `pa.array` (zero-copy of the data buffer, NaT to null)
+    - `date` / `datetime`: `pa.Scalar`
+    - Series / numpy array of strings (ISO dates) or other values: cast to `timestamp[ns]`
+
+    Returns:
+        Optional[ArrowDate]: None if the type of input is not supported
+    """
+    if isinstance(value, (pa.Array, pa.ChunkedArray, pa.Scalar)):
+        return value
+    if isinstance(value, pd.Series):
+        arr = value.array.__arrow_array__() if isinstance(value.dtype, pd.ArrowDtype) else pa.array(value)
+    elif isinstance(value, np.ndarray):
+        arr = pa.array(value, from_pandas=True)
+    else:
+        arr = None
+    if arr is not None:
+        # strings (ISO dates) / objects are parsed as timestamp[ns]
+        return arr if pa.types.is_temporal(arr.type) else arr.cast(pa.timestamp("ns"))
+    if isinstance(value, (datetime, date)):
+        return pa.scalar(value)
+    return None
+
+
+def _common_type(left: pa.DataType, right: pa.DataType) -> pa.DataType:
+    """
+    Type both sides are cast to: the finest timestamp unit (and time zone) of both sides,
+    date32 if none of them is a timestamp.
+    """
+    timestamps = [t for t in (left, right) if pa.types.is_timestamp(t)]
+    if not timestamps:
+        return pa.date32()
+    unit = max((t.unit for t in timestamps), key=_TIME_UNITS.index)
+    tz = next((t.tz for t in timestamps if t.tz is not None), None)
+    return pa.timestamp(unit, tz)
+
+
+def _prepare_dates(start_dt: DateLike, ended_dt: DateLike) -> Optional[tuple[ArrowDate, ArrowDate]]:
+    """
+    Converts both sides to pyarrow of the same type.
+
+    Returns:
+        Optional[tuple[ArrowDate, ArrowDate]]: None if the type of an input is not supported
+    """
+    fr_dt = _to_arrow_date(start_dt)
+    to_dt = _to_arrow_date(ended_dt)
+    if fr_dt is None or to_dt is None:
+        return None
+    if fr_dt.type != to_dt.type:
+        pa_type = _common_type(fr_dt.type, to_dt.type)
+        fr_dt = fr_dt.cast(pa_type)
+        to_dt = to_dt.cast(pa_type)
+    return fr_dt, to_dt
+
+
+def _series_index(*values: DateLike) -> Optional[pd.Index]:
+    """
+    Index of the first pandas Series input (the other side may be a scalar), None for a RangeIndex.
+    """
+    return next((value.index for value in values if isinstance(value, pd.Series)), None)
+
+
+def _empty_result(output: OutputType) -> Union[pd.Series, pa.Array, np.ndarray]:
+    if output == "arrow":
+        return pa.array([], type=pa.int64())
+    if output == "numpy":
+        return np.array([], dtype=np.int64)
+    return pd.Series()
+
 
 def datediff(
-    start_dt: Union[pa.Array, pa.Scalar, pd.Series, date, datetime],
-    ended_dt: Union[pa.Array, pa.Scalar, pd.Series, date, datetime],
-    scalar: Literal["Y", "M", "D", "h", "m", "s", "ms"] = "Y",
-) -> pd.Series:
+    start_dt: DateLike,
+    ended_dt: DateLike,
+    scalar: DateUnit = "Y",
+    output: OutputType = "pandas",
+) -> Union[pd.Series, pa.Array, pa.ChunkedArray, np.ndarray]:
     """
-    Calculate the difference between two dates/timestamps and return the result as a pandas Series.
+    Calculate the difference between two dates/timestamps.
+
+    The inputs are used in their native time unit, `ArrowDtype` / `datetime64` Series,
+    `pa.ChunkedArray` and `numpy.datetime64` arrays are not copied.
+    If the types of both sides differ, they are cast to the finest unit of both.
 
     Parameters:
-        start_dt (Union[pa.Array, pa.Scalar, pd.Series, date, datetime]): The start date/timestamp.
-        ended_dt (Union[pa.Array, pa.Scalar, pd.Series, date, datetime]): The end date/timestamp.
-        scalar (Literal["Y", "M", "D", "h", "m", "s", "ms"]): The unit of the difference. Defaults to "Y".
+        start_dt (DateLike): The start date/timestamp.
+        ended_dt (DateLike): The end date/timestamp.
+        scalar (Literal["Y", "M", "W", "D", "h", "m", "s", "ms"]): The unit of the difference. Defaults to "Y".
+        output (Literal["pandas", "arrow", "numpy"]): Type of result.
+            "pandas": pandas Series of `ArrowDtype` with the index of the input Series (default),
+            "arrow": `pa.Array` / `pa.ChunkedArray` int64,
+            "numpy": numpy array (float64 with NaN if it has null).
 
     Returns:
-        pd.Series: The calculated difference between the start and end dates/timestamps.
-    """
-    pa_type = pa.timestamp("ns")
-
-    # convert to type pyarrow
-    fr_dt: Union[pa.Array, pa.Scalar]
-    if isinstance(start_dt, pd.Series):
-        fr_dt = pa.array(pa.array(start_dt), type=pa_type)
-    elif isinstance(start_dt, datetime):
-        fr_dt = pa.scalar(start_dt, type=pa_type)
-    elif isinstance(start_dt, date):
-        fr_dt = pa.scalar(datetime.combine(start_dt, datetime.min.time()), type=pa_type)
-    elif isinstance(start_dt, pa.Array) or isinstance(start_dt, pa.Scalar):
-        fr_dt = start_dt
+        Union[pd.Series, pa.Array, pa.ChunkedArray, np.ndarray]: The calculated difference between the start and end dates/timestamps.
+    """
+    func = _BETWEEN.get(scalar)
+    dates = _prepare_dates(start_dt, ended_dt)
+    if dates is None or func is None:
+        return _empty_result(output)
+
+    sr: Union[pa.Array, pa.ChunkedArray] = func(*dates)
+    if output == "arrow":
+        return sr
+    if output == "numpy":
+        return sr.to_numpy(zero_copy_only=False)
+    return pd.Series(sr.to_pandas(types_mapper=pd.ArrowDtype).array, index=_series_index(start_dt, ended_dt))
+
+
+def datediff_units(
+    start_dt: DateLike,
+    ended_dt: DateLike,
+    scalars: Sequence[DateUnit] = ("Y", "M", "D"),
+    output: Literal["pandas", "arrow"] = "pandas",
+) -> Union[pd.DataFrame, pa.StructArray, pa.ChunkedArray]:
+    """
+    Calculate the difference between two dates/timestamps in several units,
+    the inputs are converted once for all units.
+
+    Parameters:
+        start_dt (DateLike): The start date/timestamp.
+        ended_dt (DateLike): The end date/timestamp.
+        scalars (Sequence[Literal["Y", "M", "W", "D", "h", "m", "s", "ms"]]): The units of the difference. Defaults to ("Y", "M", "D").
+        output (Literal["pandas", "arrow"]): Type of result.
+            "pandas": DataFrame of `ArrowDtype` with a column per unit and the index of the input Series (default),
+            "arrow": struct array with a field per unit.
+
+    Returns:
+        Union[pd.DataFrame, pa.StructArray, pa.ChunkedArray]: The differences, a column / field per unit.
+            A struct ChunkedArray if an input is a ChunkedArray.
+
+    Example:
+        >>> datediff_units(df["birth_date"], df["admit_date"], ["Y", "M", "D"])
+    """
+    unknown = [unit for unit in scalars if unit not in _BETWEEN]
+    if unknown:
+        raise ValueError(f"unit not support: {unknown}")
+    dates = _prepare_dates(start_dt, ended_dt)
+    if dates is None:
+        return pd.DataFrame(columns=list(scalars)) if output == "pandas" else pa.array([], pa.struct([]))
+
+    results: dict[str, Union[pa.Array, pa.ChunkedArray]] = {}
+    years = _years_between(*dates) if "Y" in scalars or "M" in scalars else None
+    for unit in scalars:
+        if unit == "Y":
+            results[unit] = years
+        elif unit == "M":
+            results[unit] = _months_between(*dates, years=years)
+        else:
+            results[unit] = _BETWEEN[unit](*dates)
+    if output == "pandas":
+        return pd.DataFrame(
+            {unit: sr.to_pandas(types_mapper=pd.ArrowDtype).array for unit, sr in results.items()},
+            index=_series_index(start_dt, ended_dt),
+        )
+    if any(isinstance(sr, pa.ChunkedArray) for sr in results.values()):
+        table = pa.table({unit: sr for unit, sr in results.items()})
+        return pa.chunked_array(
+            [pa.StructArray.from_arrays(batch.columns, names=batch.schema.names) for batch in table.to_batches()],
+            type=pa.struct(table.schema),
+        )
+    return pa.StructArray.from_arrays(list(results.values()), names=list(results.keys()))
+
+
+def age_band(
+    start_dt: DateLike,
+    ended_dt: DateLike,
+    edges: Sequence[int] = (0, 15, 60),
+    labels: Optional[Sequence[str]] = None,
+    scalar: DateUnit = "Y",
+    output: Literal["pandas", "arrow"] = "pandas",
+) -> Union[pd.Series, pa.DictionaryArray]:
+    """
+    Bucketing the difference between two dates/timestamps (age) into bands.
+
+    Bands are `[edges[i], edges[i + 1])` and the last band is `[edges[-1], ...)`,
+    a value lower than `edges[0]` or null is null.
+
+    Parameters:
+        start_dt (DateLike): The start date/timestamp (birth date).
+        ended_dt (DateLike): The end date/timestamp.
+        edges (Sequence[int]): The increasing lower bounds of bands. Defaults to (0, 15, 60).
+        labels (Optional[Sequence[str]]): Label of each band, default like "0-14", "15-59", "60+".
+        scalar (Literal["Y", "M", "W", "D", "h", "m", "s", "ms"]): The unit of the difference. Defaults to "Y".
+        output (Literal["pandas", "arrow"]): Type of result.
+            "pandas": Series of `category` with the index of the input Series (default),
+            "arrow": `pa.DictionaryArray` of string.
+
+    Returns:
+        Union[pd.Series, pa.DictionaryArray]: The label of band of each row.
+
+    Example:
+        >>> age_band(df["birth_date"], date.today(), edges=[0, 5, 15, 25, 60])
+    """
+    bounds = np.asarray(edges, dtype=np.int64)
+    if bounds.ndim != 1 or len(bounds) == 0 or np.any(np.diff(bounds) <= 0):
+        raise ValueError("edges must be a non-empty increasing sequence")
+    if labels is None:
+        labels = [f"{lo}-{hi - 1}" for lo, hi in zip(bounds[:-1], bounds[1:])] + [f"{bounds[-1]}+"]
+    elif len(labels) != len(bounds):
+        raise ValueError("labels must have the same length as edges")
+
+    diff = datediff(start_dt, ended_dt, scalar, output="arrow")
+    if isinstance(diff, pa.ChunkedArray):
+        diff = diff.combine_chunks()
+    valid = compute.is_valid(diff).to_numpy(zero_copy_only=False)
+    values = diff.fill_null(bounds[0] - 1).to_numpy()
+    lowest = bounds[0] - 1
+    if bounds[-1] - lowest < _BAND_TABLE_SIZE:
+        # small range of edges (age in years): lookup table instead of binary search of each value
+        table = np.searchsorted(bounds, np.arange(lowest, bounds[-1] + 1), side="right") - 1
+        codes = table[np.clip(values, lowest, bounds[-1]) - lowest]
     else:
-        return pd.Series()
-
-    to_dt: Union[pa.Array, pa.Scalar]
-    if isinstance(ended_dt, pd.Series):
-        to_dt = pa.array(pa.array(ended_dt), type=pa_type)
-    elif isinstance(ended_dt, datetime):
-        to_dt = pa.scalar(ended_dt, type=pa_type)
-    elif isinstance(ended_dt, date):
-        to_dt = pa.scalar(datetime.combine(ended_dt, datetime.min.time()), type=pa_type)
-    elif isinstance(ended_dt, pa.Array) or isinstance(ended_dt, pa.Scalar):
-        to_dt = ended_dt
+        codes = np.searchsorted(bounds, values, side="right") - 1
+    valid &= codes >= 0
+
+    if output == "pandas":
+        codes = np.where(valid, codes, -1)
+        return pd.Series(
+            pd.Categorical.from_codes(codes, categories=list(labels), ordered=True), index=_series_index(start_dt, ended_dt)
+        )
+    indices = pa.array(codes.astype(np.int8 if len(bounds) < 128 else np.int32), mask=~valid)
+    return pa.DictionaryArray.from_arrays(indices, pa.array(list(labels), pa.string()), ordered=True)
+
+
+BE_OFFSET = 543
+THAI_MONTHS = (
+    "มกราคม",
+    "กุมภาพันธ์",
+    "มีนาคม",
+    "เมษายน",
+    "พฤษภาคม",
+    "มิถุนายน",
+    "กรกฎาคม",
+    "สิงหาคม",
+    "กันยายน",
+    "ตุลาคม",
+    "พฤศจิกายน",
+    "ธันวาคม",
+)
+THAI_MONTHS_ABBR = ("ม.ค.", "ก.พ.", "มี.ค.", "เม.ย.", "พ.ค.", "มิ.ย.", "ก.ค.", "ส.ค.", "ก.ย.", "ต.ค.", "พ.ย.", "ธ.ค.")
+ThaiDateFormat = Literal["infer", "YYYYMMDD", "DD/MM/YYYY", "YYYY-MM-DD", "DD MMMM YYYY"]
+
+_THAI_DATE_PATTERNS = {
+    "YYYYMMDD": r"^(?P<year>\d{4})(?P<month>\d{2})(?P<day>\d{2})$",
+    "DD/MM/YYYY": r"^(?P<day>\d{1,2})[/.\-](?P<month>\d{1,2})[/.\-](?P<year>\d{4})$",
+    "YYYY-MM-DD": r"^(?P<year>\d{4})[/.\-](?P<month>\d{1,2})[/.\-](?P<day>\d{1,2})$",
+    "DD MMMM YYYY": r"^(?P<day>\d{1,2})\s*(?P<month>[^\d\s]+)\s*(?:พ\.ศ\.\s*)?(?P<year>\d{4}|\d{2})$",
+}
+# full and abbreviated month names without "." (index % 12 is the month)
+_THAI_MONTH_KEYS = pa.array([name.replace(".", "") for name in THAI_MONTHS + THAI_MONTHS_ABBR])
+_DETECT_SAMPLE_SIZE = 1000
+_DAYS_IN_MONTH = np.array([31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31], dtype=np.int32)
+_SEPARATOR_BYTES = np.frombuffer(b"/.-", dtype=np.uint8)
+# width, (start, stop) of fields, positions of separators
+_FIXED_LAYOUTS = {
+    "YYYYMMDD": (8, {"year": (0, 4), "month": (4, 6), "day": (6, 8)}, ()),
+    "DD/MM/YYYY": (10, {"day": (0, 2), "month": (3, 5), "year": (6, 10)}, (2, 5)),
+    "YYYY-MM-DD": (10, {"year": (0, 4), "month": (5, 7), "day": (8, 10)}, (4, 7)),
+}
+
+
+def _to_arrow_text(values: Union[pd.Series, pa.Array, pa.ChunkedArray]) -> Union[pa.Array, pa.ChunkedArray]:
+    if isinstance(values, pd.Series):
+        if isinstance(values.dtype, pd.ArrowDtype):
+            values = values.array.__arrow_array__()
+        else:
+            values = pa.array(values, from_pandas=True)
+    if pa.types.is_dictionary(values.type):
+        values = values.cast(values.type.value_type)
+    if not (pa.types.is_string(values.type) or pa.types.is_large_string(values.type)):
+        values = values.cast(pa.string())
+    return values
+
+
+def _detect_thai_format(text: pa.Array) -> Optional[str]:
+    """
+    Format which matches the most of the first non-null values of a chunk.
+    """
+    sample = text.drop_null().slice(0, _DETECT_SAMPLE_SIZE)
+    best, best_count = None, 0
+    for name, pattern in _THAI_DATE_PATTERNS.items():
+        count = compute.sum(compute.match_substring_regex(sample, pattern)).as_py() or 0
+        if count > best_count:
+            best, best_count = name, count
+    return best
+
+
+def _date_from_parts(year: np.ndarray, month: np.ndarray, day: np.ndarray, valid: np.ndarray) -> pa.Array:
+    """
+    date32 array from Buddhist-era year, month and day, null if the date is invalid.
+
+    Days since epoch by the integer civil calendar algorithm (no datetime64 conversion).
+    """
+    year = np.where(valid, year - BE_OFFSET, 1970)
+    valid &= (year >= 1) & (month >= 1) & (month <= 12) & (day >= 1)
+    month = np.where(valid, month, 1)
+    leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+    valid &= day <= _DAYS_IN_MONTH[month - 1] + (leap & (month == 2))
+
+    y = year - (month <= 2)
+    era = y // 400
+    yoe = y - era * 400
+    doy = (153 * ((month + 9) % 12) + 2) // 5 + day - 1
+    days = era * 146097 + yoe * 365 + yoe // 4 - yoe // 100 + doy - 719468
+    return pa.array(np.where(valid, days, 0).astype(np.int32), type=pa.date32(), mask=~valid)
+
+
+def _parse_fixed_width(chunk: pa.Array, fmt: str) -> Optional[pa.Array]:
+    """
+    Fast path of the numeric formats when every value has the same width (`25670315`, `15/03/2567`):
+    digits are read from the data buffer directly.
+
+    Returns:
+        Optional[pa.Array]: None if a value has another width
+    """
+    layout = _FIXED_LAYOUTS.get(fmt)
+    if layout is None or len(chunk) == 0:
+        return None
+    width, fields, separators = layout
+    offset_type = np.int64 if pa.types.is_large_string(chunk.type) else np.int32
+    _, offsets_buf, data_buf = chunk.buffers()
+    if data_buf is None:
+        return None
+    offsets = np.frombuffer(offsets_buf, dtype=offset_type)[chunk.offset : chunk.offset + len(chunk) + 1]
+    lengths = np.diff(offsets)
+    valid = chunk.is_valid().to_numpy(zero_copy_only=False) if chunk.null_count else np.ones(len(chunk), bool)
+    if np.any(lengths[valid] != width):
+        return None
+
+    rows = None if chunk.null_count == 0 else np.flatnonzero(valid)
+    n_rows = len(chunk) if rows is None else len(rows)
+    if offsets[-1] - offsets[0] != n_rows * width:
+        # a null row with data
+        return None
+    # the valid rows are contiguous in the data buffer
+    data = np.frombuffer(data_buf, dtype=np.uint8)
+    matrix = data[offsets[0] : offsets[0] + n_rows * width].reshape(-1, width)
+    valid = np.ones(n_rows, dtype=bool)
+    # column-major digits: each position is contiguous, uint8 wraps the non-digit bytes to > 9
+    digits = matrix.T - np.uint8(48)
+    for i in range(width):
+        if i in separators:
+            valid &= np.isin(matrix[:, i], _SEPARATOR_BYTES)
+        else:
+            valid &= digits[i] <= 9
+
+    def number(start: int, stop: int) -> np.ndarray:
+        value = digits[start].astype(np.int32)
+        for i in range(start + 1, stop):
+            value = value * 10 + digits[i]
+        return value
+
+    year, month, day = number(*fields["year"]), number(*fields["month"]), number(*fields["day"])
+    if rows is not None:
+        # back to the position of rows
+        year, month, day, valid = (_expand(values, rows, len(chunk)) for values in (year, month, day, valid))
+    return _date_from_parts(year, month, day, valid)
+
+
+def _expand(values: np.ndarray, rows: np.ndarray, size: int) -> np.ndarray:
+    result = np.zeros(size, dtype=values.dtype)
+    result[rows] = values
+    return result
+
+
+def _pivot_two_digit_year(year: np.ndarray) -> np.ndarray:
+    """
+    Expands 2 digits years to the latest Buddhist-era year not after the current one
+    (in 2567: 67 -> 2567, 68 -> 2468, 99 -> 2499), a date is not in the future by its year.
+    """
+    current = date.today().year + BE_OFFSET
+    expanded = current // 100 * 100 + year
+    expanded = np.where(expanded > current, expanded - 100, expanded)
+    return np.where(year < 100, expanded, year)
+
+
+def _parse_thai_chunk(chunk: pa.Array, date_format: ThaiDateFormat) -> pa.Array:
+    fmt = _detect_thai_format(chunk) if date_format == "infer" else date_format
+    if fmt is not None:
+        result = _parse_fixed_width(chunk, fmt)
+        if result is not None:
+            return result
+    text = compute.utf8_trim_whitespace(chunk)
+    if date_format == "infer":
+        fmt = _detect_thai_format(text)
+    if fmt is None:
+        return pa.nulls(len(chunk), pa.date32())
+    result = _parse_fixed_width(text, fmt)
+    if result is not None:
+        return result
+    pattern = _THAI_DATE_PATTERNS[fmt]
+
+    if fmt == "YYYYMMDD":
+        matched = compute.match_substring_regex(text, pattern)
+        number = compute.if_else(matched, text, pa.scalar(None, text.type)).cast(pa.int64())
+        valid = number.is_valid().to_numpy(zero_copy_only=False)
+        number = number.fill_null(0).to_numpy()
+        return _date_from_parts(number // 10000, number // 100 % 100, number % 100, valid)
+
+    parts = compute.extract_regex(text, pattern)
+    valid = parts.is_valid().to_numpy(zero_copy_only=False)
+
+    def field(name: str) -> np.ndarray:
+        # struct_field: null of the unmatched rows (the child of null struct is "")
+        return compute.struct_field(parts, name).cast(pa.int64()).fill_null(0).to_numpy()
+
+    year, day = field("year"), field("day")
+    if fmt == "DD MMMM YYYY":
+        year = _pivot_two_digit_year(year)
+        names = compute.replace_substring(compute.struct_field(parts, "month"), ".", "")
+        index = compute.index_in(names, value_set=_THAI_MONTH_KEYS)
+        valid &= index.is_valid().to_numpy(zero_copy_only=False)
+        month = index.fill_null(0).to_numpy().astype(np.int64) % 12 + 1
     else:
-        return pd.Series()
-
-    sr: pa.Array
-    if scalar == "Y":
-        sr = pa.compute.years_between(fr_dt, to_dt)
-    elif scalar == "M":
-        sr = pa.compute.months_between(fr_dt, to_dt)
-    elif scalar == "D":
-        sr = pa.compute.days_between(fr_dt, to_dt)
-    elif scalar == "W":
-        sr = pa.compute.weeks_between(fr_dt, to_dt)
-    elif scalar == "h":
-        sr = pa.compute.hours_between(fr_dt, to_dt)
-    elif scalar == "m":
-        sr = pa.compute.minutes_between(fr_dt, to_dt)
-    elif scalar == "s":
-        sr = pa.compute.seconds_between(fr_dt, to_dt)
-    elif scalar == "ms":
-        sr = pa.compute.milliseconds_between(fr_dt, to_dt)
+        month = field("month")
+    return _date_from_parts(year, month, day, valid)
+
+
+def parse_thai_date(
+    values: Union[pd.Series, pa.Array, pa.ChunkedArray],
+    date_format: ThaiDateFormat = "infer",
+    pa_type: pa.DataType = pa.date32(),
+    output: Literal["arrow", "pandas"] = "arrow",
+) -> Union[pa.Array, pa.ChunkedArray, pd.Series]:
+    """
+    Parse Buddhist-era (พ.ศ.) date strings to Arrow dates/timestamps (year - 543) in bulk.
+
+    Support formats:
+        - "YYYYMMDD": `25670315`
+        - "DD/MM/YYYY": `15/03/2567`, `15-3-2567`, `15.03.2567`
+        - "YYYY-MM-DD": `2567-03-15`
+        - "DD MMMM YYYY": `15 มีนาคม 2567`, `15 มี.ค. 67`, `15 มี.ค. พ.ศ. 2567`
+          (a 2 digits year is the latest year ending in those digits up to the current year)
+
+    The format is detected once per chunk (from the first values) if `date_format` is "infer".
+    Invalid dates and values which do not match the format are null.
+    The result can be passed to `datediff` directly.
+
+    Parameters:
+        values (Union[pd.Series, pa.Array, pa.ChunkedArray]): Date strings (or integers of "YYYYMMDD").
+        date_format (Literal["infer", "YYYYMMDD", "DD/MM/YYYY", "YYYY-MM-DD", "DD MMMM YYYY"]): Defaults to "infer".
+        pa_type (pa.DataType): Type of result, `pa.date32()` or a timestamp type. Defaults to `pa.date32()`.
+        output (Literal["arrow", "pandas"]): "arrow": `pa.Array` / `pa.ChunkedArray` same as input (default),
+            "pandas": Series of `ArrowDtype`.
+
+    Returns:
+        Union[pa.Array, pa.ChunkedArray, pd.Series]: The parsed dates, null if invalid.
+
+    Example:
+        >>> admit = parse_thai_date(df["admit_date"])
+        >>> datediff(parse_thai_date(df["birth_date"]), admit, "Y")
+    """
+    if date_format != "infer" and date_format not in _THAI_DATE_PATTERNS:
+        raise ValueError(f"date format not support: {date_format}")
+    text = _to_arrow_text(values)
+    if isinstance(text, pa.ChunkedArray):
+        result = pa.chunked_array([_parse_thai_chunk(chunk, date_format) for chunk in text.chunks], type=pa.date32())
     else:
-        return pd.Series()
-    return sr.to_pandas(types_mapper=pd.ArrowDtype)
+        result = _parse_thai_chunk(text, date_format)
+    if pa_type != pa.date32():
+        result = result.cast(pa_type)
+    if output == "pandas":
+        index = values.index if isinstance(values, pd.Series) else None
+        return pd.Series(result.to_pandas(types_mapper=pd.ArrowDtype).array, index=index)
+    return result
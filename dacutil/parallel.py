@@ -0,0 +1,217 @@
+import math
+import os
+import tempfile
+from functools import partial
+from typing import Any, Callable, Literal, Mapping, Optional, Union
+
+import pandas as pd
+import pyarrow as pa
+from pandas import DataFrame, Series
+
+from dacutil.worker import worker_imap
+
+Frame = Union[DataFrame, pa.Table, pa.RecordBatch]
+
+# rows of a partition at least (small frames are not split)
+MIN_PARTITION_ROWS = 1 << 16
+_SERIES_COLUMN = "__series__"
+_ARRAY_COLUMN = "__array__"
+
+
+def _partition_bounds(n_rows: int, n_jobs: int, partitions: Optional[int]) -> list[tuple[int, int]]:
+    if partitions is None:
+        partitions = min(n_jobs * 2, math.ceil(n_rows / MIN_PARTITION_ROWS))
+    partitions = max(1, min(partitions, n_rows))
+    size = math.ceil(n_rows / partitions) if n_rows else 0
+    return [(start, min(size, n_rows - start)) for start in range(0, n_rows, size or 1)]
+
+
+def _slice(df: Frame, offset: int, length: int) -> Frame:
+    if isinstance(df, DataFrame):
+        return df.iloc[offset : offset + length]
+    return df.slice(offset, length)
+
+
+def _combine(results: list[Any]) -> Any:
+    """
+    Concatenates the results of partitions (DataFrame / Series, Table / RecordBatch, Array / ChunkedArray),
+    a list of results for other types.
+    """
+    if not results:
+        return results
+    first = results[0]
+    if isinstance(first, (DataFrame, Series)):
+        return pd.concat(results)
+    if isinstance(first, (pa.Table, pa.RecordBatch)):
+        tables = [pa.Table.from_batches([r]) if isinstance(r, pa.RecordBatch) else r for r in results]
+        table = pa.concat_tables(tables)
+        return table.combine_chunks().to_batches()[0] if isinstance(first, pa.RecordBatch) else table
+    if isinstance(first, (pa.Array, pa.ChunkedArray)):
+        return pa.chunked_array(
+            [chunk for r in results for chunk in (r.chunks if isinstance(r, pa.ChunkedArray) else [r])],
+            type=first.type,
+        )
+    return results
+
+
+def _write_ipc(table: pa.Table, path: str) -> None:
+    with pa.OSFile(path, "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+
+
+def _write_partitions(table: pa.Table, path: str, bounds: list[tuple[int, int]]) -> None:
+    """
+    Writes an Arrow IPC file of one record batch per partition (batch `i` is the rows of `bounds[i]`).
+    """
+    with pa.OSFile(path, "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        for offset, length in bounds:
+            columns = [col.combine_chunks() for col in table.slice(offset, length).columns]
+            writer.write_batch(pa.RecordBatch.from_arrays(columns, schema=table.schema))
+
+
+def _result_to_ipc(result: Any, path: str) -> tuple[str, Any]:
+    """
+    Writes a result of a partition to an Arrow IPC file.
+
+    Returns:
+        tuple[str, Any]: (kind, name of a Series), kind "object" returns the result itself (pickled)
+    """
+    if isinstance(result, DataFrame):
+        _write_ipc(pa.Table.from_pandas(result, preserve_index=True), path)
+        return "DataFrame", None
+    if isinstance(result, Series):
+        _write_ipc(pa.Table.from_pandas(result.to_frame(_SERIES_COLUMN), preserve_index=True), path)
+        return "Series", result.name
+    if isinstance(result, (pa.Table, pa.RecordBatch)):
+        table = pa.Table.from_batches([result]) if isinstance(result, pa.RecordBatch) else result
+        _write_ipc(table, path)
+        return type(result).__name__, None
+    if isinstance(result, (pa.Array, pa.ChunkedArray)):
+        _write_ipc(pa.table({_ARRAY_COLUMN: result}), path)
+        return "Array", None
+    return "object", result
+
+
+def _result_from_ipc(kind: str, name: Any, path: str) -> Any:
+    # read into memory (not memory-mapped), the file is removed after the run
+    with pa.OSFile(path) as source:
+        table = pa.ipc.open_file(source).read_all()
+    if kind == "DataFrame":
+        return table.to_pandas()
+    if kind == "Series":
+        return table.to_pandas()[_SERIES_COLUMN].rename(name)
+    if kind == "RecordBatch":
+        return table.combine_chunks().to_batches()[0]
+    if kind == "Array":
+        return table.column(_ARRAY_COLUMN)
+    return table
+
+
+def _call(func: Callable, df: Frame) -> Any:
+    return func(df)
+
+
+def _apply_partition(func: Callable, source: str, index: int, frame_type: str, result_path: str) -> tuple[str, Any]:
+    """
+    Runs `func` on record batch `index` of the memory-mapped Arrow IPC file `source` (in a worker process)
+    and writes the result to `result_path`.
+    """
+    with pa.memory_map(source) as mapped:
+        batch = pa.ipc.open_file(mapped).get_batch(index)
+        if frame_type == "DataFrame":
+            partition = pa.Table.from_batches([batch]).to_pandas()
+        elif frame_type == "Table":
+            partition = pa.Table.from_batches([batch])
+        else:
+            partition = batch
+        result = func(partition)
+        # the result may share buffers of the mapped file, written before it is closed
+        return _result_to_ipc(result, result_path)
+
+
+def _shared_dir() -> Optional[str]:
+    # /dev/shm: the IPC files stay in memory
+    return "/dev/shm" if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK) else None
+
+
+def parallel_apply(
+    df: Frame,
+    func: Callable,
+    n_jobs: int = os.cpu_count() or 1,
+    executor: Literal["thread", "process"] = "thread",
+    partitions: Optional[int] = None,
+    func_kwargs: Optional[Mapping[str, Any]] = None,
+) -> Any:
+    """
+    Partitions a DataFrame or a pyarrow Table / RecordBatch by rows, runs `func` on each partition in parallel
+    and concatenates the results in the order of rows.
+
+    "thread": partitions are zero-copy slices (`iloc` / `slice`), best for pyarrow / numpy based functions
+    which release the GIL (`df_fixchar` of Arrow columns, `datediff`, `check_mod11_array`).
+
+    "process": the frame is written once to a memory-mapped Arrow IPC file (in `/dev/shm` if available),
+    each process maps its record batch without a copy and writes its result to an IPC file, no frame is pickled.
+    `func` must be picklable (a function of a module) and the pandas dtypes must round trip through Arrow.
+
+    `func` is called with partitions only (one slice of all the rows with `n_jobs=1`), never with `df` itself.
+
+    Args:
+        df (Union[DataFrame, pa.Table, pa.RecordBatch]): The data.
+        func (Callable): Called with a partition (same type as `df`) and `func_kwargs`, returns a DataFrame / Series,
+            a Table / RecordBatch or an Array / ChunkedArray (concatenated), anything else is returned as a list.
+        n_jobs (int): Number of threads / processes. Defaults to `os.cpu_count()`.
+        executor (Literal["thread", "process"]): Defaults to "thread".
+        partitions (int, optional): Number of partitions. Defaults to `n_jobs * 2`
+            (partitions of at least `MIN_PARTITION_ROWS` rows).
+        func_kwargs (Mapping[str, Any], optional): Keyword arguments of `func`. Defaults to None.
+
+    Returns:
+        Any: The concatenated results.
+
+    Example:
+        >>> df = parallel_apply(df, df_fixchar, n_jobs=16)
+        >>> valid = parallel_apply(df, lambda d: check_mod11_array(d["cid"]), n_jobs=8)
+    """
+    if func_kwargs:
+        func = partial(func, **func_kwargs)
+    bounds = _partition_bounds(len(df), n_jobs, partitions)
+    if n_jobs <= 1 or len(bounds) <= 1:
+        # a slice as the partitions, a DataFrame modified in place by `func` is not the caller's
+        return func(_slice(df, 0, len(df)))
+
+    if executor == "thread":
+        values = ({"func": func, "df": _slice(df, offset, length)} for offset, length in bounds)
+        return _combine(list(worker_imap(n_jobs, _call, values, chunksize=1)))
+    if executor != "process":
+        raise ValueError(f"executor not support: {executor}")
+
+    frame_type = type(df).__name__
+    if isinstance(df, DataFrame):
+        table = pa.Table.from_pandas(df, preserve_index=True)
+    else:
+        table = pa.Table.from_batches([df]) if isinstance(df, pa.RecordBatch) else df
+    with tempfile.TemporaryDirectory(prefix="dacutil-", dir=_shared_dir()) as tmp:
+        source = os.path.join(tmp, "source.arrow")
+        _write_partitions(table, source, bounds)
+        del table
+        values = (
+            {
+                "func": func,
+                "source": source,
+                "index": index,
+                "frame_type": frame_type,
+                "result_path": os.path.join(tmp, f"result-{index}.arrow"),
+            }
+            for index in range(len(bounds))
+        )
+        results = []
+        for index, (kind, value) in enumerate(
+            worker_imap(n_jobs, _apply_partition, values, executor="process", chunksize=1)
+        ):
+            if kind == "object":
+                results.append(value)
+            else:
+                path = os.path.join(tmp, f"result-{index}.arrow")
+                results.append(_result_from_ipc(kind, value, path))
+                os.remove(path)
+    return _combine(results)
@@ -1,4 +1,20 @@
-from pandas import DataFrame
+import operator
+import os
+import re
+import tempfile
+from collections import deque
+from itertools import chain
+from multiprocessing.pool import ThreadPool
+from typing import Callable, Iterable, Iterator, Literal, TypeVar
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from pandas import DataFrame, Series
 
 
 # Character X00 is error character
@@ -7,83 +23,830 @@ CHAR_TAB = r"\t"
 CHAR_RET = r"\r"
 CHAR_NEWLINE = r"\n"
 
+# replacements of df_fixchar (after strip), one character at a time
+FIXCHAR_REPLACE: list[tuple[str, str]] = [("\x00", ""), ("\r", " "), ("\n", " "), ("\t", "    ")]
+
+# input of strutil functions, the result has the same type
+DataFrameLike = DataFrame | pa.Table | pa.RecordBatch
+ArrowArray = pa.Array | pa.ChunkedArray
+
+# rows per task when a pyarrow column is split for parallel execution (n_jobs > 1)
+PARALLEL_CHUNK_SIZE = 1 << 18
+
+# rows per batch of the streaming cleaner (clean_batches, clean_file)
+STREAM_BATCH_SIZE = 1 << 17
+
+# regex features not supported by RE2 (pyarrow): lookaround and backreference
+_RE2_UNSUPPORTED = re.compile(r"\(\?<?[=!]|\(\?P=|\\[1-9]")
+
+# a regex of one character: `\xNN`, `\t`, `\r`, `\n`, an escaped or a plain (not special) character
+_LITERAL_CHAR = re.compile(r"\\x[0-9a-fA-F]{2}|\\[trn]|\\[^\w\s]|[^\\.^$*+?{}\[\]|()]")
+
+# bytes of the characters replaced by df_fixchar
+_FIXCHAR_BYTES = frozenset(ord(char) for char, _ in FIXCHAR_REPLACE)
 
-def df_strip(df: DataFrame, columns: list[str] | None = None) -> DataFrame:
+
+def df_strip(
+    df: DataFrameLike, columns: list[str] | None = None, n_jobs: int = 1, counts: dict[str, int] | None = None
+) -> DataFrameLike:
     """
     Trim space in string column
 
     ตัดช่องว่าง หน้าหลังของคอลัมน์
 
     Args:
-        df (DataFrame): DataFrame
+        df (DataFrame | pa.Table | pa.RecordBatch): DataFrame
+        columns (list[str] | None, optional): The list of columns to trim. If None, string columns are selected by default. Defaults to None.
+        n_jobs (int, optional): Number of threads for pyarrow string columns, -1 is all CPUs. Defaults to 1.
+        counts (dict[str, int] | None, optional): If given, filled with the number of changed rows of each column. Defaults to None.
 
     Returns:
-        df (DataFrame): DataFrame
+        df (DataFrame | pa.Table | pa.RecordBatch): DataFrame
     """
-    if columns is None:
-        columns = df.select_dtypes(["string"]).columns.tolist()
-    for col in columns:
-        if df[col].empty or not hasattr(df[col], "str"):
-            continue
-        df[col] = df[col].str.strip()
-    return df
+    return _apply_columns(df, columns, _arrow_strip, _series_strip, n_jobs=n_jobs, counts=counts)
 
 
-def df_remove_char_error(df: DataFrame, regex_remove=CHAR_X00, columns: list[str] | None = None) -> DataFrame:
+def df_remove_char_error(
+    df: DataFrameLike,
+    regex_remove=CHAR_X00,
+    columns: list[str] | None = None,
+    n_jobs: int = 1,
+    counts: dict[str, int] | None = None,
+) -> DataFrameLike:
     """
     Removes a specified character or sequence of characters from string columns in the DataFrame.
 
     Parameters:
-        df (DataFrame): The input DataFrame.
+        df (DataFrame | pa.Table | pa.RecordBatch): The input DataFrame.
         regex_remove (str, optional): The regular expression pattern to remove. Defaults to "\\x00".
         columns (list[str] | None, optional): The list of columns to apply the regex pattern to. If None, string columns are selected by default. Defaults to None.
+        n_jobs (int, optional): Number of threads for pyarrow string columns, -1 is all CPUs. Defaults to 1.
+        counts (dict[str, int] | None, optional): If given, filled with the number of changed rows of each column. Defaults to None.
 
     Returns:
-        DataFrame: The DataFrame with the specified characters removed from the specified columns.
+        DataFrame | pa.Table | pa.RecordBatch: The DataFrame with the specified characters removed from the specified columns.
     """
-    if columns is None:
-        columns = df.select_dtypes(["string"]).columns.tolist()
-    for col in columns:
-        if df[col].empty or not hasattr(df[col], "str"):
-            continue
-        df[col] = df[col].str.replace(regex_remove, "", regex=True)
-    return df
+    return df_replace(df, regex_remove, "", columns=columns, n_jobs=n_jobs, counts=counts)
 
 
-def df_replace(df: DataFrame, regex, replace="", columns: list[str] | None = None) -> DataFrame:
+def df_replace(
+    df: DataFrameLike,
+    regex,
+    replace="",
+    columns: list[str] | None = None,
+    n_jobs: int = 1,
+    counts: dict[str, int] | None = None,
+) -> DataFrameLike:
     """
     Replaces occurrences of a specified regular expression pattern in string columns of a DataFrame with a given replacement string.
 
     Parameters:
-        df (DataFrame): The input DataFrame.
+        df (DataFrame | pa.Table | pa.RecordBatch): The input DataFrame.
         regex (str): The regular expression pattern to search for.
         replace (str, optional): The replacement string. Defaults to an empty string.
         columns (list[str] | None, optional): The list of columns to apply the regex pattern to. If None, string columns are selected by default. Defaults to None.
+        n_jobs (int, optional): Number of threads for pyarrow string columns, -1 is all CPUs. Defaults to 1.
+        counts (dict[str, int] | None, optional): If given, filled with the number of changed rows of each column. Defaults to None.
+
+    Returns:
+        DataFrame | pa.Table | pa.RecordBatch: The DataFrame with the specified occurrences of the regex pattern replaced in the specified columns.
+    """
+    return _apply_columns(
+        df,
+        columns,
+        lambda arr: _arrow_replace(arr, regex, replace),
+        lambda sr: _series_replace(sr, regex, replace),
+        n_jobs=n_jobs,
+        counts=counts,
+    )
+
+
+def _is_arrow_string(dtype) -> bool:
+    """
+    Checks the dtype is string backed by pyarrow (`string[pyarrow]`, `str` or `ArrowDtype`).
+    """
+    if isinstance(dtype, pd.ArrowDtype):
+        return _is_arrow_string_type(dtype.pyarrow_dtype)
+    return isinstance(dtype, pd.StringDtype) and dtype.storage != "python"
+
+
+def _is_arrow_string_type(pa_type: pa.DataType) -> bool:
+    """
+    Checks the pyarrow type is string, large_string or dictionary of string.
+    """
+    if pa.types.is_dictionary(pa_type):
+        pa_type = pa_type.value_type
+    return pa.types.is_string(pa_type) or pa.types.is_large_string(pa_type)
+
+
+def _is_string_category(dtype) -> bool:
+    return isinstance(dtype, pd.CategoricalDtype) and dtype.categories.inferred_type == "string"
+
+
+def _string_columns(df: DataFrameLike) -> list[str]:
+    """
+    String columns of a DataFrame (`string` dtype, `ArrowDtype` string and `category` of strings)
+    or a pyarrow Table / RecordBatch (string and dictionary of string).
+    """
+    if isinstance(df, (pa.Table, pa.RecordBatch)):
+        return [field.name for field in df.schema if _is_arrow_string_type(field.type)]
+    columns = df.select_dtypes(["string"]).columns.tolist()
+    # select_dtypes(["string"]) of pandas < 3 not include ArrowDtype string
+    columns += [
+        col
+        for col, dtype in df.dtypes.items()
+        if col not in columns and (_is_arrow_string(dtype) or _is_string_category(dtype))
+    ]
+    return columns
+
+
+def _apply_columns(
+    df: DataFrameLike,
+    columns: list[str] | None,
+    arrow_func: Callable[[pa.Array], tuple[pa.Array, int]],
+    series_func: Callable[[Series], tuple[Series, int]],
+    n_jobs: int = 1,
+    counts: dict[str, int] | None = None,
+) -> DataFrameLike:
+    """
+    Applies a string transform to the columns.
+
+    pyarrow Table / RecordBatch and pyarrow backed pandas columns use `arrow_func`
+    (pyarrow compute kernels, the result buffers are handed back to pandas without a copy),
+    other pandas columns use `series_func`. A column with no changed row is not replaced
+    (keeps the original buffers).
+
+    `category` and dictionary columns are cleaned on the categories (dictionary values)
+    only and the codes are remapped, the column stays categorical.
+
+    With `n_jobs` > 1 the pyarrow columns are split by rows and run in a thread pool
+    (pyarrow compute releases the GIL), Python string columns still run one by one.
+
+    Args:
+        df (DataFrame | pa.Table | pa.RecordBatch): The input DataFrame.
+        columns (list[str] | None): The list of columns. If None, string columns are selected.
+        arrow_func (Callable[[pa.Array], tuple[pa.Array, int]]): transform of a pyarrow string array, returns (result, changed rows)
+        series_func (Callable[[Series], tuple[Series, int]]): transform of a pandas string Series, returns (result, changed rows)
+        n_jobs (int): Number of threads, -1 is all CPUs. Defaults to 1.
+        counts (dict[str, int] | None): If given, filled with the number of changed rows of each column.
 
     Returns:
-        DataFrame: The DataFrame with the specified occurrences of the regex pattern replaced in the specified columns.
+        DataFrame | pa.Table | pa.RecordBatch: same type as input
     """
     if columns is None:
-        columns = df.select_dtypes(["string"]).columns.tolist()
+        columns = _string_columns(df)
+
+    if isinstance(df, (pa.Table, pa.RecordBatch)):
+        arrays = list(df.columns)
+        # as the DataFrame path, non-string columns are left as they are
+        columns = [col for col in columns if _is_arrow_string_type(df.schema.field(col).type)]
+        index = [df.schema.get_field_index(col) for col in columns]
+        for col, i, (result, changed) in zip(columns, index, _run_arrow([arrays[i] for i in index], arrow_func, n_jobs)):
+            if counts is not None:
+                counts[col] = changed
+            if isinstance(df, pa.RecordBatch) and isinstance(result, pa.ChunkedArray):
+                result = result.combine_chunks()
+            arrays[i] = result
+        return type(df).from_arrays(arrays, schema=df.schema)
+
+    arrow_columns: list[str] = []
     for col in columns:
-        if df[col].empty or not hasattr(df[col], "str"):
+        sr = df[col]
+        # a duplicated column name selects a DataFrame, left as it is
+        if not isinstance(sr, Series) or sr.empty:
+            continue
+        if isinstance(sr.dtype, pd.CategoricalDtype):
+            if not _is_string_category(sr.dtype):
+                continue
+            result, changed = _categorical(sr, arrow_func, series_func)
+        elif _is_arrow_string(sr.dtype):
+            arrow_columns.append(col)
             continue
-        df[col] = df[col].str.replace(regex, replace, regex=True)
+        elif hasattr(sr, "str"):
+            result, changed = series_func(sr)
+        else:
+            continue
+        if counts is not None:
+            counts[col] = changed
+        if changed:
+            df[col] = result
+
+    arrays = [df[col].array.__arrow_array__() for col in arrow_columns]
+    for col, (result, changed) in zip(arrow_columns, _run_arrow(arrays, arrow_func, n_jobs)):
+        if counts is not None:
+            counts[col] = changed
+        if changed:
+            sr = df[col]
+            df[col] = Series(sr.dtype.__from_arrow__(result), index=sr.index, name=sr.name)
     return df
 
 
-def df_fixchar(df: DataFrame) -> DataFrame:
+def _run_arrow(
+    arrays: list[ArrowArray], arrow_func: Callable[[pa.Array], tuple[pa.Array, int]], n_jobs: int = 1
+) -> list[tuple[ArrowArray, int]]:
+    """
+    Runs `arrow_func` on every chunk of every array.
+
+    With `n_jobs` > 1 every array is sliced (zero-copy) in `PARALLEL_CHUNK_SIZE` rows,
+    the slices run in a thread pool and the results of an array are reassembled
+    as a ChunkedArray (no concatenation copy).
+
+    Args:
+        arrays (list[ArrowArray]): pyarrow string arrays
+        arrow_func (Callable[[pa.Array], tuple[pa.Array, int]]): transform of a pyarrow string array, returns (result, changed rows)
+        n_jobs (int): Number of threads, -1 is all CPUs. Defaults to 1.
+
+    Returns:
+        list[tuple[ArrowArray, int]]: (result, changed rows) in the same order, the result is the input array if no row changed
+    """
+    if n_jobs < 0:
+        n_jobs = os.cpu_count() or 1
+    chunk_size = PARALLEL_CHUNK_SIZE if n_jobs > 1 else None
+
+    pieces: list[list[pa.Array]] = []
+    for arr in arrays:
+        chunks = arr.chunks if isinstance(arr, pa.ChunkedArray) else [arr]
+        if chunk_size is None or pa.types.is_dictionary(arr.type):
+            # dictionary chunk: the dictionary is cleaned once, no need to split
+            pieces.append(list(chunks))
+        else:
+            pieces.append([chunk.slice(i, chunk_size) for chunk in chunks for i in range(0, len(chunk), chunk_size)])
+
+    def run(piece: pa.Array) -> tuple[pa.Array, int]:
+        if pa.types.is_dictionary(piece.type):
+            return _arrow_dictionary(piece, arrow_func)
+        return arrow_func(piece)
+
+    tasks = [piece for array_pieces in pieces for piece in array_pieces]
+    if n_jobs > 1 and tasks:
+        with ThreadPool(n_jobs) as pool:
+            results = pool.map(run, tasks, chunksize=1)
+    else:
+        results = [run(piece) for piece in tasks]
+
+    output: list[tuple[ArrowArray, int]] = []
+    start = 0
+    for arr, array_pieces in zip(arrays, pieces):
+        array_results = results[start : start + len(array_pieces)]
+        start += len(array_pieces)
+        changed = sum(n for _, n in array_results)
+        if changed == 0:
+            output.append((arr, 0))
+        elif isinstance(arr, pa.Array) and len(array_results) == 1:
+            output.append((array_results[0][0], changed))
+        else:
+            output.append((pa.chunked_array([result for result, _ in array_results], type=arr.type), changed))
+    return output
+
+
+def _arrow_dictionary(
+    chunk: pa.DictionaryArray, arrow_func: Callable[[pa.Array], tuple[pa.Array, int]]
+) -> tuple[pa.Array, int]:
+    """
+    Applies `arrow_func` to the dictionary values only and remaps the indices
+    (values which become equal after cleaning are merged).
+
+    Returns:
+        tuple[pa.Array, int]: (result, changed rows), the result is the input chunk if no value changed
+    """
+    dictionary = chunk.dictionary
+    cleaned, n_changed = arrow_func(dictionary)
+    if n_changed == 0:
+        return chunk, 0
+    changed = pc.fill_null(pc.not_equal(cleaned, dictionary), False)
+    encoded = pc.dictionary_encode(cleaned)
+    indices = pc.take(encoded.indices, chunk.indices).cast(chunk.type.index_type)
+    result = pa.DictionaryArray.from_arrays(indices, encoded.dictionary, ordered=chunk.type.ordered)
+    return result, pc.sum(pc.take(changed, chunk.indices)).as_py() or 0
+
+
+def _categorical(
+    sr: Series,
+    arrow_func: Callable[[pa.Array], tuple[pa.Array, int]],
+    series_func: Callable[[Series], tuple[Series, int]],
+) -> tuple[Series, int]:
+    """
+    Applies the transform to the categories only and remaps the codes
+    (categories which become equal after cleaning are merged).
+
+    Returns:
+        tuple[Series, int]: (categorical Series, changed rows)
+    """
+    categories = Series(sr.cat.categories)
+    if _is_arrow_string(categories.dtype):
+        ((result, n_changed),) = _run_arrow([categories.array.__arrow_array__()], arrow_func)
+        cleaned = pd.Index(categories.dtype.__from_arrow__(result))
+    else:
+        result_series, n_changed = series_func(categories)
+        cleaned = pd.Index(result_series)
+    if n_changed == 0:
+        return sr, 0
+
+    # categories cleaned to NA become missing values, equal ones are merged
+    uniques = cleaned.dropna().unique()
+    mapping = uniques.get_indexer(cleaned)
+    codes = sr.cat.codes.to_numpy()
+    new_codes = np.where(codes >= 0, mapping[codes], -1)
+    changed = cleaned.to_numpy(dtype=object) != categories.to_numpy(dtype=object)
+    result_categorical = pd.Categorical.from_codes(new_codes, categories=uniques, ordered=sr.cat.ordered)
+    return Series(result_categorical, index=sr.index, name=sr.name), int(changed[codes[codes >= 0]].sum())
+
+
+def _string_buffers(chunk: pa.Array) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Offsets and data bytes of a string / large_string array (zero-copy).
+    """
+    offset_type = np.int64 if pa.types.is_large_string(chunk.type) else np.int32
+    _, offsets_buf, data_buf = chunk.buffers()
+    offsets = np.frombuffer(offsets_buf, dtype=offset_type)[chunk.offset : chunk.offset + len(chunk) + 1]
+    if data_buf is None:
+        return offsets, np.zeros(0, dtype=np.uint8)
+    return offsets, np.frombuffer(data_buf, dtype=np.uint8)
+
+
+def _rows_with_bytes(chunk: pa.Array, byte_values: frozenset[int]) -> np.ndarray | None:
+    """
+    Finds the rows which contain any of the ASCII bytes (vectorized scan of the data buffer).
+
+    UTF-8 multi-byte characters never contain an ASCII byte, so the scan is exact.
+
+    Args:
+        chunk (pa.Array): string / large_string array
+        byte_values (frozenset[int]): ASCII bytes (0 - 127)
+
+    Returns:
+        np.ndarray | None: bool mask of the rows, None if no row contains the bytes
+    """
+    if len(chunk) == 0:
+        return None
+    offsets, data = _string_buffers(chunk)
+    data = data[offsets[0] : offsets[-1]]
+    (position,) = np.nonzero(data <= max(byte_values))
+    if len(position) == 0:
+        return None
+    position = position[np.isin(data[position], list(byte_values))]
+    if len(position) == 0:
+        return None
+    mask = np.zeros(len(chunk), dtype=bool)
+    mask[np.searchsorted(offsets, position + offsets[0], side="right") - 1] = True
+    return mask
+
+
+def _strip_candidates(chunk: pa.Array) -> np.ndarray | None:
+    """
+    Finds the rows which may need strip: start or end with an ASCII space / control
+    or a non-ASCII character (maybe a Unicode space).
+
+    Returns:
+        np.ndarray | None: bool mask of the rows, None if no row
+    """
+    if len(chunk) == 0:
+        return None
+    offsets, data = _string_buffers(chunk)
+    if len(data) == 0:
+        return None
+    starts, ends = offsets[:-1], offsets[1:]
+    first = np.take(data, starts, mode="clip")
+    last = np.take(data, ends - 1, mode="clip")
+    mask = (ends > starts) & ((first <= 32) | (first >= 127) | (last <= 32) | (last >= 127))
+    return mask if mask.any() else None
+
+
+def _replace_rows(
+    chunk: pa.Array, mask: np.ndarray | None, func: Callable[[pa.Array], pa.Array]
+) -> tuple[pa.Array, int]:
+    """
+    Applies `func` only to the rows of the mask, the other rows are copied as is.
+
+    Returns:
+        tuple[pa.Array, int]: (result, changed rows), the result is the input chunk if no row changed
+    """
+    if mask is None:
+        return chunk, 0
+    # more than half of the rows: transform the whole chunk (unchanged rows give the same value)
+    dense = mask.sum() * 2 > len(chunk)
+    values = chunk if dense else pc.filter(chunk, pa.array(mask))
+    result = func(values)
+    changed = pc.fill_null(pc.not_equal(result, values), False)
+    n_changed = pc.sum(changed).as_py() or 0
+    if n_changed == 0:
+        return chunk, 0
+    if dense or n_changed == len(chunk):
+        return result, n_changed
+    changed_mask = np.zeros(len(chunk), dtype=bool)
+    changed_mask[mask] = changed.to_numpy(zero_copy_only=False)
+    return pc.replace_with_mask(chunk, pa.array(changed_mask), pc.filter(result, changed)), n_changed
+
+
+def _literal_bytes(regex) -> frozenset[int] | None:
+    """
+    ASCII bytes of a regex which matches only single characters, e.g. `\\x00`, `\\t` or `\\r|\\n`.
+
+    Returns:
+        frozenset[int] | None: bytes of the characters, None if the regex is not that simple
+    """
+    if not isinstance(regex, str) or regex == "":
+        return None
+    values = set()
+    for alternative in regex.split("|"):
+        if _LITERAL_CHAR.fullmatch(alternative) is None:
+            return None
+        char = re.sub(r"\\x([0-9a-fA-F]{2})", lambda m: chr(int(m.group(1), 16)), alternative)
+        char = {"\\t": "\t", "\\r": "\r", "\\n": "\n"}.get(char, char.lstrip("\\"))
+        if len(char) != 1 or ord(char) > 127:
+            return None
+        values.add(ord(char))
+    return frozenset(values)
+
+
+def _arrow_strip(chunk: pa.Array) -> tuple[pa.Array, int]:
+    """
+    `utf8_trim_whitespace` of the rows which may start or end with a space.
+    """
+    return _replace_rows(chunk, _strip_candidates(chunk), pc.utf8_trim_whitespace)
+
+
+def _arrow_replace(chunk: pa.Array, regex, replace: str) -> tuple[pa.Array, int]:
+    """
+    Regex replace of the matched rows of a pyarrow string array.
+
+    Uses `replace_substring_regex` (RE2) like pandas does for pyarrow strings,
+    and Python `re` when the pattern or replacement is not supported by RE2.
+    A regex of single ASCII characters (e.g. `\\x00`) finds the rows by scanning the data buffer.
+    """
+    byte_values = _literal_bytes(regex)
+    mask: np.ndarray | None
+    if byte_values is not None:
+        mask = _rows_with_bytes(chunk, byte_values)
+    else:
+        pattern = _re2_pattern(regex, replace)
+        mask = None if pattern is None else _re2_match(chunk, pattern)
+        if mask is None:
+            compiled = re.compile(regex)
+            mask = np.array([v is not None and compiled.search(v) is not None for v in chunk.to_pylist()], dtype=bool)
+    return _replace_rows(chunk, mask, lambda arr: _arrow_replace_all(arr, regex, replace))
+
+
+def _re2_match(chunk: pa.Array, pattern: str) -> np.ndarray | None:
+    """
+    Rows matching the pattern by `match_substring_regex` (RE2), None if RE2 rejects the pattern.
+    """
+    try:
+        matched = pc.match_substring_regex(chunk, pattern)
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+        return None
+    return pc.fill_null(matched, False).to_numpy(zero_copy_only=False)
+
+
+def _re2_pattern(regex, replace: str) -> str | None:
+    """
+    The regex for pyarrow (RE2), None if not supported.
+    """
+    if not isinstance(regex, str) or regex == "" or r"\g<" in replace or _RE2_UNSUPPORTED.search(regex):
+        return None
+    if regex.endswith("\\Z") and (len(regex) - len(regex[:-1].rstrip("\\")) + 1) % 2 == 1:
+        # Python \Z is end of text, RE2 is \z
+        return regex[:-2] + "\\z"
+    return regex
+
+
+def _arrow_replace_all(arr: pa.Array, regex, replace: str) -> pa.Array:
+    pattern = _re2_pattern(regex, replace)
+    if pattern is not None:
+        try:
+            return pc.replace_substring_regex(arr, pattern=pattern, replacement=replace)
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+            pass
+    compiled = re.compile(regex)
+    return pa.array([None if v is None else compiled.sub(replace, v) for v in arr.to_pylist()], type=arr.type)
+
+
+def _fixchar_chain(arr: pa.Array) -> pa.Array:
+    arr = pc.utf8_trim_whitespace(arr)
+    for char, replace in FIXCHAR_REPLACE:
+        arr = pc.replace_substring(arr, char, replace)
+    return arr
+
+
+def _arrow_fixchar(chunk: pa.Array) -> tuple[pa.Array, int]:
+    """
+    Arrow kernel chain of `df_fixchar`, only the rows which may need it are rewritten.
+    """
+    mask = _strip_candidates(chunk)
+    byte_mask = _rows_with_bytes(chunk, _FIXCHAR_BYTES)
+    if mask is None:
+        mask = byte_mask
+    elif byte_mask is not None:
+        mask = mask | byte_mask
+    return _replace_rows(chunk, mask, _fixchar_chain)
+
+
+def _count_changed(before: np.ndarray, after: np.ndarray) -> int:
+    """
+    Number of changed values of Python strings (str methods return the same object if nothing changed).
+    """
+    (changed,) = np.nonzero(np.fromiter(map(operator.is_not, before, after), dtype=bool, count=len(before)))
+    # NaN / None ที่เป็นคนละ object ไม่นับว่าเปลี่ยน
+    return int(len(changed) - (pd.isna(before[changed]) & pd.isna(after[changed])).sum())
+
+
+def _series_strip(sr: Series) -> tuple[Series, int]:
+    result = sr.str.strip()
+    return result, _count_changed(sr.to_numpy(dtype=object), result.to_numpy(dtype=object))
+
+
+def _series_replace(sr: Series, regex, replace: str) -> tuple[Series, int]:
+    result = sr.str.replace(regex, replace, regex=True)
+    return result, _count_changed(sr.to_numpy(dtype=object), result.to_numpy(dtype=object))
+
+
+def _fixchar_value(value: str) -> str:
+    value = value.strip()
+    for char, replace in FIXCHAR_REPLACE:
+        value = value.replace(char, replace)
+    return value
+
+
+def _fixchar_series(sr: Series) -> tuple[Series, int]:
+    """
+    Strip and replace special characters of a Python string Series in one pass.
+
+    Same result as `df_strip`, `df_remove_char_error` and `df_replace` of `df_fixchar`
+    but each value is read and written only once.
+
+    Args:
+        sr (Series): string Series (object or `string[python]`)
+
+    Returns:
+        tuple[Series, int]: new Series with the same dtype, index and name, number of changed rows
+    """
+    before = sr.to_numpy(dtype=object)
+    if not isinstance(sr.dtype, pd.StringDtype):
+        # object column: non-string value is NaN like `.str` accessor
+        sr = sr.str.strip()
+    values = np.array(
+        [_fixchar_value(v) if isinstance(v, str) else v for v in sr.to_numpy(dtype=object)],
+        dtype=object,
+    )
+    return Series(values, index=sr.index, name=sr.name, dtype=sr.dtype), _count_changed(before, values)
+
+
+def df_fixchar(
+    df: DataFrameLike, columns: list[str] | None = None, n_jobs: int = 1, counts: dict[str, int] | None = None
+) -> DataFrameLike:
     """
     Removes special characters and replaces them with spaces or tabs in a DataFrame.
 
+    - strip spaces
+    - remove `\\x00`
+    - replace `\\r`, `\\n` with a space
+    - replace `\\t` with 4 spaces
+
+    Every column is cleaned in one pass (same result as calling `df_strip`,
+    `df_remove_char_error` and `df_replace`). pyarrow string columns are scanned first
+    and only the rows which need cleaning are rewritten.
+
     Args:
-        df (DataFrame): The input DataFrame.
+        df (DataFrame | pa.Table | pa.RecordBatch): The input DataFrame.
+        columns (list[str] | None, optional): The list of columns to clean. If None, string columns are selected by default. Defaults to None.
+        n_jobs (int, optional): Number of threads for pyarrow string columns, -1 is all CPUs. Defaults to 1.
+        counts (dict[str, int] | None, optional): If given, filled with the number of changed rows of each column. Defaults to None.
 
     Returns:
-        DataFrame: The DataFrame with special characters removed and replaced.
+        DataFrame | pa.Table | pa.RecordBatch: The DataFrame with special characters removed and replaced.
     """
-    df = df_strip(df)
-    df = df_remove_char_error(df)
-    df = df_replace(df, regex=f"{CHAR_RET}|{CHAR_NEWLINE}", replace=" ")
-    df = df_replace(df, regex=f"{CHAR_TAB}", replace="    ")
-    return df
+    return _apply_columns(df, columns, _arrow_fixchar, _fixchar_series, n_jobs=n_jobs, counts=counts)
+
+
+T = TypeVar("T")
+
+# source of the streaming cleaner: file / directory path, pyarrow dataset, Table or RecordBatch iterator
+BatchSource = str | os.PathLike | ds.Dataset | pa.Table | pa.RecordBatchReader | Iterable[pa.RecordBatch]
+
+
+def _infer_format(path: str | os.PathLike) -> Literal["parquet", "csv"]:
+    return "csv" if str(path).lower().endswith((".csv", ".csv.gz", ".tsv")) else "parquet"
+
+
+def _read_ahead(iterator: Iterator[T], size: int) -> Iterator[T]:
+    """
+    Reads the next `size` items of an iterator in a background thread.
+    """
+    if size < 1:
+        yield from iterator
+        return
+    end = object()
+    with ThreadPool(1) as pool:
+        pending = deque(pool.apply_async(next, (iterator, end)) for _ in range(size))
+        while True:
+            item = pending.popleft().get()
+            if item is end:
+                break
+            pending.append(pool.apply_async(next, (iterator, end)))
+            yield item
+
+
+def _open_batches(
+    source: BatchSource, batch_size: int, file_format: Literal["infer", "parquet", "csv"], prefetch: int
+) -> Iterator[pa.RecordBatch]:
+    if isinstance(source, (str, os.PathLike)):
+        source = ds.dataset(source, format=_infer_format(source) if file_format == "infer" else file_format)
+    if isinstance(source, ds.Dataset):
+        return source.to_batches(batch_size=batch_size, batch_readahead=max(prefetch, 1), fragment_readahead=1)
+    if isinstance(source, pa.Table):
+        return iter(source.to_batches(max_chunksize=batch_size))
+    return iter(source)
+
+
+def clean_batches(
+    source: BatchSource,
+    func: Callable[[pa.RecordBatch], pa.RecordBatch] | None = None,
+    columns: list[str] | None = None,
+    batch_size: int = STREAM_BATCH_SIZE,
+    file_format: Literal["infer", "parquet", "csv"] = "infer",
+    n_jobs: int = 1,
+    prefetch: int = 2,
+) -> Iterator[pa.RecordBatch]:
+    """
+    Cleans a source larger than memory batch by batch.
+
+    ทำความสะอาดข้อมูลทีละ batch (ไม่ต้องโหลดข้อมูลทั้งหมดเข้า memory)
+
+    The next `prefetch` batches are read in a background thread while a batch is cleaned,
+    so memory is bounded by about (`prefetch` + 1) * `batch_size` rows.
+
+    Args:
+        source (BatchSource): Parquet / CSV file or directory path, `pyarrow.dataset.Dataset`, `pa.Table` or an iterator of `pa.RecordBatch`
+        func (Callable[[pa.RecordBatch], pa.RecordBatch] | None, optional): transform of a batch. Defaults to None (`df_fixchar`).
+        columns (list[str] | None, optional): The list of columns of `df_fixchar`. If None, string columns are selected by default. Defaults to None.
+        batch_size (int, optional): Rows per batch of a path / dataset / Table source. Defaults to `STREAM_BATCH_SIZE`.
+        file_format (Literal["infer", "parquet", "csv"], optional): Format of a path source. Defaults to "infer" (by file extension).
+        n_jobs (int, optional): Number of threads of `df_fixchar`. Defaults to 1.
+        prefetch (int, optional): Number of batches read ahead. Defaults to 2.
+
+    Yields:
+        pa.RecordBatch: cleaned batch
+    """
+    batches = _open_batches(source, batch_size, file_format, prefetch)
+    for batch in _read_ahead(batches, prefetch):
+        if func is None:
+            yield df_fixchar(batch, columns=columns, n_jobs=n_jobs)
+        else:
+            yield func(batch)
+
+
+def _conform(batch: pa.RecordBatch, schema: pa.Schema) -> pa.RecordBatch:
+    """
+    Casts a batch to the schema, columns missing from the batch are null.
+
+    Raises:
+        KeyError: a column of the batch is not in the schema
+    """
+    if batch.schema == schema:
+        return batch
+    extra = set(batch.schema.names) - set(schema.names)
+    if extra:
+        raise KeyError(f"columns not in the schema: {sorted(extra)}")
+    arrays = [
+        batch.column(field.name).cast(field.type)
+        if field.name in batch.schema.names
+        else pa.nulls(batch.num_rows, field.type)
+        for field in schema
+    ]
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+class _FileWriter:
+    """
+    Writes batches to a temporary file beside `sink`, moved to `sink` by `commit()` (no partial output on error).
+
+    The schema of the file is the one of the first batch, promoted when a later batch differs
+    (a column of nulls then strings, int32 then int64, a new column): a Parquet file is rewritten
+    with the promoted schema, a CSV writer continues without a header.
+    """
+
+    def __init__(self, sink: str | os.PathLike, fmt: Literal["parquet", "csv"], schema: pa.Schema):
+        self.sink = os.fspath(sink)
+        self.fmt = fmt
+        fd, self.path = tempfile.mkstemp(prefix=".", suffix=".tmp", dir=os.path.dirname(os.path.abspath(self.sink)))
+        os.close(fd)
+        self._file: pa.NativeFile | None = None
+        self._open(schema)
+
+    def _open(self, schema: pa.Schema, header: bool = True) -> None:
+        self.schema = schema
+        self._writer: pq.ParquetWriter | pa_csv.CSVWriter
+        if self.fmt == "csv":
+            if self._file is None:
+                self._file = pa.OSFile(self.path, "wb")
+            self._writer = pa_csv.CSVWriter(self._file, schema, write_options=pa_csv.WriteOptions(include_header=header))
+        else:
+            self._writer = pq.ParquetWriter(self.path, schema)
+
+    def write_batch(self, batch: pa.RecordBatch) -> None:
+        if batch.schema != self.schema:
+            try:
+                batch = _conform(batch, self.schema)
+            except (pa.ArrowInvalid, pa.ArrowNotImplementedError, KeyError):
+                self._promote(pa.unify_schemas([self.schema, batch.schema], promote_options="permissive"))
+                batch = _conform(batch, self.schema)
+        self._writer.write_batch(batch)
+
+    def _promote(self, schema: pa.Schema) -> None:
+        self._writer.close()
+        if self.fmt == "csv":
+            if schema.names != self.schema.names:
+                raise ValueError(f"columns of a batch differ from the CSV header: {schema.names}")
+            self._open(schema, header=False)
+            return
+        # rewrite the written row groups with the promoted schema, one row group at a time
+        written = self.path + ".old"
+        os.replace(self.path, written)
+        try:
+            self._open(schema)
+            for batch in pq.ParquetFile(written).iter_batches():
+                self._writer.write_batch(_conform(batch, schema))
+        finally:
+            os.remove(written)
+
+    def close(self) -> None:
+        self._writer.close()
+        if self._file is not None:
+            self._file.close()
+
+    def commit(self) -> None:
+        self.close()
+        os.replace(self.path, self.sink)
+
+    def abort(self) -> None:
+        try:
+            self.close()
+        finally:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+
+
+def clean_file(
+    source: BatchSource,
+    sink: str | os.PathLike,
+    func: Callable[[pa.RecordBatch], pa.RecordBatch] | None = None,
+    columns: list[str] | None = None,
+    batch_size: int = STREAM_BATCH_SIZE,
+    file_format: Literal["infer", "parquet", "csv"] = "infer",
+    sink_format: Literal["infer", "parquet", "csv"] = "infer",
+    n_jobs: int = 1,
+    prefetch: int = 2,
+) -> int:
+    """
+    Cleans a source larger than memory batch by batch and writes to a Parquet / CSV file.
+
+    Reading, cleaning and writing run at the same time (reader and writer threads),
+    at most `prefetch` batches wait to be written.
+
+    The output is written to a temporary file and moved to `sink` when done, `sink` is not changed on error.
+    A batch of another schema than the first one (e.g. a column of nulls, then of strings) promotes
+    the schema of the output.
+
+    Args:
+        source (BatchSource): Parquet / CSV file or directory path, `pyarrow.dataset.Dataset`, `pa.Table` or an iterator of `pa.RecordBatch`
+        sink (str | os.PathLike): Output file path
+        func (Callable[[pa.RecordBatch], pa.RecordBatch] | None, optional): transform of a batch. Defaults to None (`df_fixchar`).
+        columns (list[str] | None, optional): The list of columns of `df_fixchar`. If None, string columns are selected by default. Defaults to None.
+        batch_size (int, optional): Rows per batch of a path / dataset / Table source. Defaults to `STREAM_BATCH_SIZE`.
+        file_format (Literal["infer", "parquet", "csv"], optional): Format of a path source. Defaults to "infer" (by file extension).
+        sink_format (Literal["infer", "parquet", "csv"], optional): Format of the output. Defaults to "infer" (by file extension).
+        n_jobs (int, optional): Number of threads of `df_fixchar`. Defaults to 1.
+        prefetch (int, optional): Number of batches read ahead and waiting to be written. Defaults to 2.
+
+    Returns:
+        int: Number of rows written, no file is written if the source is empty
+    """
+    batches = clean_batches(source, func, columns, batch_size, file_format, n_jobs, prefetch)
+    first = next(batches, None)
+    if first is None:
+        return 0
+
+    fmt = _infer_format(sink) if sink_format == "infer" else sink_format
+    writer = _FileWriter(sink, fmt, first.schema)
+
+    rows = 0
+    try:
+        with ThreadPool(1) as pool:
+            pending: deque = deque()
+            try:
+                for batch in chain([first], batches):
+                    pending.append(pool.apply_async(writer.write_batch, (batch,)))
+                    rows += batch.num_rows
+                    if len(pending) > max(prefetch, 1):
+                        pending.popleft().get()
+            finally:
+                # the writer thread is done before the file is closed or removed
+                for result in pending:
+                    result.wait()
+            for result in pending:
+                result.get()
+    except BaseException:
+        writer.abort()
+        raise
+    writer.commit()
+    return rows
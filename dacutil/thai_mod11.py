@@ -1,4 +1,9 @@
+from typing import List, Optional, Tuple, Union
+
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 from pandas import DataFrame
 
 # constants for Thai citizen ID
@@ -68,3 +73,359 @@ def verify_thaicid(cid: str) -> int:
     if len(cid) == 13:
         return CID_LENGTH13
     return CID_NONE
+
+
+# weights of digit 1 - 12 for Mod11 (13, 12, ..., 2)
+_MOD11_WEIGHTS = np.arange(13, 1, -1, dtype=np.uint16)
+# check digit (หลักที่ 13) of every possible weighted sum (max 9 * 90 = 810)
+_MOD11_CHECK_DIGIT = ((11 - np.arange(811) % 11) % 10).astype(np.uint8)
+
+CidArray = Union[pd.Series, pa.Array, pa.ChunkedArray]
+
+
+def _to_string_arrow(values: CidArray, stringify: bool = False) -> pa.ChunkedArray:
+    """
+    Converts a pandas Series / pyarrow array of citizen IDs to a string ChunkedArray.
+
+    Args:
+        values (CidArray): pandas Series (object, string or ArrowDtype), `pa.Array` or `pa.ChunkedArray`
+        stringify (bool): convert non-string values with `str()` like `verify_thaicid` does
+
+    Returns:
+        pa.ChunkedArray: string / large_string chunked array
+    """
+    arr: Union[pa.Array, pa.ChunkedArray]
+    if isinstance(values, pd.Series):
+        try:
+            arr = pa.array(values, from_pandas=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # object column with mixed types (int, float, str, ...)
+            conv = str if stringify else (lambda v: v if isinstance(v, str) else None)
+            arr = pa.array(
+                [None if v is None or (not isinstance(v, str) and pd.isna(v)) else conv(v) for v in values],
+                type=pa.string(),
+            )
+    elif isinstance(values, (pa.Array, pa.ChunkedArray)):
+        arr = values
+    else:
+        raise TypeError(f"unsupported type: {type(values).__name__}")
+
+    if isinstance(arr, pa.Array):
+        arr = pa.chunked_array([arr])
+    if pa.types.is_dictionary(arr.type):
+        arr = arr.cast(arr.type.value_type)
+    if not (pa.types.is_string(arr.type) or pa.types.is_large_string(arr.type)):
+        if stringify and not (pa.types.is_integer(arr.type) or pa.types.is_string_view(arr.type)):
+            # str() ของ float, date, ... ไม่เหมือนกับ cast ของ Arrow
+            arr = pa.chunked_array(
+                [pa.array([None if v is None else str(v) for v in c.to_pylist()], type=pa.string()) for c in arr.chunks],
+                type=pa.string(),
+            )
+        else:
+            arr = arr.cast(pa.large_string())
+    return arr
+
+
+def _mod11_ascii13(chunk: pa.Array, packed: Optional[np.ndarray] = None, block_size: int = 1 << 16) -> np.ndarray:
+    """
+    Validates Mod11 for a string array which every value is 13 ASCII characters (no null).
+
+    Builds a (n, 13) digit matrix directly from the Arrow data buffer
+    and computes the digit-weighted sum block by block (cache friendly).
+
+    Args:
+        chunk (pa.Array): string / large_string array, all values have 13 bytes
+        packed (Optional[np.ndarray]): uint64 output array, filled with the 13 digits as a number (0 if not numeric)
+        block_size (int): number of rows per block
+
+    Returns:
+        np.ndarray: bool array
+    """
+    n = len(chunk)
+    result = np.zeros(n, dtype=bool)
+    if n == 0:
+        return result
+    offset_type = np.int64 if pa.types.is_large_string(chunk.type) else np.int32
+    _, offsets_buf, data_buf = chunk.buffers()
+    offsets = np.frombuffer(offsets_buf, dtype=offset_type)[chunk.offset : chunk.offset + n + 1]
+    start = int(offsets[0])
+    matrix = np.frombuffer(data_buf, dtype=np.uint8)[start : start + n * 13].reshape(n, 13)
+
+    for begin in range(0, n, block_size):
+        # digits[i] คือตัวเลขหลักที่ i ของทุกแถวใน block (ไม่ใช่ตัวเลขจะมีค่า > 9)
+        digits = (matrix[begin : begin + block_size] - np.uint8(48)).T.copy()
+        # ตัวเลขหลักที่ 0, 1 ของบัตรประชาชน ไม่มีค่าเป็น 0
+        valid = (digits[0] - np.uint8(1) <= 8) & (digits[1] - np.uint8(1) <= 8) & (digits[12] <= 9)
+        numeric = digits[12] <= 9
+        sum_num = np.zeros(digits.shape[1], dtype=np.uint16)
+        for i in range(12):
+            numeric &= digits[i] <= 9
+            sum_num += digits[i] * _MOD11_WEIGHTS[i]
+        digit13 = _MOD11_CHECK_DIGIT[np.minimum(sum_num, len(_MOD11_CHECK_DIGIT) - 1)]
+        result[begin : begin + block_size] = valid & numeric & (digits[12] == digit13)
+
+        if packed is not None:
+            number = np.zeros(digits.shape[1], dtype=np.uint64)
+            for i in range(13):
+                number = number * np.uint64(10) + digits[i]
+            packed[begin : begin + block_size] = np.where(numeric, number, np.uint64(0))
+    return result
+
+
+def _mod11_chunk(
+    chunk: pa.Array, pack: bool = False
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, Optional[np.ndarray]]:
+    """
+    Computes Mod11 validity of one string chunk.
+
+    Args:
+        chunk (pa.Array): string / large_string array
+        pack (bool): also parse every numeric 13 digits value to uint64
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray, Optional[np.ndarray]]: (is_mod11, is_length13, is_ascii13, packed)
+    """
+    length13 = pc.fill_null(pc.equal(pc.utf8_length(chunk), 13), False)
+    ascii13 = pc.and_(length13, pc.fill_null(pc.equal(pc.binary_length(chunk), 13), False))
+
+    is_length13 = length13.to_numpy(zero_copy_only=False)
+    is_ascii13 = ascii13.to_numpy(zero_copy_only=False)
+    packed: Optional[np.ndarray] = np.zeros(len(chunk), dtype=np.uint64) if pack else None
+    if is_ascii13.all():
+        result = _mod11_ascii13(chunk, packed)
+    else:
+        result = np.zeros(len(chunk), dtype=bool)
+        packed_ascii13 = np.zeros(int(is_ascii13.sum()), dtype=np.uint64) if pack else None
+        result[is_ascii13] = _mod11_ascii13(pc.filter(chunk, ascii13), packed_ascii13)
+        if packed is not None:
+            packed[is_ascii13] = packed_ascii13
+
+    # 13 ตัวอักษรแต่ไม่ใช่ ASCII (เช่นเลขไทย) ใช้ฟังก์ชันปกติ
+    (others,) = np.nonzero(is_length13 & ~is_ascii13)
+    for i in others:
+        cid = chunk[int(i)].as_py()
+        result[i] = check_mod11(cid)
+        if packed is not None and cid.isnumeric():
+            try:
+                packed[i] = int(cid)
+            except ValueError:
+                pass
+    return result, is_length13, is_ascii13, packed
+
+
+def _wrap_result(values: CidArray, chunks: List[np.ndarray], pa_type: pa.DataType) -> CidArray:
+    if isinstance(values, pd.Series):
+        data = np.concatenate(chunks) if chunks else np.zeros(0, dtype=pa_type.to_pandas_dtype())
+        return pd.Series(data, index=values.index, name=values.name)
+    if isinstance(values, pa.ChunkedArray):
+        return pa.chunked_array([pa.array(c, type=pa_type) for c in chunks], type=pa_type)
+    return pa.array(np.concatenate(chunks), type=pa_type)
+
+
+def check_mod11_array(cids: CidArray) -> CidArray:
+    """
+    Validate Thai citizen ID is Mod11 for a whole column
+
+    เช็คเลขบัตรประชาชน 13 หลัก ตาม Mod11 ทั้งคอลัมน์
+
+    Same result as `check_mod11` on every value, null / wrong length / non-numeric is False.
+
+    Args:
+        cids (pd.Series | pa.Array | pa.ChunkedArray): Thai citizen IDs
+
+    Returns:
+        pd.Series | pa.Array | pa.ChunkedArray: boolean result, same container as input
+    """
+    arr = _to_string_arrow(cids)
+    chunks = [_mod11_chunk(chunk)[0] for chunk in arr.chunks]
+    return _wrap_result(cids, chunks, pa.bool_())
+
+
+def verify_thaicid_array(cids: CidArray) -> CidArray:
+    """
+    Determines the type of Thai citizen ID for a whole column.
+
+    Same result as `verify_thaicid` on every value.
+
+    Args:
+        cids (pd.Series | pa.Array | pa.ChunkedArray): Thai citizen IDs
+
+    Returns:
+        pd.Series | pa.Array | pa.ChunkedArray: int8 result, same container as input.
+        `CID_THAI`(9), `CID_NUMBER`(2), `CID_LENGTH13`(1) or `CID_NONE`(0)
+    """
+    arr = _to_string_arrow(cids, stringify=True)
+    chunks: List[np.ndarray] = []
+    for chunk in arr.chunks:
+        is_mod11, is_length13, is_ascii13, _ = _mod11_chunk(chunk)
+        is_number = pc.fill_null(pc.utf8_is_numeric(chunk), False).to_numpy(zero_copy_only=False)
+        result = np.where(is_length13, CID_LENGTH13, CID_NONE).astype(np.int8)
+        result[is_length13 & is_number] = CID_NUMBER
+        result[is_mod11] = CID_THAI
+        # 13 ตัวอักษรแต่ไม่ใช่ ASCII ใช้ฟังก์ชันปกติ
+        (others,) = np.nonzero(is_length13 & ~is_ascii13)
+        for i in others:
+            result[i] = verify_thaicid(chunk[int(i)].as_py())
+        chunks.append(result)
+    return _wrap_result(cids, chunks, pa.int8())
+
+
+def cid_to_uint64(cids: CidArray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Parses Thai citizen IDs to a packed `uint64` array in one pass.
+
+    แปลงเลขบัตรประชาชนเป็นตัวเลข uint64 (8 bytes ต่อแถว) สำหรับ join / dedupe
+
+    Args:
+        cids (pd.Series | pa.Array | pa.ChunkedArray): Thai citizen IDs
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (values, is_mod11)
+
+            - values: uint64 array, 0 if the value is not 13 digits
+
+            - is_mod11: bool array, same as `check_mod11_array`
+    """
+    arr = _to_string_arrow(cids)
+    values: List[np.ndarray] = []
+    masks: List[np.ndarray] = []
+    for chunk in arr.chunks:
+        is_mod11, _, _, packed = _mod11_chunk(chunk, pack=True)
+        values.append(packed)  # type: ignore
+        masks.append(is_mod11)
+    if not values:
+        return np.zeros(0, dtype=np.uint64), np.zeros(0, dtype=bool)
+    return np.concatenate(values), np.concatenate(masks)
+
+
+def uint64_to_cid(values: Union[np.ndarray, pa.Array], mask: Optional[np.ndarray] = None) -> pa.Array:
+    """
+    Converts packed `uint64` citizen IDs back to 13 characters strings.
+
+    Args:
+        values (np.ndarray | pa.Array): uint64 citizen IDs
+        mask (Optional[np.ndarray]): bool array, False will be null. Defaults to None (all valid).
+
+    Returns:
+        pa.Array: string array of 13 digits (zero padded)
+    """
+    if isinstance(values, pa.Array):
+        values = values.to_numpy(zero_copy_only=False)
+    values = np.asarray(values, dtype=np.uint64)
+    n = len(values)
+    # หลักที่ 0 - 12 ของทุกแถว แล้วแปลงเป็นตัวอักษร ASCII
+    digits = np.empty((n, 13), dtype=np.uint8)
+    number = values.copy()
+    for i in range(12, -1, -1):
+        digits[:, i] = number % np.uint64(10) + np.uint64(48)
+        number //= np.uint64(10)
+
+    offsets = np.arange(0, n * 13 + 1, 13, dtype=np.int32)
+    validity = None
+    null_count = 0
+    if mask is not None:
+        mask = np.asarray(mask, dtype=bool)
+        null_count = int(n - mask.sum())
+        if null_count:
+            validity = pa.array(mask).buffers()[1]
+    return pa.Array.from_buffers(
+        pa.string(), n, [validity, pa.py_buffer(offsets), pa.py_buffer(digits)], null_count=null_count
+    )
+
+
+def _mod11_uint64(values: np.ndarray) -> np.ndarray:
+    """
+    Validates Mod11 for packed `uint64` citizen IDs, same as `check_mod11` of the zero padded 13 digits.
+
+    Args:
+        values (np.ndarray): uint64 citizen IDs
+
+    Returns:
+        np.ndarray: bool array, False for numbers of more than 13 digits
+    """
+    return _mod11_ascii13(uint64_to_cid(values)) & (values < np.uint64(10**13))
+
+
+class CidIndex:
+    """
+    Sorted, hashed index of packed `uint64` Thai citizen IDs for fast membership, dedupe and join.
+
+    Example:
+        >>> idx = CidIndex(df_registry["cid"])
+        >>> df["found"] = idx.isin(df["cid"])
+        >>> rows = idx.get_indexer(df["cid"])  # row of df_registry, -1 if not found
+    """
+
+    __slots__ = ("keys", "rows", "_index")
+
+    def __init__(self, cids: Union[CidArray, np.ndarray], valid_only: bool = True):
+        """
+        Builds the index.
+
+        Args:
+            cids (pd.Series | pa.Array | pa.ChunkedArray | np.ndarray): Thai citizen IDs or packed uint64 array
+            valid_only (bool): index only Mod11 valid citizen IDs (packed uint64 input is checked too). Defaults to True.
+        """
+        values, valid = self._parse(cids, valid_only)
+        (positions,) = np.nonzero(valid)
+        # keys: uint64 ที่ไม่ซ้ำ เรียงจากน้อยไปมาก, rows: แถวแรกที่พบ key นั้นในข้อมูลต้นทาง
+        keys, first = np.unique(values[positions], return_index=True)
+        self.keys: np.ndarray = keys
+        self.rows: np.ndarray = positions[first].astype(np.int64)
+        # pd.Index สำหรับค้นหา (pandas สร้าง hash table ตอนเรียก get_indexer ครั้งแรก)
+        self._index: pd.Index = pd.Index(keys, dtype=np.uint64)
+
+    @staticmethod
+    def _parse(cids: Union[CidArray, np.ndarray], valid_only: bool) -> Tuple[np.ndarray, np.ndarray]:
+        if isinstance(cids, np.ndarray) and cids.dtype.kind in "iu":
+            values = cids.astype(np.uint64, copy=False)
+            return values, (_mod11_uint64(values) if valid_only else values != 0)
+        values, is_mod11 = cid_to_uint64(cids)
+        return values, (is_mod11 if valid_only else values != 0)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __contains__(self, cid) -> bool:
+        if isinstance(cid, str):
+            cid = cid_to_uint64(pa.array([cid], type=pa.string()))[0][0]
+        return bool(self.isin(np.array([cid], dtype=np.uint64))[0])
+
+    def get_indexer(self, cids: Union[CidArray, np.ndarray]) -> np.ndarray:
+        """
+        Finds the citizen IDs in the index.
+
+        Args:
+            cids (pd.Series | pa.Array | pa.ChunkedArray | np.ndarray): Thai citizen IDs or packed uint64 array
+
+        Returns:
+            np.ndarray: int64 row (of the indexed data) for each value, -1 if not found
+        """
+        values, valid = self._parse(cids, valid_only=False)
+        pos = self._index.get_indexer(values)
+        pos[~valid] = -1
+        result = np.full(len(pos), -1, dtype=np.int64)
+        found = pos >= 0
+        result[found] = self.rows[pos[found]]
+        return result
+
+    def isin(self, cids: Union[CidArray, np.ndarray]) -> np.ndarray:
+        """
+        Checks membership of the citizen IDs.
+
+        Args:
+            cids (pd.Series | pa.Array | pa.ChunkedArray | np.ndarray): Thai citizen IDs or packed uint64 array
+
+        Returns:
+            np.ndarray: bool array
+        """
+        return self.get_indexer(cids) >= 0
+
+    def to_cid(self) -> pa.Array:
+        """
+        Unique citizen IDs of the index as 13 characters strings (sorted).
+
+        Returns:
+            pa.Array: string array
+        """
+        return uint64_to_cid(self.keys)
@@ -1,5 +1,32 @@
-from multiprocessing.pool import ThreadPool
-from typing import Callable, Iterable, Mapping, Any
+import heapq
+import random
+import time
+from array import array
+from collections import deque
+from functools import partial
+from itertools import islice
+from queue import SimpleQueue
+from typing import TYPE_CHECKING, AsyncIterator, Callable, Iterable, Iterator, Literal, Mapping, Any, NamedTuple, Optional, Union
+
+if TYPE_CHECKING:
+    from multiprocessing.pool import Pool
+
+OnError = Literal["raise", "return"]
+Executor = Literal["thread", "process", "interpreter"]
+
+# target run time of a chunk with chunksize=None (auto) and the max tasks in a chunk
+CHUNK_SECONDS = 0.02
+MAX_CHUNK_SIZE = 4096
+
+
+class TaskFailure(NamedTuple):
+    """
+    A failed task of `worker_imap` / `worker_imap_unordered` / `worker_async` with `on_error="return"`.
+    """
+
+    index: int
+    kwargs: Mapping[str, Any]
+    error: BaseException
 
 
 # initialize a worker in the thread pool
@@ -17,23 +44,549 @@ def worker(
     task: Callable,
     values: Iterable[Mapping[str, Any]] = (),
     initializer=__initialize_worker,
+    executor: Executor = "thread",
+    chunksize: Optional[int] = None,
+    stats: Optional["WorkerStats"] = None,
 ) -> None:
     """
-    Executes a given task in parallel using a thread pool.
+    Executes a given task in parallel using a thread pool (or a process / interpreter pool).
+
+    `values` is consumed lazily, at most `processes * 2` tasks (chunks) are queued at a time.
 
     Args:
         processes (int): The number of worker processes in the thread pool.
         task (Callable): The task to be executed by each worker process.
         values (Iterable[Mapping[str, Any]], optional): The values to be passed as arguments to the task function. task number == len(values) Defaults to () no task.
         initializer (Callable, optional): The initializer function to be called when a worker process is created. Defaults to __initialize_worker.
+        executor (Literal["thread", "process", "interpreter"]): The pool, see `worker_imap`. Defaults to "thread".
+        chunksize (int, optional): Tasks sent to the pool at once, see `worker_imap`.
+        stats (WorkerStats, optional): Records the run time of each task, see `WorkerStats`. Defaults to None (disabled).
 
     Returns:
         None: This function does not return any value.
     """
-    # create and configure the thread pool
-    with ThreadPool(processes, initializer=initializer) as pool:
-        for kwargs in values:
-            _ = pool.apply_async(task, kwds=kwargs)
+    for _ in worker_imap_unordered(
+        processes,
+        task,
+        values,
+        initializer=initializer,
+        on_error="return",
+        executor=executor,
+        chunksize=chunksize,
+        stats=stats,
+    ):
+        pass
+
+
+class _FuturePool:
+    """
+    `concurrent.futures` executor with the `apply_async` of `multiprocessing.pool`.
+    """
+
+    def __init__(self, executor):
+        self._executor = executor
+
+    def apply_async(self, func: Callable, args=(), kwds=None, callback=None, error_callback=None) -> "_FutureResult":
+        future = self._executor.submit(func, *args, **(kwds or {}))
+        if callback is not None or error_callback is not None:
+
+            def done(future):
+                error = future.exception()
+                if error is None:
+                    if callback is not None:
+                        callback(future.result())
+                elif error_callback is not None:
+                    error_callback(error)
+
+            future.add_done_callback(done)
+        return _FutureResult(future)
+
+    def __enter__(self) -> "_FuturePool":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+
+class _FutureResult:
+    def __init__(self, future):
+        self._future = future
+
+    def get(self, timeout: Optional[float] = None) -> Any:
+        return self._future.result(timeout)
+
+
+def _create_pool(executor: Executor, processes: int, initializer: Optional[Callable]) -> Union["Pool", _FuturePool]:
+    # multiprocessing is imported on the first pool, not with `import dacutil`
+    from multiprocessing.pool import Pool, ThreadPool
+
+    if executor == "thread":
+        return ThreadPool(processes, initializer=initializer)
+    if executor == "process":
+        return Pool(processes, initializer=initializer)
+    if executor == "interpreter":
+        try:
+            from concurrent.futures import InterpreterPoolExecutor  # type: ignore[attr-defined]
+        except ImportError:
+            raise RuntimeError("executor 'interpreter' requires Python 3.14+ (concurrent.futures.InterpreterPoolExecutor)")
+        return _FuturePool(InterpreterPoolExecutor(processes, initializer=initializer))
+    raise ValueError(f"executor not support: {executor}")
+
+
+def _run_chunk(
+    task: Callable, chunk: list[Mapping[str, Any]], timed: bool = False
+) -> tuple[list[tuple[bool, Any]], float, Optional[list[tuple[float, float]]]]:
+    """
+    Runs the tasks of a chunk in the worker.
+
+    Returns:
+        tuple: (success, result or exception) of each task, the run time of the chunk
+            and (start time, run time) of each task if `timed`
+    """
+    started = time.perf_counter()
+    results: list[tuple[bool, Any]] = []
+    timings: Optional[list[tuple[float, float]]] = [] if timed else None
+    for kwargs in chunk:
+        begin = time.perf_counter() if timed else 0.0
+        try:
+            results.append((True, task(**kwargs)))
+        except Exception as error:
+            results.append((False, error))
+        if timings is not None:
+            timings.append((begin, time.perf_counter() - begin))
+    return results, time.perf_counter() - started, timings
+
+
+class _ChunkSize:
+    """
+    Chunk size of the next submit, fixed or auto from the measured run time of tasks (`CHUNK_SECONDS` per chunk).
+    """
+
+    def __init__(self, chunksize: Optional[int]):
+        self.auto = chunksize is None
+        self.size = max(1, chunksize or 1)
+        self._task_seconds: Optional[float] = None
+
+    def update(self, tasks: int, seconds: float) -> None:
+        if not self.auto or tasks == 0:
+            return
+        per_task = seconds / tasks
+        # moving average, the first chunks start with 1 task
+        self._task_seconds = per_task if self._task_seconds is None else 0.8 * self._task_seconds + 0.2 * per_task
+        self.size = int(min(MAX_CHUNK_SIZE, max(1, CHUNK_SECONDS / max(self._task_seconds, 1e-9))))
+
+
+class _Reservoir:
+    """
+    Uniform random sample of at most `size` values of a stream (reservoir sampling, algorithm R)
+    with the exact count, sum and max, the percentiles of a long run in bounded memory.
+    """
+
+    __slots__ = ("size", "values", "count", "total", "max", "_random")
+
+    def __init__(self, size: int):
+        self.size = size
+        self.values = array("d")
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._random = random.Random(0)
+
+    def append(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+        if len(self.values) < self.size:
+            self.values.append(value)
+        else:
+            j = self._random.randrange(self.count)
+            if j < self.size:
+                self.values[j] = value
+
+    def __len__(self) -> int:
+        return self.count
+
+
+class WorkerStats:
+    """
+    Opt-in instrumentation of a worker run, pass to the `stats` argument of `worker` / `worker_imap` / `worker_imap_unordered`.
+
+    Records the queue wait (submit to start), run time and success of each task.
+    `summary()` returns throughput, latency percentiles, pool utilization and the slowest tasks.
+
+    Args:
+        progress (Callable[[WorkerStats], None], optional): Called with the stats every `progress_interval` seconds
+            and at the end of the run (in the thread which consumes the results).
+        progress_interval (float): Seconds between `progress` calls. Defaults to 1.0.
+        slowest (int): Number of the slowest tasks kept. Defaults to 10.
+        samples (int): Number of run times / queue waits sampled for the percentiles (mean and max are exact).
+            Defaults to 10000.
+
+    Example:
+        >>> stats = WorkerStats(progress=lambda s: print(s.tasks, "done"))
+        >>> worker(8, task, values, stats=stats)
+        >>> stats.summary()["run_time"]["p95"]
+    """
+
+    def __init__(
+        self,
+        progress: Optional[Callable[["WorkerStats"], None]] = None,
+        progress_interval: float = 1.0,
+        slowest: int = 10,
+        samples: int = 10_000,
+    ):
+        self.progress = progress
+        self.progress_interval = progress_interval
+        self.processes = 0
+        self.tasks = 0
+        self.failed = 0
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+        self.run_times = _Reservoir(samples)
+        self.queue_waits = _Reservoir(samples)
+        self._slowest_size = slowest
+        self._slowest: list[tuple[float, int]] = []
+        self._last_progress = 0.0
+
+    def _start(self, processes: int) -> None:
+        self.processes = processes
+        self.started = self._last_progress = time.perf_counter()
+
+    def _record_chunk(
+        self,
+        start: int,
+        submitted: float,
+        results: list[tuple[bool, Any]],
+        timings: Optional[list[tuple[float, float]]],
+    ) -> None:
+        if timings is None:
+            # the chunk failed to dispatch
+            timings = [(time.perf_counter(), 0.0)] * len(results)
+        for i, ((success, _), (begin, seconds)) in enumerate(zip(results, timings)):
+            self.tasks += 1
+            self.failed += not success
+            self.run_times.append(seconds)
+            self.queue_waits.append(max(0.0, begin - submitted))
+            if len(self._slowest) < self._slowest_size:
+                heapq.heappush(self._slowest, (seconds, start + i))
+            elif self._slowest and seconds > self._slowest[0][0]:
+                heapq.heapreplace(self._slowest, (seconds, start + i))
+        if self.progress is not None:
+            now = time.perf_counter()
+            if now - self._last_progress >= self.progress_interval:
+                self._last_progress = now
+                self.progress(self)
+
+    def _finish(self) -> None:
+        self.finished = time.perf_counter()
+        if self.progress is not None:
+            self.progress(self)
+
+    @property
+    def elapsed(self) -> float:
+        if self.started is None:
+            return 0.0
+        return (self.finished or time.perf_counter()) - self.started
+
+    def summary(self) -> dict[str, Any]:
+        """
+        Summary of the run.
+
+        Returns:
+            dict[str, Any]: tasks, failed, elapsed (seconds), throughput (tasks / second),
+                run_time and queue_wait (mean, p50, p95, p99, max seconds, the percentiles of the sampled tasks),
+                utilization (busy time / (elapsed * processes)) and slowest [(index, seconds)]
+        """
+        import numpy as np
+
+        def percentiles(values: _Reservoir) -> dict[str, float]:
+            if not values:
+                return {"mean": 0.0, "p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+            data = np.frombuffer(values.values, dtype=np.float64)
+            p50, p95, p99 = np.percentile(data, [50, 95, 99])
+            return {"mean": values.total / values.count, "p50": float(p50), "p95": float(p95), "p99": float(p99), "max": values.max}
+
+        elapsed = self.elapsed
+        busy = self.run_times.total
+        return {
+            "tasks": self.tasks,
+            "failed": self.failed,
+            "elapsed": elapsed,
+            "throughput": self.tasks / elapsed if elapsed > 0 else 0.0,
+            "run_time": percentiles(self.run_times),
+            "queue_wait": percentiles(self.queue_waits),
+            "utilization": busy / (elapsed * self.processes) if elapsed > 0 and self.processes else 0.0,
+            "slowest": [(index, seconds) for seconds, index in sorted(self._slowest, reverse=True)],
+        }
+
+
+def _stream(
+    processes: int,
+    task: Callable,
+    values: Iterable[Mapping[str, Any]],
+    initializer: Optional[Callable],
+    max_in_flight: Optional[int],
+    executor: Executor,
+    chunksize: Optional[int],
+    ordered: bool,
+    stats: Optional[WorkerStats] = None,
+) -> Iterator[tuple[int, Mapping[str, Any], bool, Any]]:
+    """
+    Submits chunks of tasks to the pool (at most `max_in_flight` chunks at a time)
+    and yields `(index, kwargs, success, result or exception)` of each task.
+    """
+    limit = max_in_flight or processes * 2
+    size = _ChunkSize(chunksize)
+    items = enumerate(values)
+    timed = stats is not None
+
+    def next_chunk() -> Optional[tuple[int, list[Mapping[str, Any]]]]:
+        chunk = list(islice(items, size.size))
+        if not chunk:
+            return None
+        return chunk[0][0], [kwargs for _, kwargs in chunk]
+
+    def chunk_results(start: int, submitted: float, kwargs_list: list, payload, error) -> list[tuple[bool, Any]]:
+        if error is not None:
+            # the chunk itself failed (e.g. the task can not be pickled)
+            results, timings = [(False, error)] * len(kwargs_list), None
+        else:
+            results, seconds, timings = payload
+            size.update(len(results), seconds)
+        if stats is not None:
+            stats._record_chunk(start, submitted, results, timings)
+        return results
+
+    if stats is not None:
+        stats._start(processes)
+    try:
+        with _create_pool(executor, processes, initializer) as pool:
+            if ordered:
+                pending: deque = deque()
+
+                def submit_ordered() -> bool:
+                    chunk = next_chunk()
+                    if chunk is None:
+                        return False
+                    submitted = time.perf_counter() if timed else 0.0
+                    pending.append((*chunk, submitted, pool.apply_async(_run_chunk, (task, chunk[1], timed))))
+                    return True
+
+                for _ in range(limit):
+                    if not submit_ordered():
+                        break
+                while pending:
+                    start, kwargs_list, submitted, result = pending.popleft()
+                    try:
+                        payload, error = result.get(), None
+                    except Exception as exc:
+                        payload, error = None, exc
+                    results = chunk_results(start, submitted, kwargs_list, payload, error)
+                    submit_ordered()
+                    for i, (success, value) in enumerate(results):
+                        yield start + i, kwargs_list[i], success, value
+                return
+
+            done: SimpleQueue = SimpleQueue()
+            in_flight: dict[int, tuple[list[Mapping[str, Any]], float]] = {}
+
+            def submit() -> bool:
+                chunk = next_chunk()
+                if chunk is None:
+                    return False
+                start, kwargs_list = chunk
+                in_flight[start] = (kwargs_list, time.perf_counter() if timed else 0.0)
+                pool.apply_async(
+                    _run_chunk,
+                    (task, kwargs_list, timed),
+                    callback=lambda value, start=start: done.put((start, value, None)),
+                    error_callback=lambda error, start=start: done.put((start, None, error)),
+                )
+                return True
+
+            for _ in range(limit):
+                if not submit():
+                    break
+            while in_flight:
+                start, payload, error = done.get()
+                kwargs_list, submitted = in_flight.pop(start)
+                results = chunk_results(start, submitted, kwargs_list, payload, error)
+                submit()
+                for i, (success, value) in enumerate(results):
+                    yield start + i, kwargs_list[i], success, value
+    finally:
+        if stats is not None:
+            stats._finish()
+
+
+def worker_imap(
+    processes: int,
+    task: Callable,
+    values: Iterable[Mapping[str, Any]] = (),
+    initializer: Optional[Callable] = None,
+    max_in_flight: Optional[int] = None,
+    on_error: OnError = "raise",
+    executor: Executor = "thread",
+    chunksize: Optional[int] = None,
+    stats: Optional[WorkerStats] = None,
+) -> Iterator[Any]:
+    """
+    Executes a given task in parallel and yields the results in the order of `values`.
+
+    `values` is consumed lazily, at most `max_in_flight` chunks of tasks are queued or running at a time
+    (memory stays flat with a generator of millions of tasks).
+
+    Args:
+        processes (int): The number of threads / processes / interpreters in the pool.
+        task (Callable): The task to be executed, called with `**kwargs` of each value.
+            `executor="process"`: the task, kwargs and result must be picklable (a function of a module).
+        values (Iterable[Mapping[str, Any]], optional): kwargs of each task. Defaults to () no task.
+        initializer (Callable, optional): The function to be called once when a thread / process of the pool starts,
+            set up the state of the worker here (e.g. a global connection of each process).
+        max_in_flight (int, optional): Max chunks submitted and not yet yielded. Defaults to `processes * 2`.
+        on_error (Literal["raise", "return"]): A failed task
+            "raise": raises the exception of the task (default),
+            "return": yields `TaskFailure(index, kwargs, error)` in place of the result.
+        executor (Literal["thread", "process", "interpreter"]): The pool
+            "thread": `ThreadPool` for I/O-bound tasks (default),
+            "process": `multiprocessing.Pool` for CPU-bound tasks,
+            "interpreter": `concurrent.futures.InterpreterPoolExecutor` (Python 3.14+).
+        chunksize (int, optional): Tasks sent to a worker at once (amortize IPC of small tasks).
+            Defaults to None: auto from the measured run time of tasks (chunks of about `CHUNK_SECONDS`,
+            slow I/O tasks stay 1 task per chunk).
+        stats (WorkerStats, optional): Records queue wait, run time and success of each task,
+            see `WorkerStats`. Defaults to None (disabled, no per-task timing).
+
+    Yields:
+        Any: The return value of each task (or `TaskFailure`).
+
+    Example:
+        >>> for df in worker_imap(8, read_file, ({"path": p} for p in paths)):
+        ...     process(df)
+        >>> results = list(worker_imap(os.cpu_count(), check_file, values, executor="process"))
+    """
+    for index, kwargs, success, value in _stream(
+        processes, task, values, initializer, max_in_flight, executor, chunksize, ordered=True, stats=stats
+    ):
+        if not success:
+            if on_error == "raise":
+                raise value
+            value = TaskFailure(index, kwargs, value)
+        yield value
+
+
+def worker_imap_unordered(
+    processes: int,
+    task: Callable,
+    values: Iterable[Mapping[str, Any]] = (),
+    initializer: Optional[Callable] = None,
+    max_in_flight: Optional[int] = None,
+    on_error: OnError = "raise",
+    executor: Executor = "thread",
+    chunksize: Optional[int] = None,
+    stats: Optional[WorkerStats] = None,
+) -> Iterator[tuple[int, Any]]:
+    """
+    Executes a given task in parallel and yields `(index, result)` as the tasks complete.
+
+    `values` is consumed lazily, at most `max_in_flight` chunks of tasks are queued or running at a time.
+
+    Args:
+        processes (int): The number of threads / processes / interpreters in the pool.
+        task (Callable): The task to be executed, called with `**kwargs` of each value.
+        values (Iterable[Mapping[str, Any]], optional): kwargs of each task. Defaults to () no task.
+        initializer (Callable, optional): The function to be called once when a thread / process of the pool starts.
+        max_in_flight (int, optional): Max chunks submitted and not yet yielded. Defaults to `processes * 2`.
+        on_error (Literal["raise", "return"]): A failed task
+            "raise": raises the exception of the task (default),
+            "return": yields `(index, TaskFailure(index, kwargs, error))`.
+        executor (Literal["thread", "process", "interpreter"]): The pool, see `worker_imap`. Defaults to "thread".
+        chunksize (int, optional): Tasks sent to a worker at once, see `worker_imap`.
+        stats (WorkerStats, optional): Records the run time of each task, see `WorkerStats`. Defaults to None (disabled).
+
+    Yields:
+        tuple[int, Any]: The index of the task in `values` and its return value (or `TaskFailure`).
+    """
+    for index, kwargs, success, value in _stream(
+        processes, task, values, initializer, max_in_flight, executor, chunksize, ordered=False, stats=stats
+    ):
+        if not success:
+            if on_error == "raise":
+                raise value
+            value = TaskFailure(index, kwargs, value)
+        yield index, value
+
+
+async def worker_async(
+    concurrency: int,
+    task: Callable,
+    values: Iterable[Mapping[str, Any]] = (),
+    timeout: Optional[float] = None,
+    on_error: OnError = "raise",
+    threads: Optional[int] = None,
+) -> AsyncIterator[tuple[int, Any]]:
+    """
+    Executes a given task concurrently in asyncio and yields `(index, result)` as the tasks complete.
+
+    A coroutine function runs on the event loop, a sync callable runs on a thread pool of `threads` threads.
+    `values` is consumed lazily, at most `concurrency` tasks are running at a time.
+
+    Args:
+        concurrency (int): Max tasks running at a time (thousands for I/O-bound coroutines).
+        task (Callable): A coroutine function or a sync callable, called with `**kwargs` of each value.
+        values (Iterable[Mapping[str, Any]], optional): kwargs of each task. Defaults to () no task.
+        timeout (float, optional): Timeout in seconds of each task, a timed out task fails with `asyncio.TimeoutError`
+            (a sync callable is not interrupted, its thread runs until the call returns).
+        on_error (Literal["raise", "return"]): A failed task
+            "raise": raises the exception of the task and cancels the running tasks (default),
+            "return": yields `(index, TaskFailure(index, kwargs, error))`.
+        threads (int, optional): Threads of a sync callable. Defaults to `min(concurrency, 32)`.
+
+    Yields:
+        tuple[int, Any]: The index of the task in `values` and its return value (or `TaskFailure`).
+
+    Example:
+        >>> async def fetch(url: str) -> bytes: ...
+        >>> async for index, body in worker_async(500, fetch, ({"url": u} for u in urls), timeout=30):
+        ...     save(index, body)
+    """
+    import asyncio
+    import inspect
+    from concurrent.futures import ThreadPoolExecutor
+
+    loop = asyncio.get_running_loop()
+    is_coroutine = inspect.iscoroutinefunction(task)
+    executor = None if is_coroutine else ThreadPoolExecutor(threads or min(concurrency, 32))
+    done: asyncio.Queue = asyncio.Queue()
+    running: dict[asyncio.Future, tuple[int, Mapping[str, Any]]] = {}
+    items = enumerate(values)
+
+    def submit(count: int) -> None:
+        for index, kwargs in islice(items, count):
+            if is_coroutine:
+                awaitable = task(**kwargs)
+            else:
+                awaitable = loop.run_in_executor(executor, partial(task, **kwargs))
+            future = asyncio.ensure_future(asyncio.wait_for(awaitable, timeout) if timeout else awaitable)
+            running[future] = (index, kwargs)
+            future.add_done_callback(done.put_nowait)
 
-        pool.close()
-        pool.join()
+    try:
+        submit(concurrency)
+        while running:
+            future = await done.get()
+            index, kwargs = running.pop(future)
+            submit(1)
+            error = future.exception() if not future.cancelled() else asyncio.CancelledError()
+            if error is None:
+                yield index, future.result()
+            elif on_error == "raise":
+                raise error
+            else:
+                yield index, TaskFailure(index, kwargs, error)
+    finally:
+        for future in running:
+            future.cancel()
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
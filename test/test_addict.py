@@ -0,0 +1,187 @@
+import copy
+import pickle
+
+import pytest
+
+from dacutil.addict import Addict, FrozenAddict, LazyAddict, PathAccessor, SharedConfig
+
+DATA = {"a": {"b": {"c": 1}}, "items": [{"x": 1}, [{"y": 2}]], "pair": ({"z": 3},), "n": 5}
+
+
+class TestAddict:
+    def test_setitem(self):
+        config = Addict()
+        config.a.b = 1
+        config["c"] = 2
+
+        assert config == {"a": {"b": 1}, "c": 2}
+        config.freeze()
+        config.c = 3
+        with pytest.raises(KeyError):
+            config.d = 4
+
+
+class TestLazyAddict:
+    def test_wrap_on_access(self):
+        config = LazyAddict(DATA)
+
+        assert dict.__getitem__(config, "a") is DATA["a"]
+        assert config.a.b.c == 1 and config.get("a.b.c") == 1
+        assert isinstance(dict.__getitem__(config, "a"), LazyAddict)
+        assert isinstance(config["items"][0], LazyAddict) and isinstance(config["items"][1][0], LazyAddict)
+        assert config.pair[0].z == 3
+
+    def test_same_as_addict(self):
+        config = LazyAddict(DATA)
+
+        assert config == Addict(DATA) and config.to_dict() == Addict(DATA).to_dict() == DATA
+        assert all(isinstance(value, (LazyAddict, list, tuple, int)) for value in LazyAddict(DATA).values())
+        assert pickle.loads(pickle.dumps(LazyAddict(DATA))) == DATA
+        assert copy.deepcopy(LazyAddict(DATA)) == DATA
+
+    def test_source_not_modified(self):
+        config = LazyAddict(DATA)
+        config.a.b.c = 9
+        config.new.key = 1
+
+        assert DATA["a"]["b"]["c"] == 1 and config.new.key == 1
+
+    def test_freeze(self):
+        config = LazyAddict(DATA)
+        config.freeze()
+
+        with pytest.raises(KeyError):
+            config.a.b.missing
+
+
+class TestFrozenAddict:
+    def test_snapshot(self):
+        config = Addict(DATA).snapshot()
+
+        assert isinstance(config, FrozenAddict) and isinstance(config.a, FrozenAddict)
+        assert config == DATA and config.to_dict() == DATA and type(config.to_dict()["items"]) is list
+        assert hash(config) == hash(Addict(DATA).snapshot())
+        assert {config: 1}[FrozenAddict(DATA)] == 1
+        assert pickle.loads(pickle.dumps(config)) == config and copy.deepcopy(config) is config
+
+    def test_read_only(self):
+        config = Addict(DATA).snapshot()
+
+        for modify in [
+            lambda: config.__setitem__("n", 1),
+            lambda: setattr(config, "n", 1),
+            lambda: config.a.update({"b": 1}),
+            lambda: config.pop("n"),
+            lambda: config["items"].append(1),
+            lambda: config.unfreeze(),
+        ]:
+            with pytest.raises(TypeError):
+                modify()
+        with pytest.raises(KeyError):
+            config.missing
+
+    def test_thawed_copy(self):
+        config = Addict(DATA).snapshot()
+
+        for thawed in [Addict(config), LazyAddict(config)]:
+            thawed["items"].append(1)
+            thawed["items"][1].append(2)
+            thawed.a.b.c = 2
+
+            assert type(thawed["items"]) is list and thawed["items"][2] == 1 and thawed.a.b.c == 2
+        assert config == DATA
+
+    def test_dotted_path(self):
+        config = Addict({**DATA, "a.b": 7}).snapshot()
+
+        assert config.get("a.b.c") == 1 and config.get("a.b") == {"c": 1} and config.a.get("b.c") == 1
+        assert config.path_index()["a.b.c"] == 1 and "items.0" not in config.path_index()
+        with pytest.raises(KeyError):
+            config.get("a.x")
+
+    def test_path_accessor(self):
+        accessor = PathAccessor("a.b.c")
+
+        assert accessor(Addict(DATA).snapshot()) == 1
+        assert accessor(FrozenAddict({"a": {"b": {"c": 2}}})) == 2
+        assert accessor(DATA) == 1 and accessor(Addict(DATA)) == 1
+
+
+class TestMerge:
+    LAYERS = [
+        {"a": {"b": {"c": 9}}},
+        {"n": {"now": "dict"}},
+        {"items": [3]},
+        {"new": {"z": 1}, "a": {}},
+        Addict({"a": {"b": {"f": [1, {"g": 2}]}}}),
+        {"a": 5},
+        {"a": {"b": 2}},
+    ]
+
+    def test_same_as_addict_merge(self):
+        for start in range(len(self.LAYERS)):
+            layers = self.LAYERS[start:]
+            expected = Addict(DATA)
+            for layer in layers:
+                expected = expected | layer
+
+            merged = Addict(DATA).snapshot().merge(*layers)
+
+            assert merged.to_dict() == expected.to_dict()
+            assert list(merged.to_dict()) == list(expected.to_dict())
+
+    def test_structural_sharing(self):
+        base = Addict({**DATA, "other": {"x": {"y": 1}}}).snapshot()
+
+        merged = base | {"a": {"b": {"c": 9}}}
+
+        assert isinstance(merged, FrozenAddict) and merged.a.b.c == 9 and base.a.b.c == 1
+        assert merged.other is base.other and merged["items"] is base["items"]
+        assert base.merge({"a": {"b": {}}}) is base
+
+
+def _shared_get(shared: SharedConfig, path: str):
+    return shared.config.get(path)
+
+
+class TestPickle:
+    def test_roundtrip(self):
+        for config in [Addict(DATA), LazyAddict(DATA), Addict(DATA).snapshot()]:
+            loaded = pickle.loads(pickle.dumps(config))
+
+            assert type(loaded) is type(config) and loaded == DATA
+            assert type(loaded.a.b) is type(config) and type(loaded["items"][1][0]) is type(config)
+
+    def test_frozen_and_copy(self):
+        config = Addict(DATA)
+        config.freeze()
+        with pytest.raises(KeyError):
+            pickle.loads(pickle.dumps(config)).missing
+
+        shallow = copy.copy(Addict(DATA))
+        shallow.n = 6
+        assert shallow.new == {} and copy.copy(config).a is config.a
+
+    def test_shared_config(self):
+        from concurrent.futures import ProcessPoolExecutor
+
+        with Addict(DATA).snapshot().share() as shared:
+            assert len(pickle.dumps(shared)) < 200
+            assert shared.config.get("a.b.c") == 1
+            with ProcessPoolExecutor(2) as pool:
+                assert list(pool.map(_shared_get, [shared] * 4, ["a.b.c"] * 4)) == [1] * 4
+
+    def test_shared_snapshots_evicted(self):
+        from dacutil import addict
+
+        handles = [Addict({"n": i}).snapshot().share() for i in range(addict._SHARED_SNAPSHOTS_MAXSIZE + 4)]
+        try:
+            assert len(addict._shared_snapshots) == addict._SHARED_SNAPSHOTS_MAXSIZE
+            assert handles[0].name not in addict._shared_snapshots
+            # loaded again from the shared memory by a new handle (as unpickled in a worker)
+            assert pickle.loads(pickle.dumps(handles[0])).config.n == 0
+            assert [h.config.n for h in handles] == list(range(len(handles)))
+        finally:
+            for h in handles:
+                h.unlink()
+        assert not addict._shared_snapshots
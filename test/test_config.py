@@ -1,11 +1,17 @@
 # Generated by CodiumAI
 
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
 import pytest
+from cryptography.fernet import Fernet, InvalidToken
 
 from dacutil import (
     Addict,
     get_config,
 )
+from dacutil.config import ConfigDiskCache, ConfigWatcher, ErrConfigNotFound, config_cache, get_configs
 from dacutil import crypt
 
 
@@ -77,3 +83,224 @@ class TestGetConfig:
             # Assert
             assert isinstance(config, Addict)
             assert config == expected_config
+
+
+class _ConfigHandler(BaseHTTPRequestHandler):
+    body = b'{"section": {"key": "value"}}'
+    requests: list = []
+
+    def do_GET(self):
+        _ConfigHandler.requests.append(self.headers.get("If-None-Match"))
+        if self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("ETag", '"v1"')
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def config_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ConfigHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    _ConfigHandler.requests = []
+    yield f"http://127.0.0.1:{server.server_address[1]}/config.json"
+    server.shutdown()
+
+
+class TestConfigCache:
+    def setup_method(self):
+        config_cache.clear()
+
+    def test_file_mtime(self, tmp_path):
+        filepath = tmp_path / "config.json"
+        filepath.write_text('{"a": 1}')
+
+        first = get_config(str(filepath), cache=True)
+        second = get_config(str(filepath), cache=True)
+        filepath.write_text('{"a": 22}')
+        third = get_config(str(filepath), cache=True)
+
+        assert first is second and third.a == 22
+        assert config_cache.info()["hits"] == 1 and config_cache.info()["misses"] == 2
+
+    def test_url_conditional_get(self, config_server):
+        first = get_config(config_server, cache=True)
+        fresh = get_config(config_server, cache=True)
+        revalidated = get_config(config_server, cache=True, cache_ttl=0)
+
+        assert first is fresh is revalidated
+        assert _ConfigHandler.requests == [None, '"v1"']
+        assert config_cache.info()["revalidated"] == 1
+
+    def test_shared_entry_read_only(self, tmp_path):
+        filepath = tmp_path / "config.json"
+        filepath.write_text('{"a": {"b": 1}}')
+
+        first = get_config(str(filepath), cache=True, headers={"Authorization": "Bearer token"})
+
+        with pytest.raises(TypeError):
+            first.a.b = 2
+        assert get_config(str(filepath), cache=True, headers={"Authorization": "Bearer token"}).a.b == 1
+        # the headers are digested as the secrets
+        assert "Bearer token" not in repr(list(config_cache._entries))
+
+
+class _FakeResponse:
+    def __init__(self, status_code: int, text: str = ""):
+        self.status_code = status_code
+        self.text = text
+        self.headers: dict = {}
+
+
+class _FakeTransport:
+    def __init__(self):
+        self.urls: list[str] = []
+
+    def get(self, url, **kwargs):
+        self.urls.append(url)
+        if url.endswith("missing.json"):
+            return _FakeResponse(404)
+        return _FakeResponse(200, '{"url": "%s"}' % url)
+
+
+class TestGetConfigs:
+    def test_bulk_with_transport(self):
+        transport = _FakeTransport()
+        uris = [f"http://config.local/{i}.json" for i in range(20)] + ["http://config.local/missing.json"]
+
+        configs = get_configs(uris, max_workers=4, on_error="return", transport=transport)
+
+        assert list(configs) == uris
+        assert configs[uris[3]].url == uris[3]
+        assert configs[uris[-1]] is ErrConfigNotFound
+        assert sorted(transport.urls) == sorted(uris)
+
+    def test_bulk_pooled_session(self, config_server):
+        configs = get_configs({config_server: {"file_type": "json"}, "test/tmp/config.ini": {}})
+
+        assert all(config == Addict({"section": {"key": "value"}}) for config in configs.values())
+
+
+class TestConfigWatcher:
+    def test_file_reload(self, tmp_path):
+        filepath = tmp_path / "config.json"
+        filepath.write_text('{"a": 1}')
+        changes = []
+        watcher = ConfigWatcher(str(filepath), on_change=lambda new, old: changes.append((new.a, old.a)))
+        first = watcher.config
+
+        assert watcher.check() is False
+        filepath.write_text('{"a": 22}')
+        assert watcher.check() is True
+
+        assert first.a == 1 and watcher.config.a == 22 and watcher.version == 2
+        assert changes == [(22, 1)]
+        with pytest.raises(TypeError):
+            watcher.config["b"] = 1
+        with pytest.raises(TypeError):
+            watcher.config.a = 5
+        assert watcher.config.a == 22
+
+    def test_snapshot_read_only(self, tmp_path):
+        filepath = tmp_path / "config.json"
+        filepath.write_text('{"db": {"port": 5432}, "hosts": ["a"]}')
+        watcher = ConfigWatcher(str(filepath))
+
+        for mutate in [
+            lambda c: setattr(c.db, "port", 1),
+            lambda c: c.db.update(port=1),
+            lambda c: c.hosts.append("b"),
+            lambda c: c.pop("db"),
+        ]:
+            with pytest.raises(TypeError):
+                mutate(watcher.config)
+        assert watcher.config.to_dict() == {"db": {"port": 5432}, "hosts": ["a"]}
+
+    def test_same_content_and_error(self, tmp_path):
+        filepath = tmp_path / "config.json"
+        filepath.write_text('{"a": 1}')
+        errors = []
+        watcher = ConfigWatcher(str(filepath), on_error=errors.append)
+        config = watcher.config
+
+        os.utime(filepath, ns=(0, 0))
+        assert watcher.check() is False and watcher.config is config
+        filepath.write_text('{"a": ')
+        assert watcher.check() is False and watcher.config is config
+        assert len(errors) == 1 and watcher.error is errors[0]
+
+    def test_url_conditional_get(self, config_server):
+        watcher = ConfigWatcher(config_server)
+
+        assert watcher.check() is False
+        assert watcher.config.section.key == "value"
+        assert _ConfigHandler.requests == [None, '"v1"']
+
+    def test_background_thread(self, tmp_path):
+        filepath = tmp_path / "config.json"
+        filepath.write_text('{"a": 1}')
+        changed = threading.Event()
+
+        with ConfigWatcher(str(filepath), interval=0.01, on_change=lambda new, old: changed.set()) as watcher:
+            filepath.write_text('{"a": 22}')
+            assert changed.wait(5)
+            assert watcher.config.a == 22
+
+
+class TestConfigDiskCache:
+    def test_warm_load_skips_decryption(self, tmp_path, monkeypatch):
+        filepath = tmp_path / "config.yaml.age"
+        pub, pri = crypt.age_genkey()
+        filepath.write_text(crypt.age_encrypt("secret:\n  password: s3cr3t\n", pub))
+        disk_cache = ConfigDiskCache(str(tmp_path / "cache"), key=crypt.gen_key())
+
+        cold = get_config(str(filepath), age_key=pri, disk_cache=disk_cache)
+        monkeypatch.setattr(crypt, "age_decrypt", lambda *args: pytest.fail("decrypted on a warm load"))
+        warm = get_config(str(filepath), age_key=pri, disk_cache=disk_cache)
+
+        assert cold == warm == Addict({"secret": {"password": "s3cr3t"}})
+        entries = list((tmp_path / "cache").iterdir())
+        assert len(entries) == 1 and b"s3cr3t" not in entries[0].read_bytes()
+
+    def test_key(self, tmp_path, monkeypatch):
+        filepath = tmp_path / "config.json"
+        filepath.write_text('{"a": 1}')
+        get_config(str(filepath), disk_cache=ConfigDiskCache(str(tmp_path), key=crypt.gen_key()))
+
+        # an entry of another key is a miss
+        other = ConfigDiskCache(str(tmp_path), key=crypt.gen_key())
+        assert other.load('{"a": 1}', "json") is None
+        # the entry is encrypted with a subkey, not with the key of the cache itself
+        key = crypt.gen_key()
+        ConfigDiskCache(str(tmp_path / "sub"), key=key).store('{"a": 1}', "json", {"a": 1})
+        (entry,) = (tmp_path / "sub").iterdir()
+        with pytest.raises(InvalidToken):
+            Fernet(key).decrypt(entry.read_bytes())
+        monkeypatch.delenv("DACUTIL_CONFIG_CACHE_KEY", raising=False)
+        with pytest.raises(ValueError):
+            ConfigDiskCache(str(tmp_path))
+
+    def test_entry_of_the_secret(self, tmp_path):
+        filepath = tmp_path / "config.json.age"
+        passphrase = crypt.gen_key()
+        filepath.write_text(crypt.encrypt_b64('{"a": "secret"}', passphrase))
+        disk_cache = ConfigDiskCache(str(tmp_path / "cache"), key=crypt.gen_key())
+
+        # a keyless call (the raw ciphertext) does not poison the entry of the passphrase
+        raw = get_config(str(filepath), file_type="raw", disk_cache=disk_cache)
+        assert get_config(str(filepath), passphrase=passphrase, disk_cache=disk_cache) == {"a": "secret"}
+        assert get_config(str(filepath), file_type="raw", disk_cache=disk_cache) == raw
+
+        # a warm entry is not returned to a wrong key or to a call without a key
+        with pytest.raises(Exception):
+            get_config(str(filepath), passphrase=crypt.gen_key(), disk_cache=disk_cache)
+        with pytest.raises(Exception):
+            get_config(str(filepath), disk_cache=disk_cache)
@@ -0,0 +1,142 @@
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from dacutil import datediff, datediff_units, age_band, parse_thai_date
+
+_birth = ["1990-05-15", None, "2000-02-29"]
+
+
+class TestDateDiff:
+    @pytest.mark.parametrize(
+        "values",
+        [
+            pd.Series(pd.to_datetime(_birth)),
+            pd.Series(pd.to_datetime(_birth)).astype(pd.ArrowDtype(pa.timestamp("ms"))),
+            pa.chunked_array([pa.array(pd.to_datetime(_birth[:1])), pa.array(pd.to_datetime(_birth[1:]))]),
+            np.array(_birth, dtype="datetime64[D]"),
+        ],
+    )
+    def test_input_types(self, values):
+        result = datediff(values, date(2024, 3, 1), "Y")
+
+        assert result.tolist()[0] == 34
+        assert pd.isna(result.tolist()[1])
+        assert result.tolist()[2] == 24
+
+    def test_string_series(self):
+        assert datediff(pd.Series(["2000-01-01"]), pd.Series(["2024-01-01"]), "Y").tolist() == [24]
+        assert datediff(pd.Series(["2000-01-01", None], dtype=object), date(2024, 1, 1), "Y").isna().tolist() == [False, True]
+
+    def test_keep_unit_and_output(self):
+        start = pa.array([0, 86_400], type=pa.timestamp("s"))
+        ended = pa.array([86_400_000, 86_400_000], type=pa.timestamp("ms"))
+
+        assert datediff(start, ended, "D", output="arrow").to_pylist() == [1, 0]
+        assert datediff(start, ended, "h", output="numpy").tolist() == [24, 0]
+        assert datediff(start, date(1970, 1, 15), "W", output="arrow").to_pylist() == [2, 2]
+
+    def test_months(self):
+        result = datediff(pa.array([date(2023, 12, 31)]), date(2024, 3, 1), "M", output="arrow")
+
+        assert result.to_pylist() == [3]
+
+
+class TestDateDiffUnits:
+    def test_units_same_as_datediff(self):
+        start = pd.Series(pd.to_datetime(_birth))
+
+        result = datediff_units(start, date(2024, 3, 1), ["Y", "M", "D"])
+
+        assert result.columns.tolist() == ["Y", "M", "D"]
+        for unit in ["Y", "M", "D"]:
+            assert result[unit].equals(datediff(start, date(2024, 3, 1), unit))
+
+    def test_struct_output(self):
+        start = pa.chunked_array([pa.array([date(2020, 1, 31)]), pa.array([date(2023, 12, 1)])])
+
+        result = datediff_units(start, date(2024, 3, 1), ["Y", "M"], output="arrow")
+
+        assert result.type == pa.struct([("Y", pa.int64()), ("M", pa.int64())])
+        assert result.to_pylist() == [{"Y": 4, "M": 50}, {"Y": 1, "M": 3}]
+
+    def test_unknown_unit(self):
+        with pytest.raises(ValueError):
+            datediff_units(pa.array([date(2020, 1, 1)]), date(2024, 1, 1), ["Y", "X"])
+
+
+class TestAgeBand:
+    _start = pa.array([date(2020, 1, 1), None, date(1960, 1, 1), date(2010, 6, 1), date(2025, 1, 1)])
+
+    def test_default_labels(self):
+        result = age_band(self._start, date(2024, 3, 1))
+
+        assert result.dtype == pd.CategoricalDtype(["0-14", "15-59", "60+"], ordered=True)
+        assert result.astype(object).where(result.notna(), None).tolist() == ["0-14", None, "60+", "0-14", None]
+
+    def test_arrow_output_same_as_cut(self):
+        ages = datediff(self._start, date(2024, 3, 1), output="numpy")
+        expected = pd.cut(ages, [0, 5, 14, np.inf], right=False, labels=["a", "b", "c"])
+
+        result = age_band(self._start, date(2024, 3, 1), [0, 5, 14], labels=["a", "b", "c"], output="arrow")
+
+        assert pa.types.is_dictionary(result.type)
+        assert result.to_pylist() == [None if pd.isna(v) else v for v in expected]
+
+    def test_invalid_edges(self):
+        with pytest.raises(ValueError):
+            age_band(self._start, date(2024, 3, 1), [10, 5])
+
+    def test_keep_series_index(self):
+        start = pd.Series(pd.to_datetime(["2000-01-01", "1950-06-01"]), index=["a", "b"])
+
+        assert age_band(start, date(2024, 3, 1)).index.tolist() == ["a", "b"]
+        assert datediff_units(start, date(2024, 3, 1), ["Y"]).index.tolist() == ["a", "b"]
+        assert datediff_units(start, date(2024, 3, 1), ["Y"])["Y"].tolist() == [24, 74]
+        # one rule for the three functions, the results align with the frame of the input
+        assert datediff(start, date(2024, 3, 1)).index.tolist() == ["a", "b"]
+        assert datediff(start, date(2024, 3, 1)).equals(datediff_units(start, date(2024, 3, 1), ["Y"])["Y"])
+
+
+class TestParseThaiDate:
+    @pytest.mark.parametrize(
+        "values",
+        [
+            ["25670315", "25670229", "25660229", None, "2567031x"],
+            ["15/03/2567", "29/02/2567", "29/02/2566", None, "15/13/2567"],
+            ["15-3-2567", " 29.02.2567", "29/2/2566", None, ""],
+            ["2567-03-15", "2567-02-29", "2566-02-29", None, "2567-00-01"],
+            ["15 มีนาคม 2567", "29 ก.พ. 67", "29 กุมภาพันธ์ พ.ศ. 2566", None, "15 มีนา 2567"],
+        ],
+    )
+    def test_formats(self, values):
+        result = parse_thai_date(pa.array(values))
+
+        assert result.type == pa.date32()
+        assert result.to_pylist() == [date(2024, 3, 15), date(2024, 2, 29), None, None, None]
+
+    def test_chunks_and_datediff(self):
+        values = pa.chunked_array([["25300101", None], ["15 มีนาคม 2530"]])
+
+        result = parse_thai_date(values, pa_type=pa.timestamp("s"))
+
+        assert isinstance(result, pa.ChunkedArray)
+        assert datediff(result, date(2024, 3, 1), output="arrow").to_pylist() == [37, None, 37]
+
+    def test_pandas(self):
+        sr = pd.Series([25670315, 25430101], index=[10, 20])
+
+        result = parse_thai_date(sr, date_format="YYYYMMDD", output="pandas")
+
+        assert result.index.tolist() == [10, 20]
+        assert result.tolist() == [date(2024, 3, 15), date(2000, 1, 1)]
+
+    def test_two_digit_year_not_in_future(self):
+        this_year = date.today().year + 543
+
+        result = parse_thai_date(pa.array(["1 ม.ค. 99", f"1 ม.ค. {this_year % 100:02d}", f"1 ม.ค. {(this_year + 1) % 100:02d}"]))
+
+        assert result.to_pylist() == [date(1956, 1, 1), date(this_year - 543, 1, 1), date(this_year - 642, 1, 1)]
@@ -0,0 +1,26 @@
+import subprocess
+import sys
+
+import dacutil
+
+HEAVY = ["pandas", "pyarrow", "numpy", "requests", "configobj", "yaml", "cryptography", "pyrage", "Crypto"]
+
+
+def _imported_after(statement: str) -> list[str]:
+    code = f"import sys; {statement}; print(','.join(m for m in {HEAVY!r} if m in sys.modules))"
+    out = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout
+    return [m for m in out.strip().split(",") if m]
+
+
+def test_import_is_lazy():
+    assert _imported_after("import dacutil") == []
+    assert _imported_after("from dacutil import get_config, Addict, worker") == []
+    assert _imported_after("from dacutil import df_strip") == ["pandas", "pyarrow", "numpy"]
+
+
+def test_public_names():
+    for name in dacutil.__all__:
+        assert getattr(dacutil, name) is not None
+    assert set(dacutil.__all__) <= set(dir(dacutil))
+    assert callable(dacutil.worker)
+    assert dacutil.crypt.__name__ == "dacutil.crypt"
@@ -0,0 +1,62 @@
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from dacutil import df_fixchar, check_mod11_array, parallel_apply
+
+
+def _cid_valid(df: pd.DataFrame) -> pd.Series:
+    return check_mod11_array(df["cid"])
+
+
+def _length(df) -> int:
+    return len(df)
+
+
+_df = pd.DataFrame(
+    {
+        "a": pd.Series([" a\t", "b", None, "c\n "] * 25, dtype="str"),
+        "cid": pd.Series(["1101700207366", "1101700207365"] * 50, dtype="str"),
+        "x": range(100),
+    },
+    index=range(100, 300, 2),
+)
+
+
+class TestParallelApply:
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    def test_dataframe(self, executor):
+        result = parallel_apply(_df, df_fixchar, n_jobs=2, executor=executor, partitions=3)
+
+        pd.testing.assert_frame_equal(result, df_fixchar(_df.copy()))
+
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    def test_series_and_objects(self, executor):
+        valid = parallel_apply(_df, _cid_valid, n_jobs=2, executor=executor, partitions=4)
+
+        pd.testing.assert_series_equal(valid, _cid_valid(_df))
+        assert parallel_apply(_df, _length, n_jobs=2, executor=executor, partitions=4) == [25] * 4
+
+    def test_table_process(self):
+        table = pa.Table.from_pandas(_df, preserve_index=False)
+
+        result = parallel_apply(table, df_fixchar, n_jobs=2, executor="process", partitions=3, func_kwargs={"columns": ["a"]})
+
+        assert result.equals(df_fixchar(table, columns=["a"]))
+
+    def test_uneven_partitions(self):
+        table = pa.Table.from_pandas(_df, preserve_index=False)
+        # 7 partitions of 15 rows and a last one of 10, the source chunks do not follow the partitions
+        chunked = pa.concat_tables([table.slice(0, 33), table.slice(33)])
+
+        assert parallel_apply(chunked, _length, n_jobs=2, executor="process", partitions=7) == [15] * 6 + [10]
+
+    def test_single_job_on_a_slice(self):
+        df = _df.copy()
+
+        def reset_x(part: pd.DataFrame) -> pd.DataFrame:
+            part["x"] = 0
+            return part
+
+        assert (parallel_apply(df, reset_x, n_jobs=1)["x"] == 0).all()
+        pd.testing.assert_frame_equal(df, _df)
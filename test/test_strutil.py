@@ -0,0 +1,254 @@
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+import pytest
+
+from dacutil import df_fixchar, df_strip, df_remove_char_error, df_replace, clean_batches, clean_file
+from dacutil import strutil
+from dacutil.strutil import CHAR_RET, CHAR_NEWLINE, CHAR_TAB
+
+
+_values: list = [" hello world ", "ab\tc", "x\r\ny\x00", None, "  พี่ ", "\x00 a", "", " \t\n "]
+
+
+def fixchar_by_steps(df: pd.DataFrame) -> pd.DataFrame:
+    df = df_strip(df)
+    df = df_remove_char_error(df)
+    df = df_replace(df, regex=f"{CHAR_RET}|{CHAR_NEWLINE}", replace=" ")
+    df = df_replace(df, regex=f"{CHAR_TAB}", replace="    ")
+    return df
+
+
+class TestFixChar:
+    @pytest.mark.parametrize("dtype", ["string", pd.StringDtype("python"), pd.ArrowDtype(pa.string())])
+    def test_same_as_steps(self, dtype):
+        # Arrange
+        df = pd.DataFrame({"a": pd.Series(_values, dtype=dtype), "n": range(len(_values))})
+        expected = fixchar_by_steps(df.copy())
+
+        # Act
+        result = df_fixchar(df.copy())
+
+        # Assert
+        pd.testing.assert_frame_equal(result, expected)
+        assert result["a"].tolist()[:3] == ["hello world", "ab    c", "x  y"]
+
+    def test_duplicate_column_names_skipped(self):
+        df = pd.DataFrame([[" a", " b", " c"]], columns=["x", "x", "y"])
+
+        result = df_fixchar(df.copy())
+
+        assert result.columns.tolist() == ["x", "x", "y"]
+        assert result.iloc[0].tolist() == [" a", " b", "c"]
+        assert df_strip(df.copy())["y"].tolist() == ["c"]
+        assert df_replace(df.copy(), "c", "d")["y"].tolist() == [" d"]
+
+
+class TestArrowBackend:
+    def test_table_same_as_pandas(self):
+        # Arrange
+        table = pa.table({"a": pa.array(_values, type=pa.string()), "n": range(len(_values))})
+        df = table.to_pandas(types_mapper=pd.ArrowDtype)
+
+        # Act
+        result = df_fixchar(table)
+        expected = fixchar_by_steps(df)
+
+        # Assert
+        assert isinstance(result, pa.Table)
+        assert result.schema == table.schema
+        assert result.column("a").to_pylist() == pa.array(expected["a"]).to_pylist()
+
+    def test_record_batch(self):
+        batch = pa.record_batch({"a": pa.array([" a ", None, "b\x00"])})
+
+        assert isinstance(df_strip(batch), pa.RecordBatch)
+        assert df_strip(batch).column(0).to_pylist() == ["a", None, "b\x00"]
+        assert df_remove_char_error(batch).column(0).to_pylist() == [" a ", None, "b"]
+
+    def test_replace_fallback_regex(self):
+        # lookahead is not supported by pyarrow (RE2)
+        df = pd.DataFrame({"a": pd.Series(["ab", "ac", None], dtype=pd.ArrowDtype(pa.string()))})
+
+        result = df_replace(df, r"a(?=b)", "_")
+
+        assert result["a"].dtype == pd.ArrowDtype(pa.string())
+        assert pa.array(result["a"]).to_pylist() == ["_b", "ac", None]
+
+    def test_replace_pattern_rejected_by_re2(self):
+        # atomic group: Python `re` only, RE2 rejects it at compile time
+        table = pa.table({"a": ["aab", "b", None]})
+
+        assert df_replace(table, r"(?>a+)b", "_").column("a").to_pylist() == ["_", "b", None]
+
+    def test_table_non_string_column_skipped(self):
+        table = pa.table({"n": [1, 2], "a": [" x", "y"]})
+        counts: dict[str, int] = {}
+
+        result = df_fixchar(table, columns=["n", "a"], counts=counts)
+
+        assert result.column("n").to_pylist() == [1, 2]
+        assert result.column("a").to_pylist() == ["x", "y"]
+        assert counts == {"a": 1}
+
+
+class TestParallel:
+    def test_n_jobs_same_result(self, monkeypatch):
+        # split every column in many row chunks
+        monkeypatch.setattr(strutil, "PARALLEL_CHUNK_SIZE", 3)
+        table = pa.table({"a": pa.array(_values * 5, type=pa.string()), "b": pa.array(_values[::-1] * 5)})
+        df = table.to_pandas(types_mapper=pd.ArrowDtype)
+
+        result = df_fixchar(table, n_jobs=4)
+        result_df = df_fixchar(df.copy(), n_jobs=4)
+
+        assert result.equals(df_fixchar(table))
+        pd.testing.assert_frame_equal(result_df, df_fixchar(df.copy()))
+
+
+class TestStreaming:
+    def test_clean_file(self, tmp_path):
+        # Arrange
+        table = pa.table({"a": pa.array(_values * 10, type=pa.string()), "n": range(len(_values) * 10)})
+        source = str(tmp_path / "source.parquet")
+        pq.write_table(table, source, row_group_size=7)
+
+        # Act
+        rows = clean_file(source, str(tmp_path / "clean.parquet"), batch_size=5)
+        clean_file(source, str(tmp_path / "clean.csv"), batch_size=5)
+
+        # Assert
+        assert rows == table.num_rows
+        assert pq.read_table(tmp_path / "clean.parquet").equals(df_fixchar(table))
+        assert pa_csv.read_csv(tmp_path / "clean.csv").num_rows == table.num_rows
+
+    def test_clean_batches(self):
+        batches = [pa.record_batch({"a": pa.array([" a\t", None])}), pa.record_batch({"a": pa.array(["b\r\n "])})]
+
+        result = list(clean_batches(iter(batches)))
+        upper = list(clean_batches(iter(batches), func=lambda b: df_replace(b, "a", "A")))
+
+        assert [b.column(0).to_pylist() for b in result] == [["a", None], ["b"]]
+        assert upper[0].column(0).to_pylist() == [" A\t", None]
+
+    @pytest.mark.parametrize("name", ["clean.parquet", "clean.csv"])
+    def test_clean_file_schema_drift(self, tmp_path, name):
+        batches = [
+            pa.record_batch({"a": pa.nulls(2), "n": pa.array([1, 2], pa.int32())}),
+            pa.record_batch({"a": pa.array([" x", "y\t"]), "n": pa.array([3, 4], pa.int64())}),
+        ]
+
+        rows = clean_file(iter(batches), str(tmp_path / name))
+
+        assert rows == 4
+        if name.endswith(".parquet"):
+            result = pq.read_table(tmp_path / name)
+            assert result.schema == pa.schema([("a", pa.string()), ("n", pa.int64())])
+            assert result.column("a").to_pylist() == [None, None, "x", "y"]
+        else:
+            assert pa_csv.read_csv(tmp_path / name).column("n").to_pylist() == [1, 2, 3, 4]
+
+    def test_clean_file_no_partial_output(self, tmp_path):
+        def batches():
+            yield pa.record_batch({"a": pa.array(["x"])})
+            raise RuntimeError("source failed")
+
+        with pytest.raises(RuntimeError):
+            clean_file(batches(), str(tmp_path / "clean.parquet"), prefetch=0)
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_clean_file_bounded_memory(self, tmp_path):
+        batch_rows, n_batches = 20_000, 50
+        peak = []
+
+        def batches():
+            for i in range(n_batches):
+                peak.append(pa.total_allocated_bytes())
+                yield pa.record_batch({"a": pa.array([f" value {i}\t"] * batch_rows)})
+
+        clean_file(batches(), str(tmp_path / "clean.parquet"))
+
+        batch_bytes = pa.record_batch({"a": pa.array([" value 0\t"] * batch_rows)}).nbytes
+        # a few batches in flight, not the whole source
+        assert max(peak) - peak[0] < 10 * batch_bytes < n_batches * batch_bytes
+        assert pq.ParquetFile(tmp_path / "clean.parquet").metadata.num_rows == batch_rows * n_batches
+
+
+class TestPreScan:
+    @pytest.mark.parametrize("dtype", [pd.StringDtype("python"), pd.ArrowDtype(pa.string())])
+    def test_counts_and_keep_clean_column(self, dtype):
+        # Arrange
+        df = pd.DataFrame({"a": pd.Series(_values, dtype=dtype), "b": pd.Series(["ok"] * len(_values), dtype=dtype)})
+        clean_array = df["b"].array
+        counts: dict[str, int] = {}
+
+        # Act
+        result = df_fixchar(df, counts=counts)
+
+        # Assert
+        assert counts == {"a": 6, "b": 0}
+        assert result["b"].array is clean_array
+
+    def test_replace_only_matched_rows(self):
+        table = pa.table({"a": pa.array(["a\x00", "b", None, "c\x00\x00"] * 3)})
+        counts: dict[str, int] = {}
+
+        result = df_remove_char_error(table, counts=counts)
+
+        assert counts == {"a": 6}
+        assert result.column("a").to_pylist() == ["a", "b", None, "c"] * 3
+        # no match: the original buffers
+        unchanged = df_replace(table, "z", "y").column("a").chunk(0)
+        assert unchanged.buffers()[2].address == table.column("a").chunk(0).buffers()[2].address
+
+
+class TestCategorical:
+    def test_category_merge_cleaned_categories(self):
+        df = pd.DataFrame({"a": pd.Categorical([" a", "a", "b\t", None, " a"])})
+        counts: dict[str, int] = {}
+
+        result = df_fixchar(df, counts=counts)
+
+        assert isinstance(result["a"].dtype, pd.CategoricalDtype)
+        assert result["a"].cat.categories.tolist() == ["a", "b"]
+        assert result["a"].tolist()[:3] == ["a", "a", "b"]
+        assert pd.isna(result["a"].iloc[3])
+        assert counts == {"a": 3}
+
+    def test_dictionary_table(self):
+        table = pa.table({"a": pa.array([" x", "x", None, "y\x00"] * 2).dictionary_encode()})
+        counts: dict[str, int] = {}
+
+        result = df_fixchar(table, counts=counts, n_jobs=2)
+
+        assert result.schema == table.schema
+        assert result.column("a").to_pylist() == ["x", "x", None, "y"] * 2
+        assert result.column("a").chunk(0).dictionary.to_pylist() == ["x", "y"]
+        assert counts == {"a": 4}
+
+    def test_category_collapse_to_one(self):
+        df = pd.DataFrame({"a": pd.Categorical(["a", "b", None, "c"], categories=["c", "b", "a"], ordered=True)})
+
+        result = df_replace(df, "[ab]", "c")
+
+        assert result["a"].cat.categories.tolist() == ["c"]
+        assert result["a"].cat.ordered
+        assert result["a"].tolist()[:2] == ["c", "c"]
+        assert pd.isna(result["a"].iloc[2])
+
+    def test_non_string_category_skipped(self):
+        df = pd.DataFrame({"c": pd.Categorical([1, 2, 1])})
+
+        result = df_fixchar(df, columns=["c"])
+
+        assert result["c"].equals(df["c"])
+
+    def test_category_cleaned_to_na(self):
+        sr = pd.Series(pd.Categorical(["a", "b", "a", None], categories=pd.Index(["a", "b"], dtype=object)))
+
+        result, _ = strutil._categorical(sr, None, lambda s: (s.where(s != "a"), 1))
+
+        assert result.cat.categories.tolist() == ["b"]
+        assert result.isna().tolist() == [True, False, True, True]
@@ -0,0 +1,105 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from dacutil import (
+    check_mod11,
+    verify_thaicid,
+    check_mod11_array,
+    verify_thaicid_array,
+    cid_to_uint64,
+    uint64_to_cid,
+    CidIndex,
+)
+
+
+class TestCheckMod11Array:
+    _cids: list = [
+        "1101700207366",
+        "1101700207365",
+        "0101700207366",
+        "1001700207366",
+        "110170020736",
+        "11017002073666",
+        "110170020736a",
+        "๑๑๐๑๗๐๐๒๐๗๓๖๖",
+        "",
+        None,
+    ]
+
+    # Same result as scalar function on every value
+    def test_same_as_scalar(self):
+        # Arrange
+        sr = pd.Series(self._cids, dtype=object)
+        expected = [check_mod11(cid) for cid in self._cids]
+
+        # Act
+        result = check_mod11_array(sr)
+
+        # Assert
+        assert isinstance(result, pd.Series)
+        assert result.dtype == bool
+        assert result.tolist() == expected
+
+    def test_verify_same_as_scalar(self):
+        sr = pd.Series(self._cids + [1101700207366, float("nan")], dtype=object)
+        expected = [verify_thaicid(cid) for cid in sr]
+
+        result = verify_thaicid_array(sr)
+
+        assert result.dtype == "int8"
+        assert result.tolist() == expected
+
+    def test_arrow_input(self):
+        values = [cid if isinstance(cid, str) else None for cid in self._cids]
+        expected = [check_mod11(cid) if cid is not None else False for cid in values]
+
+        arr = pa.array(values)
+        chunked = pa.chunked_array([arr[:3], arr[3:]])
+        sr = pd.Series(values, dtype=pd.ArrowDtype(pa.string()))
+
+        assert check_mod11_array(arr).to_pylist() == expected
+        assert isinstance(check_mod11_array(chunked), pa.ChunkedArray)
+        assert check_mod11_array(chunked).to_pylist() == expected
+        assert check_mod11_array(sr).tolist() == expected
+
+
+class TestCidIndex:
+    _cids: list = ["1101700207366", "3100600012345", "0012345678901", None, "abc", "1101700207366"]
+
+    def test_cid_to_uint64_and_back(self):
+        values, is_mod11 = cid_to_uint64(pd.Series(self._cids))
+
+        assert values.dtype == "uint64"
+        assert values.tolist() == [1101700207366, 3100600012345, 12345678901, 0, 0, 1101700207366]
+        assert is_mod11.tolist() == [check_mod11(cid) if cid else False for cid in self._cids]
+        assert uint64_to_cid(values, values != 0).to_pylist() == [
+            "1101700207366",
+            "3100600012345",
+            "0012345678901",
+            None,
+            None,
+            "1101700207366",
+        ]
+
+    def test_index_lookup(self):
+        idx = CidIndex(pd.Series(self._cids))
+
+        # only valid and unique citizen ID is indexed
+        assert len(idx) == 1
+        assert idx.to_cid().to_pylist() == ["1101700207366"]
+        assert "1101700207366" in idx
+        assert "3100600012345" not in idx
+        assert idx.get_indexer(pa.array(["3100600012345", "1101700207366", None])).tolist() == [-1, 0, -1]
+        assert idx.isin(np.array([1101700207366, 5], dtype=np.uint64)).tolist() == [True, False]
+
+    def test_index_packed_input(self):
+        packed = np.array([1101700207366, 5, 5, 3100600012345, 2**64 - 1], dtype=np.uint64)
+
+        idx = CidIndex(packed)
+        everything = CidIndex(packed, valid_only=False)
+
+        assert idx.to_cid().to_pylist() == ["1101700207366"]
+        assert "0000000000005" not in idx
+        assert len(everything) == 4
+        assert "0000000000005" in everything
@@ -0,0 +1,128 @@
+import asyncio
+import time
+
+import pytest
+
+from dacutil import worker, worker_async, worker_imap, worker_imap_unordered
+from dacutil.worker import CHUNK_SECONDS, TaskFailure, WorkerStats, _ChunkSize
+
+
+def _square(x: int) -> int:
+    time.sleep((x % 3) / 1000)
+    if x == 7:
+        raise ValueError("seven")
+    return x * x
+
+
+class TestWorkerImap:
+    def test_ordered_results_and_failure(self):
+        result = list(worker_imap(4, _square, ({"x": i} for i in range(10)), on_error="return"))
+
+        assert result[:7] == [i * i for i in range(7)]
+        assert isinstance(result[7], TaskFailure) and result[7].kwargs == {"x": 7}
+        assert result[8:] == [64, 81]
+
+    def test_unordered_raise(self):
+        with pytest.raises(ValueError):
+            list(worker_imap_unordered(4, _square, ({"x": i} for i in range(10))))
+
+        result = dict(worker_imap_unordered(4, _square, ({"x": i} for i in range(7))))
+        assert result == {i: i * i for i in range(7)}
+
+    def test_lazy_input(self):
+        consumed = []
+
+        def values():
+            for i in range(1000):
+                consumed.append(i)
+                yield {"x": i}
+
+        for _ in worker_imap(2, _square, values(), max_in_flight=4, chunksize=1):
+            break
+
+        assert len(consumed) <= 5
+
+    def test_worker(self):
+        out = []
+
+        worker(4, lambda x: out.append(x), ({"x": i} for i in range(100)))
+
+        assert sorted(out) == list(range(100))
+
+
+class TestExecutor:
+    def test_process(self):
+        result = list(worker_imap(2, _square, ({"x": i} for i in range(20)), on_error="return", executor="process"))
+
+        assert result[:7] == [i * i for i in range(7)]
+        assert isinstance(result[7], TaskFailure)
+
+    def test_chunksize(self):
+        result = dict(worker_imap_unordered(2, _square, ({"x": i} for i in range(7)), executor="process", chunksize=3))
+
+        assert result == {i: i * i for i in range(7)}
+
+    def test_auto_chunk_size(self):
+        size = _ChunkSize(None)
+
+        size.update(10, 10 * 1e-5)
+
+        assert size.size == int(CHUNK_SECONDS / 1e-5)
+        size.update(1, 1.0)
+        assert size.size < int(CHUNK_SECONDS / 1e-5)
+
+
+async def _fetch(x: int) -> int:
+    await asyncio.sleep(1 if x == 3 else 0.001)
+    if x == 5:
+        raise ValueError("five")
+    return x
+
+
+class TestWorkerAsync:
+    def test_coroutine_timeout_and_failure(self):
+        async def run():
+            return [item async for item in worker_async(4, _fetch, ({"x": i} for i in range(8)), timeout=0.2, on_error="return")]
+
+        result = dict(asyncio.run(run()))
+
+        assert {i: result[i] for i in (0, 1, 2, 4, 6, 7)} == {i: i for i in (0, 1, 2, 4, 6, 7)}
+        assert isinstance(result[3].error, asyncio.TimeoutError)
+        assert isinstance(result[5].error, ValueError)
+
+    def test_sync_callable(self):
+        async def run():
+            return [item async for item in worker_async(8, _square, ({"x": i} for i in range(7)), threads=2)]
+
+        assert dict(asyncio.run(run())) == {i: i * i for i in range(7)}
+
+
+class TestWorkerStats:
+    def test_summary(self):
+        progress = []
+        stats = WorkerStats(progress=lambda s: progress.append(s.tasks), slowest=2)
+
+        worker(2, _square, ({"x": i} for i in range(20)), stats=stats)
+        summary = stats.summary()
+
+        assert summary["tasks"] == 20 and summary["failed"] == 1
+        assert summary["throughput"] > 0 and 0 < summary["utilization"] <= 1
+        assert summary["run_time"]["p50"] <= summary["run_time"]["p99"] <= summary["run_time"]["max"]
+        assert len(summary["slowest"]) == 2 and summary["slowest"][0][1] == summary["run_time"]["max"]
+        assert progress[-1] == 20
+
+    def test_process(self):
+        stats = WorkerStats()
+
+        list(worker_imap(2, _square, ({"x": i} for i in range(7)), executor="process", stats=stats))
+
+        assert stats.summary()["tasks"] == 7
+
+    def test_sampled_percentiles(self):
+        stats = WorkerStats(samples=50)
+
+        worker(2, _square, ({"x": i} for i in range(500)), stats=stats)
+        summary = stats.summary()
+
+        assert summary["tasks"] == 500 and len(stats.run_times.values) == 50 and len(stats.queue_waits.values) == 50
+        assert summary["run_time"]["p50"] <= summary["run_time"]["max"] == max(stats._slowest)[0]